@@ -38,6 +38,14 @@ logger = logging.getLogger(__name__)
 
 RESULT_FORMATS = ["BOOLEAN_ONLY", "BASIC", "COMPLETE", "SUMMARY"]
 
+# table expectations which depend on every column of a batch, rather than on the columns they name
+TABLE_COLUMN_SET_EXPECTATIONS = [
+    "expect_table_columns_to_match_ordered_list",
+    "expect_table_columns_to_match_set",
+    "expect_table_column_count_to_equal",
+    "expect_table_column_count_to_be_between",
+]
+
 EvaluationParameterIdentifier = namedtuple(
     "EvaluationParameterIdentifier",
     ["expectation_suite_name", "metric_name", "metric_kwargs_id"],
@@ -997,6 +1005,7 @@ class ExpectationConfiguration(DictDot):
                 "p",
                 "bootstrap_samples",
                 "bootstrap_sample_size",
+                "seed",
             ],
             "default_kwarg_values": {
                 "row_condition": None,
@@ -1005,6 +1014,7 @@ class ExpectationConfiguration(DictDot):
                 "p": 0.05,
                 "bootstrap_samples": None,
                 "bootstrap_sample_size": None,
+                "seed": None,
                 "result_format": "BASIC",
                 "include_config": True,
                 "catch_exceptions": False,
@@ -1018,6 +1028,7 @@ class ExpectationConfiguration(DictDot):
                 "tail_weight_holdout",
                 "internal_weight_holdout",
                 "bucketize_data",
+                "use_sketches",
             ],
             "default_kwarg_values": {
                 "row_condition": None,
@@ -1027,6 +1038,7 @@ class ExpectationConfiguration(DictDot):
                 "tail_weight_holdout": 0,
                 "internal_weight_holdout": 0,
                 "bucketize_data": True,
+                "use_sketches": False,
                 "result_format": "BASIC",
                 "include_config": True,
                 "catch_exceptions": False,
@@ -1634,6 +1646,43 @@ class ExpectationSuite:
         """Return a list of column map expectations."""
         return [e for e in self.expectations if "column" in e.kwargs]
 
+    def get_referenced_columns(self, table_columns_from_schema=False):
+        """Return the names of the columns that the expectations of this suite evaluate, in order of first reference,
+        so that a batch validated against the suite may load only those columns.
+
+        Returns None if the expectations may depend on other columns: if the suite holds table expectations on the
+        set of columns (unless table_columns_from_schema is True, for batches answering them from the schema of their
+        source), expectations with a row_condition, column names given as evaluation parameters, or expectations
+        that are neither table expectations nor name their columns with column, column_A, column_B or column_list.
+        """
+        columns = []
+        for expectation in self.expectations:
+            kwargs = expectation.kwargs
+            if kwargs.get("row_condition") or (
+                expectation.expectation_type in TABLE_COLUMN_SET_EXPECTATIONS
+                and not table_columns_from_schema
+            ):
+                return None
+            referenced_columns = [
+                kwargs[key]
+                for key in ["column", "column_A", "column_B"]
+                if key in kwargs
+            ]
+            if "column_list" in kwargs:
+                if not isinstance(kwargs["column_list"], list):
+                    return None
+                referenced_columns.extend(kwargs["column_list"])
+            if not referenced_columns and not expectation.expectation_type.startswith(
+                "expect_table_"
+            ):
+                return None
+            for column in referenced_columns:
+                if not isinstance(column, str):
+                    return None
+                if column not in columns:
+                    columns.append(column)
+        return columns
+
     @staticmethod
     def _filter_citations(citations, filter_key):
         citations_with_bk = []
@@ -290,3 +290,93 @@ class ValidationMetricIdentifier(MetricIdentifier):
             metric_name=metric_id.metric_name,
             metric_kwargs_id=metric_id.metric_kwargs_id,
         )
+
+
+class BatchMetricIdentifier(MetricIdentifier):
+    """A BatchMetricIdentifier identifies a metric computed on a batch by the fingerprint of the batch's data, so
+    that the metric can be reused for any batch with the same data."""
+
+    def __init__(self, data_fingerprint, metric_name, metric_kwargs_id):
+        super().__init__(metric_name, metric_kwargs_id)
+        self._data_fingerprint = data_fingerprint
+
+    @property
+    def data_fingerprint(self):
+        return self._data_fingerprint
+
+    def to_tuple(self):
+        return tuple(
+            [self.data_fingerprint, self.metric_name, self.metric_kwargs_id or "__"]
+        )
+
+    def to_fixed_length_tuple(self):
+        return self.to_tuple()
+
+    @classmethod
+    def from_tuple(cls, tuple_):
+        if len(tuple_) != 3:
+            raise GreatExpectationsError(
+                "BatchMetricIdentifier tuple must have exactly three components."
+            )
+        metric_id = MetricIdentifier.from_tuple(tuple_[1:])
+        return cls(
+            data_fingerprint=tuple_[0],
+            metric_name=metric_id.metric_name,
+            metric_kwargs_id=metric_id.metric_kwargs_id,
+        )
+
+    @classmethod
+    def from_fixed_length_tuple(cls, tuple_):
+        return cls.from_tuple(tuple_)
+
+
+class PartitionMetricIdentifier(MetricIdentifier):
+    """A PartitionMetricIdentifier identifies a partial aggregate of a metric computed on one partition of a data
+    asset, so that the metric over the whole data asset can be merged from the partial aggregates of its partitions.
+
+    Keys of the partial aggregates of a metric share the (data_asset_name, metric_name, metric_kwargs_id) prefix.
+    """
+
+    def __init__(self, data_asset_name, metric_name, metric_kwargs_id, partition_key):
+        super().__init__(metric_name, metric_kwargs_id)
+        self._data_asset_name = data_asset_name
+        self._partition_key = partition_key
+
+    @property
+    def data_asset_name(self):
+        return self._data_asset_name
+
+    @property
+    def partition_key(self):
+        return self._partition_key
+
+    def to_tuple(self):
+        return tuple(
+            [
+                self.data_asset_name,
+                self.metric_name,
+                self.metric_kwargs_id or "__",
+                self.partition_key,
+            ]
+        )
+
+    def to_fixed_length_tuple(self):
+        return self.to_tuple()
+
+    @classmethod
+    def from_tuple(cls, tuple_):
+        if len(tuple_) != 4:
+            raise GreatExpectationsError(
+                "PartitionMetricIdentifier tuple must have exactly four components."
+            )
+        metric_id = MetricIdentifier.from_tuple(tuple_[1:3])
+        return cls(
+            data_asset_name=tuple_[0],
+            metric_name=metric_id.metric_name,
+            metric_kwargs_id=metric_id.metric_kwargs_id,
+            partition_key=tuple_[3],
+        )
+
+    @classmethod
+    def from_fixed_length_tuple(cls, tuple_):
+        return cls.from_tuple(tuple_)
@@ -0,0 +1,394 @@
+"""Mergeable sketches, which summarize the values of a column in bounded memory.
+
+A sketch is updated with the values of a column one chunk at a time, so it can be computed independently on each
+chunk of a batch, each Spark partition or each partition of a data asset (see the partition_metric_store of
+Dataset), and the sketches of the parts are merged into a sketch of all of the values. Sketches are serialized to
+JSON dictionaries, so that metric stores can keep them.
+"""
+import base64
+import copy
+
+import numpy as np
+import pandas as pd
+
+# the number of values added to a sketch at a time when it is built from a column
+SKETCH_CHUNK_SIZE = 100000
+
+
+class Sketch:
+    """The base class of mergeable sketches."""
+
+    sketch_type = None
+
+    def update(self, values):
+        """Adds the non-null values of a list-like to the sketch, and returns the sketch."""
+        raise NotImplementedError
+
+    def merge(self, other):
+        """Returns a new sketch of the values of both this sketch and other, which must have the same parameters."""
+        if type(other) != type(self) or other.get_parameters() != self.get_parameters():
+            raise ValueError(
+                "Only %s sketches with the same parameters can be merged"
+                % self.sketch_type
+            )
+        merged = copy.deepcopy(self)
+        merged._merge(other)
+        return merged
+
+    def _merge(self, other):
+        raise NotImplementedError
+
+    def get_parameters(self):
+        """Returns the parameters the sketch was created with."""
+        raise NotImplementedError
+
+    def to_json_dict(self):
+        raise NotImplementedError
+
+    @classmethod
+    def from_json_dict(cls, sketch_dict):
+        raise NotImplementedError
+
+    def __eq__(self, other):
+        return type(other) == type(self) and self.to_json_dict() == other.to_json_dict()
+
+    def __repr__(self):
+        return "%s(%s)" % (
+            self.__class__.__name__,
+            ", ".join(
+                "%s=%r" % (name, value) for name, value in self.get_parameters().items()
+            ),
+        )
+
+
+def _drop_nulls(values):
+    values = pd.Series(values) if not isinstance(values, pd.Series) else values
+    return values[values.notnull()]
+
+
+class QuantileSketch(Sketch):
+    """A KLL sketch (Karnin, Lang and Liberty, 2016) of numeric values, estimating their quantiles and ranks.
+
+    Values are kept in levels of compactors: a value at level h stands for 2**h values. When a level exceeds its
+    capacity its values are sorted and every other one is promoted to the next level; the compactor alternates
+    between promoting the values at even and odd positions, so that the sketch is deterministic. The rank of a value
+    is estimated within about 1.7 / k of all values, and the minimum and maximum are exact.
+
+    Args:
+        k (int): the capacity of the highest level; higher values are more accurate and use more memory
+    """
+
+    sketch_type = "quantile"
+
+    def __init__(self, k=200):
+        if k < 8:
+            raise ValueError("k must be at least 8")
+        self.k = k
+        self.count = 0
+        self.min = None
+        self.max = None
+        self._levels = [np.empty(0)]
+        self._offsets = [0]
+
+    def get_parameters(self):
+        return {"k": self.k}
+
+    def _get_capacity(self, level):
+        depth = len(self._levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2.0 / 3.0) ** depth)))
+
+    def update(self, values):
+        values = _drop_nulls(values).to_numpy(dtype=float)
+        if len(values) == 0:
+            return self
+        self._update_count_and_range(len(values), values.min(), values.max())
+        self._levels[0] = np.concatenate((self._levels[0], values))
+        self._compress()
+        return self
+
+    def _update_count_and_range(self, count, min_, max_):
+        self.count += int(count)
+        self.min = float(min_) if self.min is None else min(self.min, float(min_))
+        self.max = float(max_) if self.max is None else max(self.max, float(max_))
+
+    def _compress(self):
+        # levels are only compacted once the sketch holds more values than all of their capacities together
+        while sum(len(items) for items in self._levels) > sum(
+            self._get_capacity(level) for level in range(len(self._levels))
+        ):
+            level = next(
+                level
+                for level in range(len(self._levels))
+                if len(self._levels[level]) > self._get_capacity(level)
+            )
+            if level + 1 == len(self._levels):
+                self._levels.append(np.empty(0))
+                self._offsets.append(0)
+            items = np.sort(self._levels[level])
+            # with an odd number of values, the largest one stays at the level
+            kept = items[len(items) - len(items) % 2 :]
+            promoted = items[self._offsets[level] : len(items) - len(kept) : 2]
+            self._offsets[level] = 1 - self._offsets[level]
+            self._levels[level] = kept
+            self._levels[level + 1] = np.concatenate(
+                (self._levels[level + 1], promoted)
+            )
+
+    def _merge(self, other):
+        if other.count == 0:
+            return
+        self._update_count_and_range(other.count, other.min, other.max)
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+            self._offsets.append(0)
+        for level, items in enumerate(other._levels):
+            self._levels[level] = np.concatenate((self._levels[level], items))
+        self._compress()
+
+    def get_weighted_values(self):
+        """Returns the values kept by the sketch, sorted, and the number of values each of them stands for."""
+        values = np.concatenate(self._levels)
+        weights = np.concatenate(
+            [
+                np.full(len(items), 2 ** level)
+                for level, items in enumerate(self._levels)
+            ]
+        )
+        order = np.argsort(values, kind="mergesort")
+        return values[order], weights[order]
+
+    def get_quantiles(self, quantiles):
+        """Estimates the given quantiles (between 0 and 1) of the values, as a list; quantiles 0 and 1 are the exact
+        minimum and maximum."""
+        if self.count == 0:
+            return [None] * len(quantiles)
+        values, weights = self.get_weighted_values()
+        cumulative_weights = np.cumsum(weights)
+        positions = np.searchsorted(
+            cumulative_weights,
+            np.asarray(quantiles, dtype=float) * cumulative_weights[-1],
+            side="left",
+        )
+        estimates = values[np.minimum(positions, len(values) - 1)]
+        return [
+            self.min
+            if quantile <= 0
+            else self.max
+            if quantile >= 1
+            else float(estimate)
+            for quantile, estimate in zip(quantiles, estimates)
+        ]
+
+    def get_ranks(self, values, inclusive=False):
+        """Estimates the number of values less than (or, if inclusive, at most) each of the given values."""
+        sketch_values, weights = self.get_weighted_values()
+        cumulative_weights = np.concatenate(([0], np.cumsum(weights)))
+        positions = np.searchsorted(
+            sketch_values,
+            np.asarray(values, dtype=float),
+            side="right" if inclusive else "left",
+        )
+        return cumulative_weights[positions]
+
+    def get_hist(self, bins):
+        """Estimates the number of values in each bin, with the semantics of numpy.histogram: bins include their lower
+        edge, and the last bin also its upper edge."""
+        ranks = self.get_ranks(bins[:-1])
+        ranks = np.append(ranks, self.get_ranks(bins[-1:], inclusive=True))
+        return list(np.diff(ranks))
+
+    def to_json_dict(self):
+        return {
+            "sketch_type": self.sketch_type,
+            "k": self.k,
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "levels": [items.tolist() for items in self._levels],
+            "offsets": list(self._offsets),
+        }
+
+    @classmethod
+    def from_json_dict(cls, sketch_dict):
+        sketch = cls(k=sketch_dict["k"])
+        sketch.count = sketch_dict["count"]
+        sketch.min = sketch_dict["min"]
+        sketch.max = sketch_dict["max"]
+        sketch._levels = [
+            np.array(items, dtype=float) for items in sketch_dict["levels"]
+        ]
+        sketch._offsets = list(sketch_dict["offsets"])
+        return sketch
+
+
+def _count_leading_zeros(words):
+    """Counts the leading zero bits of non-zero unsigned 64 bit integers."""
+    zeros = np.zeros(len(words), dtype=np.uint8)
+    for shift in [32, 16, 8, 4, 2, 1]:
+        mask = words < (np.uint64(1) << np.uint64(64 - shift))
+        zeros[mask] += shift
+        words = np.where(mask, words << np.uint64(shift), words)
+    return zeros
+
+
+class DistinctCountSketch(Sketch):
+    """A HyperLogLog sketch (Flajolet et al., 2007) estimating the number of distinct values.
+
+    Values are hashed with pandas.util.hash_array, so the same value is only recognized across chunks if it has the
+    same type (e.g. integers and floats hash differently). The relative error of the estimate is about 1.04 / sqrt(2**p).
+
+    Args:
+        p (int): the number of bits of the hash selecting a register; the sketch keeps 2**p one byte registers
+    """
+
+    sketch_type = "distinct_count"
+
+    def __init__(self, p=12):
+        if not 4 <= p <= 18:
+            raise ValueError("p must be between 4 and 18")
+        self.p = p
+        self._registers = np.zeros(2 ** p, dtype=np.uint8)
+
+    def get_parameters(self):
+        return {"p": self.p}
+
+    def update(self, values):
+        values = _drop_nulls(values)
+        if len(values) == 0:
+            return self
+        hashes = pd.util.hash_array(values.to_numpy(), categorize=False)
+        registers = (hashes >> np.uint64(64 - self.p)).astype(np.int64)
+        # the lowest bit bounds the rank by 64 - p + 1
+        words = (hashes << np.uint64(self.p)) | (np.uint64(1) << np.uint64(self.p - 1))
+        np.maximum.at(self._registers, registers, _count_leading_zeros(words) + 1)
+        return self
+
+    def _merge(self, other):
+        np.maximum(self._registers, other._registers, out=self._registers)
+
+    def get_distinct_count(self):
+        """Estimates the number of distinct values."""
+        m = len(self._registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.power(2.0, -self._registers.astype(float)))
+        empty_registers = np.count_nonzero(self._registers == 0)
+        if estimate <= 2.5 * m and empty_registers > 0:
+            # linear counting is more accurate for small cardinalities
+            estimate = m * np.log(m / empty_registers)
+        return int(round(estimate))
+
+    def to_json_dict(self):
+        return {
+            "sketch_type": self.sketch_type,
+            "p": self.p,
+            "registers": base64.b64encode(self._registers.tobytes()).decode("ascii"),
+        }
+
+    @classmethod
+    def from_json_dict(cls, sketch_dict):
+        sketch = cls(p=sketch_dict["p"])
+        sketch._registers = np.frombuffer(
+            base64.b64decode(sketch_dict["registers"]), dtype=np.uint8
+        ).copy()
+        return sketch
+
+
+class FrequentValuesSketch(Sketch):
+    """A Misra-Gries summary (mergeable as shown by Agarwal et al., 2012) of the most frequent values.
+
+    At most capacity values are counted. When more are counted, the count of the (capacity + 1)-th most frequent value
+    is subtracted from every count, and values whose count drops to zero are forgotten. Counts are thus lower bounds,
+    at most error below the true counts, where error is at most count / (capacity + 1); they are exact if the values
+    have no more than capacity distinct values. Every value more frequent than error is kept.
+
+    Args:
+        capacity (int): the maximum number of values counted
+    """
+
+    sketch_type = "frequent_values"
+
+    def __init__(self, capacity=100):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.count = 0
+        self.error = 0
+        self._counts = pd.Series([], dtype="int64")
+
+    def get_parameters(self):
+        return {"capacity": self.capacity}
+
+    def update(self, values):
+        counts = _drop_nulls(values).value_counts()
+        self.count += int(counts.sum())
+        self._add_counts(counts)
+        return self
+
+    def _add_counts(self, counts):
+        if len(self._counts) == 0:
+            counts = counts.astype("int64")
+        else:
+            counts = (
+                pd.concat([self._counts, counts]).groupby(level=0, sort=False).sum()
+            )
+        if len(counts) > self.capacity:
+            threshold = np.partition(counts.values, len(counts) - self.capacity - 1)[
+                len(counts) - self.capacity - 1
+            ]
+            counts = counts[counts > threshold] - threshold
+            self.error += int(threshold)
+        self._counts = counts
+
+    def _merge(self, other):
+        self.count += other.count
+        self.error += other.error
+        self._add_counts(other._counts)
+
+    def get_frequencies(self, sort="count"):
+        """Returns the counts of the most frequent values, as a Series named "count" indexed by the values.
+
+        Args:
+            sort (string): "count" to sort by decreasing count, "value" to sort by value, or "none"
+        """
+        counts = self._counts.copy()
+        if sort == "count":
+            counts = counts.sort_values(ascending=False, kind="mergesort")
+        elif sort == "value":
+            counts = counts.sort_index()
+        counts.name = "count"
+        counts.index.name = "value"
+        return counts
+
+    def to_json_dict(self):
+        return {
+            "sketch_type": self.sketch_type,
+            "capacity": self.capacity,
+            "count": self.count,
+            "error": self.error,
+            "values": [
+                value.item() if isinstance(value, np.generic) else value
+                for value in self._counts.index
+            ],
+            "counts": [int(count) for count in self._counts.values],
+        }
+
+    @classmethod
+    def from_json_dict(cls, sketch_dict):
+        sketch = cls(capacity=sketch_dict["capacity"])
+        sketch.count = sketch_dict["count"]
+        sketch.error = sketch_dict["error"]
+        sketch._counts = pd.Series(
+            sketch_dict["counts"], index=sketch_dict["values"], dtype="int64"
+        )
+        return sketch
+
+
+SKETCH_CLASSES = {
+    sketch_class.sketch_type: sketch_class
+    for sketch_class in [QuantileSketch, DistinctCountSketch, FrequentValuesSketch]
+}
+
+
+def sketch_from_json_dict(sketch_dict):
+    """Restores a sketch of any type from the dictionary returned by its to_json_dict method."""
+    return SKETCH_CLASSES[sketch_dict["sketch_type"]].from_json_dict(sketch_dict)
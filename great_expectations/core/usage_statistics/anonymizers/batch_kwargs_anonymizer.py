@@ -22,6 +22,7 @@ class BatchKwargsAnonymizer(Anonymizer):
             "offset",
             "snowflake_transient_table",
             "bigquery_temp_table",
+            "create_temp_table",
             "data_asset_name",
         ]
 
@@ -1,6 +1,7 @@
 import copy
 import datetime
 import decimal
+import hashlib
 import inspect
 import json
 import logging
@@ -25,6 +26,7 @@ from great_expectations.core import (
 )
 from great_expectations.core.evaluation_parameters import build_evaluation_parameters
 from great_expectations.core.id_dict import BatchKwargs
+from great_expectations.core.metric import BatchMetricIdentifier
 from great_expectations.data_asset.util import (
     parse_result_format,
     recursively_convert_to_json_serializable,
@@ -66,6 +68,8 @@ class DataAsset:
         )
         batch_parameters = kwargs.pop("batch_parameters", {})
         batch_markers = kwargs.pop("batch_markers", {})
+        metric_cache = kwargs.pop("metric_cache", None)
+        data_fingerprint = kwargs.pop("data_fingerprint", None)
 
         if "autoinspect_func" in kwargs:
             warnings.warn(
@@ -82,6 +86,16 @@ class DataAsset:
         self._batch_kwargs = BatchKwargs(batch_kwargs)
         self._batch_markers = batch_markers
         self._batch_parameters = batch_parameters
+        if isinstance(metric_cache, str):
+            # the name of a store of the data context, e.g. given in the dataset_options of batch_kwargs
+            if data_context is None:
+                raise ValueError(
+                    "A data_context is required to use the metric cache store %s"
+                    % metric_cache
+                )
+            metric_cache = data_context.stores[metric_cache]
+        self._metric_cache = metric_cache
+        self._data_fingerprint = data_fingerprint
 
         # This special state variable tracks whether a validation run is going on, which will disable
         # saving expectation config objects
@@ -91,6 +105,51 @@ class DataAsset:
         if data_context and hasattr(data_context, "_expectation_explorer_manager"):
             self.set_default_expectation_argument("include_config", True)
 
+    def get_data_fingerprint(self):
+        """Returns a fingerprint that changes whenever the data of this data asset changes, or None if it cannot be
+        determined.
+
+        Metrics and expectation results are cached in the metric cache store of the data asset under this
+        fingerprint. It can be given explicitly with the data_fingerprint argument, e.g. to use the id of a table
+        snapshot.
+        """
+        if self._data_fingerprint is None:
+            self._data_fingerprint = self._compute_data_fingerprint()
+        return self._data_fingerprint
+
+    def _compute_data_fingerprint(self):
+        return None
+
+    def _get_metric_with_cache(self, metric_name, metric_kwargs, compute_metric):
+        """Returns the value of a metric from the metric cache store, or computes it with compute_metric and caches it.
+
+        Metrics are computed without caching if there is no metric cache store or if the data has no fingerprint.
+        """
+        if self._metric_cache is None:
+            return compute_metric()
+        data_fingerprint = self.get_data_fingerprint()
+        if data_fingerprint is None:
+            return compute_metric()
+
+        metric_kwargs_id = hashlib.md5(
+            json.dumps(metric_kwargs, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        key = BatchMetricIdentifier(data_fingerprint, metric_name, metric_kwargs_id)
+        if self._metric_cache.has_key(key):
+            return self._metric_cache.get(key)
+
+        value = compute_metric()
+        try:
+            self._metric_cache.set(key, value)
+        except TypeError as e:
+            logger.debug("Not caching metric %s: %s" % (metric_name, str(e)))
+        return value
+
+    def prefetch_expectation_metrics(self, expectations):
+        """Computes metrics that expectations rely on ahead of their evaluation; DataAssets without metrics do not
+        prefetch anything."""
+        pass
+
     def list_available_expectation_types(self):
         keys = dir(self)
         return [
@@ -257,7 +316,11 @@ class DataAsset:
                     or self._active_validation
                 ):
                     try:
-                        return_obj = func(self, **evaluation_args)
+                        return_obj = self._get_metric_with_cache(
+                            "expectation_result." + method_name,
+                            evaluation_args,
+                            lambda: func(self, **evaluation_args),
+                        )
                         if isinstance(return_obj, dict):
                             return_obj = ExpectationValidationResult(**return_obj)
 
@@ -908,6 +971,9 @@ class DataAsset:
             for col in columns:
                 expectations_to_evaluate.extend(columns[col])
 
+            # backends able to run independent metric queries concurrently compute them all before evaluation
+            self.prefetch_expectation_metrics(expectations_to_evaluate)
+
             for expectation in expectations_to_evaluate:
 
                 try:
@@ -1094,6 +1160,7 @@ class DataAsset:
         unexpected_count,
         unexpected_list,
         unexpected_index_list,
+        unexpected_values=None,
     ):
         """Helper function to construct expectation result objects for map_expectations (such as column_map_expectation
         and file_lines_map_expectation).
@@ -1103,6 +1170,9 @@ class DataAsset:
         See :ref:`result_format` for more information.
 
         This function handles the logic for mapping those fields for column_map_expectations.
+
+        Implementations passing only the first unexpected values as unexpected_list may pass all of them as
+        unexpected_values, in whatever form their _get_most_common_values accepts, to count the most common ones.
         """
         # NB: unexpected_count parameter is explicit some implementing classes may limit the length of unexpected_list
 
@@ -1152,8 +1222,11 @@ class DataAsset:
                 partial_unexpected_counts = [
                     {"value": key, "count": value}
                     for key, value in sorted(
-                        Counter(unexpected_list).most_common(
-                            result_format["partial_unexpected_count"]
+                        self._get_most_common_values(
+                            unexpected_values
+                            if unexpected_values is not None
+                            else unexpected_list,
+                            result_format["partial_unexpected_count"],
                         ),
                         key=lambda x: (-x[1], str(x[0])),
                     )
@@ -1194,6 +1267,19 @@ class DataAsset:
             "Unknown result_format {}.".format(result_format["result_format"])
         )
 
+    def _get_most_common_values(self, values, n):
+        """Count the n most common values, as Counter.most_common does: values with equal counts are ordered by
+        their first occurrence.
+
+        Args:
+            values (list): the values to count; they must be hashable
+            n (int): the number of values to return
+
+        Returns:
+            List[tuple]: (value, count) pairs, in descending order of count
+        """
+        return Counter(values).most_common(n)
+
     def _calc_map_expectation_success(self, success_count, nonnull_count, mostly):
         """Calculate success and percent_success for column_map_expectations
 
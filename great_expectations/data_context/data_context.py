@@ -1,13 +1,17 @@
+import collections
+import concurrent.futures
 import configparser
 import copy
 import datetime
 import errno
+import functools
 import glob
 import json
 import logging
 import os
 import shutil
 import sys
+import time
 import uuid
 import warnings
 import webbrowser
@@ -62,7 +66,7 @@ from great_expectations.data_context.util import (
     substitute_config_variable,
 )
 from great_expectations.dataset import Dataset
-from great_expectations.datasource import Datasource
+from great_expectations.datasource import Datasource, PandasDatasource
 from great_expectations.marshmallow__shade import ValidationError
 from great_expectations.profile.basic_dataset_profiler import BasicDatasetProfiler
 from great_expectations.render.renderer.site_builder import SiteBuilder
@@ -984,6 +988,14 @@ class BaseDataContext:
             expectation_suite = self.get_expectation_suite(expectation_suite_name)
 
         datasource = self.get_datasource(batch_kwargs.get("datasource"))
+        if datasource.config.get("prune_columns") and "columns" not in batch_kwargs:
+            # load only the columns the suite refers to, if that is known
+            columns = expectation_suite.get_referenced_columns(
+                table_columns_from_schema=datasource.table_columns_from_schema
+            )
+            if columns:
+                batch_kwargs = BatchKwargs(batch_kwargs)
+                batch_kwargs["columns"] = columns
         batch = datasource.get_batch(
             batch_kwargs=batch_kwargs, batch_parameters=batch_parameters
         )
@@ -1681,6 +1693,8 @@ class BaseDataContext:
         additional_batch_kwargs=None,
         run_name=None,
         run_time=None,
+        max_workers=None,
+        data_asset_timeout=None,
     ):
         """Profile the named datasource using the named profiler.
 
@@ -1695,6 +1709,12 @@ class BaseDataContext:
             profiler_configuration: Optional profiler configuration dict
             dry_run: when true, the method checks arguments and reports if can profile or specifies the arguments that are missing
             additional_batch_kwargs: Additional keyword arguments to be provided to get_batch when loading the data asset.
+            max_workers: when greater than 1, the number of data assets to profile concurrently. Data assets of pandas
+                datasources are profiled in separate processes (for file-backed DataContexts), all others in threads.
+                At most max_workers batches are loaded at any time.
+            data_asset_timeout: when profiling concurrently, the number of seconds after which the results of a data
+                asset that is still being profiled are skipped. The data asset keeps its worker until it finishes, and
+                is reported as completed late once it does
         Returns:
             A dictionary::
 
@@ -1849,23 +1869,28 @@ class BaseDataContext:
             )
             total_start_time = datetime.datetime.now()
 
-            for name in data_asset_names_to_profiled:
-                logger.info("\tProfiling '%s'..." % name)
+            for name, get_profiling_result in self._profile_data_assets(
+                data_asset_names_to_profiled,
+                max_workers=max_workers,
+                data_asset_timeout=data_asset_timeout,
+                datasource_name=datasource_name,
+                batch_kwargs_generator_name=batch_kwargs_generator_name,
+                profiler=profiler,
+                profiler_configuration=profiler_configuration,
+                run_id=run_id,
+                additional_batch_kwargs=additional_batch_kwargs,
+                run_name=run_name,
+                run_time=run_time,
+            ):
                 try:
-                    profiling_results["results"].append(
-                        self.profile_data_asset(
-                            datasource_name=datasource_name,
-                            batch_kwargs_generator_name=batch_kwargs_generator_name,
-                            data_asset_name=name,
-                            profiler=profiler,
-                            profiler_configuration=profiler_configuration,
-                            run_id=run_id,
-                            additional_batch_kwargs=additional_batch_kwargs,
-                            run_name=run_name,
-                            run_time=run_time,
-                        )["results"][0]
-                    )
+                    profiling_results["results"].append(get_profiling_result())
 
+                except concurrent.futures.TimeoutError:
+                    logger.warning(
+                        "Timed out after %s seconds while profiling %s. Skipping its results."
+                        % (data_asset_timeout, name)
+                    )
+                    skipped_data_assets += 1
                 except ge_exceptions.ProfilerError as err:
                     logger.warning(err.message)
                 except OSError as err:
@@ -1906,6 +1931,126 @@ class BaseDataContext:
         profiling_results["success"] = True
         return profiling_results
 
+    def _profile_data_assets(
+        self,
+        data_asset_names,
+        max_workers=None,
+        data_asset_timeout=None,
+        executor_kind=None,
+        **profile_data_asset_kwargs,
+    ):
+        """Yields a (data_asset_name, get_profiling_result) tuple for each data asset, in the order of data_asset_names.
+
+        get_profiling_result returns the (expectation_suite, EVR) tuple of the data asset, or raises the error
+        encountered while profiling it. When max_workers is greater than 1, data assets are profiled concurrently
+        while the results are consumed; only max_workers data assets are submitted at a time, so that no more than
+        max_workers batches are held in memory.
+
+        executor_kind ("thread" or "process") chooses how data assets are profiled concurrently. By default, data
+        assets of pandas datasources are profiled in processes for file-backed DataContexts, all others in threads.
+        """
+        if executor_kind not in [None, "thread", "process"]:
+            raise ValueError("executor_kind must be 'thread' or 'process'")
+        datasource = self.get_datasource(profile_data_asset_kwargs["datasource_name"])
+        engine = getattr(datasource, "engine", None)
+        if engine is not None and engine.dialect.name.lower() == "sqlite":
+            # sqlite connections cannot be shared across threads
+            max_workers = None
+
+        if not max_workers or max_workers <= 1:
+            for name in data_asset_names:
+                logger.info("\tProfiling '%s'..." % name)
+                yield name, functools.partial(
+                    self._get_data_asset_profiling_result,
+                    data_asset_name=name,
+                    **profile_data_asset_kwargs,
+                )
+            return
+
+        if executor_kind is None:
+            executor_kind = (
+                "process"
+                if isinstance(datasource, PandasDatasource)
+                and isinstance(self, DataContext)
+                else "thread"
+            )
+        if executor_kind == "process":
+            # pandas profiling is CPU bound and holds the GIL, so profile in separate processes, each of which
+            # loads its own DataContext from the context root directory
+            executor = concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
+            profile_function = functools.partial(
+                _get_data_asset_profiling_result_in_data_context, self.root_directory
+            )
+        else:
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+            profile_function = self._get_data_asset_profiling_result
+
+        queued = collections.deque(data_asset_names)
+        pending = collections.deque()
+        # data assets that timed out but are still being profiled; running workers cannot be interrupted, so each of
+        # them keeps its worker until it finishes
+        timed_out = {}
+        num_done = 0
+        try:
+            while queued or pending:
+                while queued and len(pending) + len(timed_out) < max_workers:
+                    name = queued.popleft()
+                    future = executor.submit(
+                        profile_function,
+                        data_asset_name=name,
+                        **profile_data_asset_kwargs,
+                    )
+                    # at most max_workers data assets are in flight, so each of them starts running when submitted
+                    pending.append((name, future, time.monotonic()))
+                if not pending:
+                    # all workers are busy profiling data assets that timed out
+                    concurrent.futures.wait(
+                        timed_out, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    self._report_late_profiling_results(timed_out)
+                    continue
+
+                name, future, submit_time = pending.popleft()
+                if data_asset_timeout is None:
+                    timeout = None
+                else:
+                    timeout = max(
+                        0, submit_time + data_asset_timeout - time.monotonic()
+                    )
+                yield name, functools.partial(future.result, timeout=timeout)
+                if not future.done():
+                    timed_out[future] = name
+                self._report_late_profiling_results(timed_out)
+                num_done += 1
+                logger.info(
+                    "\tDone profiling '%s' (%d of %d)"
+                    % (name, num_done, len(data_asset_names))
+                )
+        finally:
+            for _, future, _ in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+            self._report_late_profiling_results(timed_out)
+
+    @staticmethod
+    def _report_late_profiling_results(timed_out):
+        """Logs and forgets the data assets of timed_out, a dict of futures to data asset names, that finished."""
+        for future in [future for future in timed_out if future.done()]:
+            name = timed_out.pop(future)
+            if future.cancelled() or future.exception() is not None:
+                logger.warning(
+                    "Profiling '%s' failed after timing out. Nothing was saved."
+                    % (name,)
+                )
+            else:
+                logger.warning(
+                    "Profiling '%s' completed after timing out. Its expectation suite and validation result were "
+                    "saved, but are not included in the profiling results." % (name,)
+                )
+
+    def _get_data_asset_profiling_result(self, **profile_data_asset_kwargs):
+        return self.profile_data_asset(**profile_data_asset_kwargs)["results"][0]
+
     def profile_data_asset(
         self,
         datasource_name,
@@ -2675,3 +2820,11 @@ def _get_metric_configuration_tuples(metric_configuration, base_kwargs=None):
                     )
 
     return metric_configurations_list
+
+
+def _get_data_asset_profiling_result_in_data_context(
+    context_root_directory, **profile_data_asset_kwargs
+):
+    """Profiles a data asset using the DataContext at context_root_directory; used to profile in a subprocess."""
+    context = DataContext(context_root_dir=context_root_directory)
+    return context.profile_data_asset(**profile_data_asset_kwargs)["results"][0]
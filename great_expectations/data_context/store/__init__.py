@@ -3,7 +3,12 @@ from great_expectations.util import verify_dynamic_loading_support
 from .database_store_backend import DatabaseStoreBackend
 from .expectations_store import ExpectationsStore
 from .html_site_store import HtmlSiteStore
-from .metric_store import EvaluationParameterStore, MetricStore
+from .metric_store import (
+    EvaluationParameterStore,
+    MetricCacheStore,
+    MetricStore,
+    PartitionMetricStore,
+)
 from .query_store import SqlAlchemyQueryStore
 from .store import Store
 from .store_backend import InMemoryStoreBackend, StoreBackend
@@ -1,7 +1,21 @@
+import datetime
+import decimal
 import json
 
-from great_expectations.core import ensure_json_serializable
-from great_expectations.core.metric import ValidationMetricIdentifier
+import numpy as np
+import pandas as pd
+
+from great_expectations.core import (
+    ExpectationValidationResult,
+    convert_to_json_serializable,
+    ensure_json_serializable,
+)
+from great_expectations.core.metric import (
+    BatchMetricIdentifier,
+    PartitionMetricIdentifier,
+    ValidationMetricIdentifier,
+)
+from great_expectations.core.sketch import Sketch, sketch_from_json_dict
 from great_expectations.data_context.store.database_store_backend import (
     DatabaseStoreBackend,
 )
@@ -91,3 +105,124 @@ class EvaluationParameterStore(MetricStore):
             key = self.tuple_to_key(k)
             params[key.to_evaluation_parameter_urn()] = self.get(key)
         return params
+
+
+class MetricCacheStore(Store):
+    """
+    A MetricCacheStore caches the metrics and expectation results computed on batches of data, keyed by the
+    fingerprint of the data, so that validating unchanged data again does not recompute them.
+
+    Values are stored as JSON; values of types that cannot be restored from JSON are not cached.
+    """
+
+    _key_class = BatchMetricIdentifier
+
+    def serialize(self, key, value):
+        return json.dumps({"value": self._encode(value)})
+
+    def deserialize(self, key, value):
+        if value:
+            return self._decode(json.loads(value)["value"])
+
+    @classmethod
+    def _encode(cls, value):
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        if isinstance(value, np.generic):
+            return cls._encode(value.item())
+        if isinstance(value, list):
+            return [cls._encode(item) for item in value]
+        if isinstance(value, tuple):
+            return {"__type__": "tuple", "value": cls._encode(list(value))}
+        if isinstance(value, dict) and all(isinstance(key, str) for key in value):
+            return {key: cls._encode(item) for key, item in value.items()}
+        if isinstance(value, pd.Series):
+            return {
+                "__type__": "Series",
+                "name": cls._encode(value.name),
+                "index": cls._encode(value.index.tolist()),
+                "value": cls._encode(value.tolist()),
+            }
+        if isinstance(value, pd.Timestamp):
+            return {"__type__": "Timestamp", "value": value.isoformat()}
+        if isinstance(value, datetime.datetime):
+            return {"__type__": "datetime", "value": value.isoformat()}
+        if isinstance(value, datetime.date):
+            return {"__type__": "date", "value": value.isoformat()}
+        if isinstance(value, decimal.Decimal):
+            return {"__type__": "Decimal", "value": str(value)}
+        if isinstance(value, Sketch):
+            return {"__type__": "Sketch", "value": cls._encode(value.to_json_dict())}
+        if isinstance(value, ExpectationValidationResult):
+            return {
+                "__type__": "ExpectationValidationResult",
+                "value": convert_to_json_serializable(value.to_json_dict()),
+            }
+        raise TypeError(
+            "Unable to cache metric value of type %s" % type(value).__name__
+        )
+
+    @classmethod
+    def _decode(cls, value):
+        if isinstance(value, list):
+            return [cls._decode(item) for item in value]
+        if not isinstance(value, dict):
+            return value
+        type_ = value.get("__type__")
+        if type_ is None:
+            return {key: cls._decode(item) for key, item in value.items()}
+        if type_ == "tuple":
+            return tuple(cls._decode(value["value"]))
+        if type_ == "Series":
+            return pd.Series(
+                cls._decode(value["value"]),
+                index=cls._decode(value["index"]),
+                name=cls._decode(value["name"]),
+            )
+        if type_ == "Timestamp":
+            return pd.Timestamp(value["value"])
+        if type_ == "datetime":
+            return datetime.datetime.fromisoformat(value["value"])
+        if type_ == "date":
+            return datetime.date.fromisoformat(value["value"])
+        if type_ == "Decimal":
+            return decimal.Decimal(value["value"])
+        if type_ == "Sketch":
+            return sketch_from_json_dict(cls._decode(value["value"]))
+        if type_ == "ExpectationValidationResult":
+            validation_result = value["value"]
+            return ExpectationValidationResult(
+                success=validation_result.get("success"),
+                result=validation_result.get("result"),
+                meta=validation_result.get("meta"),
+                exception_info=validation_result.get("exception_info"),
+            )
+        raise ValueError("Unknown type of cached metric value: %s" % type_)
+
+
+class PartitionMetricStore(MetricCacheStore):
+    """
+    A PartitionMetricStore stores the partial aggregates of metrics computed on the partitions of data assets, so
+    that incremental validation only computes them for new or changed partitions and merges them with the stored
+    partial aggregates of the other partitions (see the partition_metric_store option of Dataset).
+
+    Each value holds the partial aggregate and the fingerprint of the partition it was computed on.
+    """
+
+    _key_class = PartitionMetricIdentifier
+
+    def list_partition_keys(self, data_asset_name, metric_name, metric_kwargs_id):
+        """Returns the keys of the partial aggregates of a metric stored for all partitions of a data asset."""
+        prefix = PartitionMetricIdentifier(
+            data_asset_name, metric_name, metric_kwargs_id, None
+        ).to_tuple()[:3]
+        try:
+            key_tuples = self._store_backend.list_keys(prefix)
+        except TypeError:
+            # backends which can only list all of their keys
+            key_tuples = [
+                key_tuple
+                for key_tuple in self._store_backend.list_keys()
+                if tuple(key_tuple[:3]) == prefix
+            ]
+        return [self.tuple_to_key(key_tuple) for key_tuple in key_tuples]
@@ -232,6 +232,9 @@ class DatasourceConfigSchema(Schema):
     )
     credentials = fields.Raw(allow_none=True)
     spark_context = fields.Raw(allow_none=True)
+    reader_engine = fields.String(allow_none=True)
+    prune_columns = fields.Boolean(allow_none=True)
+    max_concurrent_queries = fields.Integer(allow_none=True)
 
     @validates_schema
     def validate_schema(self, data, **kwargs):
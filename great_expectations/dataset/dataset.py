@@ -1,7 +1,9 @@
+import hashlib
 import inspect
+import json
 import logging
 from datetime import datetime
-from functools import lru_cache, wraps
+from functools import lru_cache, reduce, wraps
 from itertools import zip_longest
 from numbers import Number
 from typing import Any, List, Optional, Set, Union
@@ -11,12 +13,20 @@ import pandas as pd
 from dateutil.parser import parse
 from scipy import stats
 
+from great_expectations.core.metric import PartitionMetricIdentifier
+from great_expectations.core.sketch import (
+    DistinctCountSketch,
+    FrequentValuesSketch,
+    QuantileSketch,
+)
 from great_expectations.data_asset.data_asset import DataAsset
 from great_expectations.data_asset.util import DocInherit, parse_result_format
 from great_expectations.dataset.util import (
+    bootstrapped_ks_test_p_values,
     build_categorical_partition_object,
     build_continuous_partition_object,
     is_valid_categorical_partition_object,
+    is_valid_continuous_partition_object,
     is_valid_partition_object,
 )
 
@@ -109,8 +119,18 @@ class MetaDataset(DataAsset):
             result_format = parse_result_format(result_format)
 
             if row_condition and self._supports_row_condition:
-                self = self.query(row_condition, parser=condition_parser).reset_index(
-                    drop=True
+                self = self._apply_row_condition(
+                    row_condition=row_condition,
+                    condition_parser=condition_parser,
+                    columns=[
+                        col
+                        for col in [
+                            kwargs.get("column", column),
+                            kwargs.get("column_A"),
+                            kwargs.get("column_B"),
+                        ]
+                        if col is not None
+                    ],
                 )
 
             element_count = self.get_row_count()
@@ -229,20 +249,630 @@ class Dataset(MetaDataset):
         "get_column_count",
         "get_table_columns",
         "get_column_count_in_range",
+        "get_column_quantile_sketch",
+        "get_column_distinct_count_sketch",
+        "get_column_frequent_values_sketch",
+    ]
+
+    # column aggregate metrics that prefetch_column_metrics can compute for many columns in a single pass;
+    # each metric name maps to the getter "get_column_<metric>"
+    batchable_column_metrics = [
+        "nonnull_count",
+        "min",
+        "max",
+        "mean",
+        "stdev",
+        "sum",
+        "unique_count",
     ]
 
+    # getters that column aggregate expectations call with the column as only argument, besides get_row_count and
+    # get_column_nonnull_count, which every column aggregate expectation calls; see prefetch_expectation_metrics
+    column_aggregate_expectation_getters = {
+        "expect_column_distinct_values_to_be_in_set": ["get_column_value_counts"],
+        "expect_column_distinct_values_to_equal_set": ["get_column_value_counts"],
+        "expect_column_distinct_values_to_contain_set": ["get_column_value_counts"],
+        "expect_column_mean_to_be_between": ["get_column_mean"],
+        "expect_column_median_to_be_between": ["get_column_median"],
+        "expect_column_stdev_to_be_between": ["get_column_stdev"],
+        "expect_column_unique_value_count_to_be_between": ["get_column_unique_count"],
+        "expect_column_proportion_of_unique_values_to_be_between": [
+            "get_column_unique_count"
+        ],
+        "expect_column_most_common_value_to_be_in_set": ["get_column_modes"],
+        "expect_column_sum_to_be_between": ["get_column_sum"],
+    }
+
+    # getters whose value over the whole dataset can be merged from partial aggregates computed on each of its
+    # partitions (see partition_metric_store); each getter maps to the kind of its partial aggregate
+    mergeable_getters = {
+        "get_row_count": "sum",
+        "get_column_nonnull_count": "sum",
+        "get_column_sum": "sum",
+        "get_column_count_in_range": "sum",
+        "get_column_hist": "sum",
+        "get_column_min": "min",
+        "get_column_max": "max",
+        "get_column_mean": "moments",
+        "get_column_stdev": "moments",
+        "get_column_value_counts": "value_counts",
+        "get_column_unique_count": "value_counts",
+        "get_column_modes": "value_counts",
+        "get_column_quantile_sketch": "sketch",
+        "get_column_distinct_count_sketch": "sketch",
+        "get_column_frequent_values_sketch": "sketch",
+    }
+
     def __init__(self, *args, **kwargs):
+        """
+        Besides the arguments of DataAsset, a Dataset accepts:
+
+            caching (boolean): whether to cache the values of metric getters; see hashable_getters.
+            partition_metric_store (PartitionMetricStore or str): a store, or the name of a store of the data \
+                context, in which the partial aggregates of the mergeable_getters are kept for each partition of the \
+                data asset. Validating the data asset again then only computes them for its new or changed \
+                partitions, and merges them with the stored ones. The batch_kwargs must include the \
+                data_asset_name.
+            partition_column (str): the column whose values partition the dataset, e.g. the date on which rows \
+                were appended to a table; required with a partition_metric_store.
+        """
         # NOTE: using caching makes the strong assumption that the user will not modify the core data store
         # (e.g. self.spark_df) over the lifetime of the dataset instance
         self.caching = kwargs.pop("caching", True)
+        self._prefetched_metrics = {}
+        partition_metric_store = kwargs.pop("partition_metric_store", None)
+        self._partition_column = kwargs.pop("partition_column", None)
+        self._partition_fingerprints = None
+        self._partition_datasets = {}
+        self._merged_metrics = {}
 
         super().__init__(*args, **kwargs)
 
+        if isinstance(partition_metric_store, str):
+            if self._data_context is None:
+                raise ValueError(
+                    "A data_context is required to use the partition metric store %s"
+                    % partition_metric_store
+                )
+            partition_metric_store = self._data_context.stores[partition_metric_store]
+        self._partition_metric_store = partition_metric_store
+        if partition_metric_store is not None:
+            if self._partition_column is None:
+                raise ValueError(
+                    "A partition_column is required to use a partition metric store"
+                )
+            if self.batch_kwargs.get("data_asset_name") is None:
+                raise ValueError(
+                    "The batch_kwargs must include a data_asset_name to use a partition metric store"
+                )
+
+        if not self.caching:
+            # the metric cache store relies on the same assumption
+            self._metric_cache = None
+
         if self.caching:
             for func in self.hashable_getters:
-                caching_func = lru_cache(maxsize=None)(getattr(self, func))
+                getter = getattr(self, func)
+                if self._metric_cache is not None:
+                    getter = self._use_metric_cache(func, getter)
+                caching_func = lru_cache(maxsize=None)(
+                    self._use_prefetched_metrics(func, getter)
+                )
                 setattr(self, func, caching_func)
 
+        if self._partition_metric_store is not None:
+            for func in self.mergeable_getters:
+                setattr(
+                    self, func, self._use_partition_metrics(func, getattr(self, func))
+                )
+
+    def _use_metric_cache(self, getter_name, getter):
+        """Wrap a getter so that its values are read from and written to the metric cache store of the dataset."""
+
+        @wraps(getter)
+        def inner_wrapper(*args, **kwargs):
+            return self._get_metric_with_cache(
+                getter_name,
+                {"args": args, "kwargs": kwargs},
+                lambda: getter(*args, **kwargs),
+            )
+
+        return inner_wrapper
+
+    def _use_prefetched_metrics(self, getter_name, getter):
+        """Wrap a getter so that values computed by prefetch_column_metrics and prefetch_column_quantiles are
+        returned without recomputation.
+
+        Values prefetched by prefetch_column_metrics are only served to calls using default values for every argument
+        after the column; quantiles are served to calls with the same quantiles and keyword arguments.
+        """
+
+        @wraps(getter)
+        def inner_wrapper(*args, **kwargs):
+            keys = [(getter_name,) + args + tuple(sorted(kwargs.items()))]
+            if not any(args[1:]) and not any(kwargs.values()):
+                keys.append((getter_name,) + args[:1])
+            for key in keys:
+                try:
+                    return self._prefetched_metrics[key]
+                except (KeyError, TypeError):
+                    pass
+            return getter(*args, **kwargs)
+
+        return inner_wrapper
+
+    def _use_partition_metrics(self, getter_name, getter):
+        """Wrap a getter so that its value is merged from the partial aggregates of the partitions of the dataset.
+
+        Calls with arguments that partial aggregates do not support (such as a collation of value counts) are computed
+        on the whole dataset.
+        """
+        signature = inspect.signature(getter)
+
+        @wraps(getter)
+        def inner_wrapper(*args, **kwargs):
+            try:
+                arguments = signature.bind(*args, **kwargs)
+            except TypeError:
+                return getter(*args, **kwargs)
+            arguments.apply_defaults()
+            arguments = dict(arguments.arguments)
+
+            kind = self.mergeable_getters[getter_name]
+            if kind == "moments":
+                partial_metric_name = "column_moments"
+                partial_metric_kwargs = {"column": arguments["column"]}
+            elif kind == "value_counts":
+                if arguments.get("collate") is not None:
+                    return getter(*args, **kwargs)
+                partial_metric_name = "column_value_counts"
+                partial_metric_kwargs = {"column": arguments["column"]}
+            else:
+                partial_metric_name = getter_name
+                partial_metric_kwargs = arguments
+
+            merged_value = self._get_merged_partition_metric(
+                kind, partial_metric_name, partial_metric_kwargs
+            )
+            return self._finalize_partition_metric(getter_name, merged_value, arguments)
+
+        return inner_wrapper
+
+    def _get_merged_partition_metric(
+        self, kind, partial_metric_name, partial_metric_kwargs
+    ):
+        """Returns the partial aggregate of a metric over the whole dataset, merged from the partial aggregates of its
+        partitions.
+
+        The partial aggregate of each partition is read from the partition metric store if it was stored for the
+        current fingerprint of the partition, and is otherwise computed on the partition and stored.
+        """
+        metric_kwargs_id = hashlib.md5(
+            json.dumps(partial_metric_kwargs, sort_keys=True, default=str).encode(
+                "utf-8"
+            )
+        ).hexdigest()
+        if (partial_metric_name, metric_kwargs_id) in self._merged_metrics:
+            return self._merged_metrics[(partial_metric_name, metric_kwargs_id)]
+
+        if self._partition_fingerprints is None:
+            self._partition_fingerprints = self._get_partition_fingerprints(
+                self._partition_column
+            )
+        partial_values = []
+        for partition_value, fingerprint in self._partition_fingerprints.items():
+            key = PartitionMetricIdentifier(
+                data_asset_name=self.batch_kwargs["data_asset_name"],
+                metric_name=partial_metric_name,
+                metric_kwargs_id=metric_kwargs_id,
+                partition_key=hashlib.md5(
+                    json.dumps(partition_value, default=str).encode("utf-8")
+                ).hexdigest(),
+            )
+            if fingerprint is not None and self._partition_metric_store.has_key(key):
+                stored_value = self._partition_metric_store.get(key)
+                if stored_value["partition_fingerprint"] == fingerprint:
+                    partial_values.append(stored_value["value"])
+                    continue
+
+            partial_value = self._compute_partial_metric(
+                self._get_cached_partition_dataset(partition_value),
+                partial_metric_name,
+                partial_metric_kwargs,
+            )
+            if fingerprint is not None:
+                try:
+                    self._partition_metric_store.set(
+                        key,
+                        {"partition_fingerprint": fingerprint, "value": partial_value},
+                    )
+                except TypeError as e:
+                    logger.debug(
+                        "Not storing partial metric %s: %s"
+                        % (partial_metric_name, str(e))
+                    )
+            partial_values.append(partial_value)
+
+        merged_value = self._merge_partial_metrics(kind, partial_values)
+        self._merged_metrics[(partial_metric_name, metric_kwargs_id)] = merged_value
+        return merged_value
+
+    def _get_cached_partition_dataset(self, partition_value):
+        if partition_value not in self._partition_datasets:
+            self._partition_datasets[partition_value] = self._get_partition_dataset(
+                self._partition_column, partition_value
+            )
+        return self._partition_datasets[partition_value]
+
+    @staticmethod
+    def _compute_partial_metric(dataset, partial_metric_name, partial_metric_kwargs):
+        """Computes the partial aggregate of a metric on one partition of a dataset."""
+        if partial_metric_name == "column_moments":
+            return dataset._get_column_moments(partial_metric_kwargs["column"])
+        if partial_metric_name == "column_value_counts":
+            return dataset.get_column_value_counts(
+                partial_metric_kwargs["column"], sort="none"
+            )
+        return getattr(dataset, partial_metric_name)(**partial_metric_kwargs)
+
+    @staticmethod
+    def _merge_partial_metrics(kind, partial_values):
+        """Merges the partial aggregates of a metric computed on the partitions of a dataset."""
+        if kind == "moments":
+            # Chan et al.'s pairwise update of the count, mean and sum of squared deviations
+            count, mean, m2 = 0, 0.0, 0.0
+            for partial_count, partial_mean, partial_m2 in partial_values:
+                if partial_count == 0:
+                    continue
+                total_count = count + partial_count
+                delta = partial_mean - mean
+                mean += delta * partial_count / total_count
+                m2 += partial_m2 + delta ** 2 * count * partial_count / total_count
+                count = total_count
+            return [count, mean, m2]
+        if kind == "sketch":
+            if len(partial_values) == 0:
+                return None
+            return reduce(lambda sketch, other: sketch.merge(other), partial_values)
+        if kind == "value_counts":
+            partial_values = [
+                partial_value for partial_value in partial_values if len(partial_value)
+            ]
+            if len(partial_values) == 0:
+                return pd.Series([], dtype="int64")
+            return pd.concat(partial_values).groupby(level=0, sort=False).sum()
+
+        partial_values = [
+            partial_value
+            for partial_value in partial_values
+            if partial_value is not None
+            and not (isinstance(partial_value, float) and np.isnan(partial_value))
+        ]
+        if len(partial_values) == 0:
+            return None
+        if kind == "min":
+            return min(partial_values)
+        if kind == "max":
+            return max(partial_values)
+        if isinstance(partial_values[0], list):
+            # histograms are summed bin by bin
+            return [sum(bin_counts) for bin_counts in zip(*partial_values)]
+        return sum(partial_values)
+
+    @staticmethod
+    def _finalize_partition_metric(getter_name, merged_value, arguments):
+        """Returns the value of a getter from the merged partial aggregate of its metric."""
+        if getter_name in ["get_column_mean", "get_column_stdev"]:
+            count, mean, m2 = merged_value
+            if getter_name == "get_column_mean":
+                return mean if count > 0 else None
+            return np.sqrt(m2 / (count - 1)) if count > 1 else None
+        if getter_name == "get_column_value_counts":
+            counts = merged_value.copy()
+            if arguments["sort"] == "value":
+                try:
+                    counts = counts.sort_index()
+                except TypeError:
+                    # values of multiple types cannot be compared, see get_column_value_counts
+                    counts.index = counts.index.astype(str)
+                    counts = counts.sort_index()
+            elif arguments["sort"] == "count":
+                counts = counts.sort_values(ascending=False, kind="mergesort")
+            counts.name = "count"
+            counts.index.name = "value"
+            return counts
+        if getter_name == "get_column_unique_count":
+            return len(merged_value)
+        if getter_name == "get_column_modes":
+            if len(merged_value) == 0:
+                return []
+            modes = merged_value[merged_value == merged_value.max()]
+            try:
+                modes = modes.sort_index()
+            except TypeError:
+                pass
+            return list(modes.index)
+        if merged_value is None:
+            if getter_name == "get_column_hist":
+                return [0] * (len(arguments["bins"]) - 1)
+            if getter_name in [
+                "get_row_count",
+                "get_column_nonnull_count",
+                "get_column_count_in_range",
+            ]:
+                return 0
+        return merged_value
+
+    def _get_column_moments(self, column):
+        """Returns the count, mean and sum of squared deviations from the mean of the non-null values of column,
+        which are merged exactly across partitions."""
+        count = int(self.get_column_nonnull_count(column))
+        if count == 0:
+            return [0, 0.0, 0.0]
+        mean = float(self.get_column_mean(column))
+        if count == 1:
+            return [count, mean, 0.0]
+        return [count, mean, float(self.get_column_stdev(column)) ** 2 * (count - 1)]
+
+    def _get_partition_fingerprints(self, partition_column):
+        """Returns a dictionary mapping each value of partition_column to a fingerprint of the rows of the dataset
+        holding that value (None for null values), which changes whenever those rows change.
+
+        A fingerprint is None if it cannot be determined; partial aggregates of such partitions are always computed.
+        """
+        raise NotImplementedError
+
+    def _get_partition_dataset(self, partition_column, partition_value):
+        """Returns a dataset of the rows of this dataset holding partition_value (None for null values) in
+        partition_column."""
+        raise NotImplementedError
+
+    def prefetch_column_metrics(self, columns, metrics, batch_size=50):
+        """Compute aggregate metrics for many columns at once and make them available to the metric getters.
+
+        Backends that can compute several aggregates in a single statement (e.g. one SQL query or one Spark job per
+        group of columns) implement _get_column_metrics_batch; subsequent calls to the corresponding getters (for
+        example get_column_min(column)) then return the prefetched values instead of issuing their own scan.
+
+        Args:
+            columns (list of str): the columns for which to compute metrics
+            metrics (list of str): the metrics to compute; each must be one of batchable_column_metrics
+            batch_size (int): the maximum number of columns to include in a single statement
+
+        Returns:
+            dict: a dictionary mapping each column to a dictionary of its computed metrics. The dictionary is empty \
+            if caching is disabled or the backend does not support batched metric computation.
+        """
+        unsupported_metrics = set(metrics) - set(self.batchable_column_metrics)
+        if unsupported_metrics:
+            raise ValueError(
+                "Unsupported metrics for batched computation: %s"
+                % ", ".join(sorted(unsupported_metrics))
+            )
+
+        column_metrics = {}
+        if not self.caching or len(columns) == 0 or len(metrics) == 0:
+            return column_metrics
+
+        columns = list(columns)
+        for start in range(0, len(columns), batch_size):
+            try:
+                row_count, batch_metrics = self._get_column_metrics_batch(
+                    columns[start : start + batch_size], list(metrics)
+                )
+            except NotImplementedError:
+                logger.debug(
+                    "%s does not support batched metric computation"
+                    % self.__class__.__name__
+                )
+                return column_metrics
+
+            self._prefetched_metrics[("get_row_count",)] = row_count
+            for column, metric_values in batch_metrics.items():
+                for metric, value in metric_values.items():
+                    self._prefetched_metrics[("get_column_" + metric, column)] = value
+            column_metrics.update(batch_metrics)
+
+        return column_metrics
+
+    def prefetch_column_quantiles(
+        self, columns, quantiles_list, allow_relative_error=False, batch_size=50
+    ):
+        """Compute the medians and quantiles of many columns at once and make them available to the metric getters.
+
+        Backends that can compute them for several columns in a single statement implement get_columns_medians and
+        get_columns_quantiles; subsequent calls to get_column_median(column) and to get_column_quantiles(column,
+        quantiles, allow_relative_error=allow_relative_error) then return the prefetched values.
+
+        Args:
+            columns (list of str): the columns for which to compute medians and quantiles
+            quantiles_list (list of tuple of float): the quantiles to compute for every column, each tuple as it is \
+                later passed to get_column_quantiles
+            allow_relative_error: passed to get_columns_quantiles
+            batch_size (int): the maximum number of columns to include in a single statement
+        """
+        if not self.caching or len(columns) == 0:
+            return
+
+        columns = list(columns)
+        all_quantiles = sorted(
+            {quantile for quantiles in quantiles_list for quantile in quantiles}
+        )
+        for start in range(0, len(columns), batch_size):
+            batch_columns = columns[start : start + batch_size]
+            for column, median in self.get_columns_medians(batch_columns).items():
+                self._prefetched_metrics[("get_column_median", column)] = median
+            if not all_quantiles:
+                continue
+            columns_quantiles = self.get_columns_quantiles(
+                {column: all_quantiles for column in batch_columns},
+                allow_relative_error=allow_relative_error,
+            )
+            for column, values in columns_quantiles.items():
+                quantile_values = dict(zip(all_quantiles, values))
+                for quantiles in quantiles_list:
+                    self._prefetched_metrics[
+                        (
+                            "get_column_quantiles",
+                            column,
+                            tuple(quantiles),
+                            ("allow_relative_error", allow_relative_error),
+                        )
+                    ] = [quantile_values[quantile] for quantile in quantiles]
+
+    def _get_column_metrics_batch(self, columns, metrics):
+        """Compute the requested metrics for all of the given columns in a single pass over the data.
+
+        Returns:
+            tuple(int, dict): the table row count, and a dictionary mapping each column to a dictionary of metric \
+            values keyed by metric name
+        """
+        raise NotImplementedError
+
+    def compute_metrics(self, metric_calls):
+        """Compute several metrics, concurrently where the backend supports it.
+
+        Args:
+            metric_calls (list of tuple): a (getter_name, args, kwargs) tuple for each metric, for example \
+            ("get_column_quantiles", ("x", (0.25, 0.75)), {"allow_relative_error": False})
+
+        Returns:
+            list: the value of each metric, or the exception raised while computing it, in the order of metric_calls
+        """
+        metric_values = []
+        for getter_name, args, kwargs in metric_calls:
+            try:
+                metric_values.append(getattr(self, getter_name)(*args, **kwargs))
+            except Exception as e:
+                metric_values.append(e)
+        return metric_values
+
+    def _can_compute_metrics_concurrently(self):
+        return False
+
+    def prefetch_metrics(self, metric_calls):
+        """Compute metrics ahead of the expectations relying on them, so that their queries can run concurrently.
+
+        The values are kept by the caching getters, which the expectations then call with the same arguments. This
+        does nothing unless caching is enabled and the backend computes metrics concurrently (see compute_metrics).
+
+        Args:
+            metric_calls (list of tuple): a (getter_name, args, kwargs) tuple for each metric
+        """
+        if (
+            not self.caching
+            or not self._can_compute_metrics_concurrently()
+            or self._partition_metric_store is not None
+        ):
+            # metrics merged from partitions are computed per partition, as the getters are called
+            return
+
+        unique_metric_calls = []
+        for metric_call in metric_calls:
+            if metric_call not in unique_metric_calls:
+                unique_metric_calls.append(metric_call)
+        for metric_call, metric_value in zip(
+            unique_metric_calls, self.compute_metrics(unique_metric_calls)
+        ):
+            if isinstance(metric_value, Exception):
+                # the expectation computing the metric will raise the exception again
+                logger.debug(
+                    "Unable to prefetch metric %s: %s" % (metric_call[0], metric_value)
+                )
+
+    def prefetch_expectation_metrics(self, expectations):
+        """Prefetch the metrics of the column aggregate expectations among expectations (see prefetch_metrics).
+
+        Args:
+            expectations (list of ExpectationConfiguration): the expectations about to be evaluated
+        """
+        metric_calls = []
+        for expectation in expectations:
+            metric_calls.extend(self._get_expectation_metric_calls(expectation))
+        self.prefetch_metrics(metric_calls)
+
+    def _get_expectation_metric_calls(self, expectation):
+        """Return the getter calls the evaluation of expectation will make, for supported column aggregate
+        expectations whose arguments are known before evaluation"""
+        expectation_type = expectation.expectation_type
+        kwargs = expectation.kwargs
+        column = kwargs.get("column")
+        if (
+            not isinstance(column, str)
+            or kwargs.get("row_condition")
+            or any(
+                isinstance(value, dict) and "$PARAMETER" in value
+                for value in kwargs.values()
+            )
+        ):
+            return []
+
+        # match the column_aggregate_expectation decorator, so that the getters are called with the same arguments
+        if (
+            hasattr(self, "engine")
+            and self.batch_kwargs.get("use_quoted_name")
+            and quoted_name
+        ):
+            column = quoted_name(column, quote=True)
+
+        if expectation_type in self.column_aggregate_expectation_getters:
+            metric_calls = [
+                (getter_name, (column,), {})
+                for getter_name in self.column_aggregate_expectation_getters[
+                    expectation_type
+                ]
+            ]
+        elif expectation_type == "expect_column_min_to_be_between":
+            metric_calls = [
+                (
+                    "get_column_min",
+                    (column, kwargs.get("parse_strings_as_datetimes", False)),
+                    {},
+                )
+            ]
+        elif expectation_type == "expect_column_max_to_be_between":
+            metric_calls = [
+                (
+                    "get_column_max",
+                    (column, kwargs.get("parse_strings_as_datetimes", False)),
+                    {},
+                )
+            ]
+        elif expectation_type == "expect_column_quantile_values_to_be_between":
+            try:
+                quantiles = tuple(kwargs["quantile_ranges"]["quantiles"])
+            except (KeyError, TypeError):
+                return []
+            metric_calls = [
+                (
+                    "get_column_quantiles",
+                    (column, quantiles),
+                    {"allow_relative_error": kwargs.get("allow_relative_error", False)},
+                )
+            ]
+        else:
+            return []
+
+        return [
+            ("get_row_count", (), {}),
+            ("get_column_nonnull_count", (column,), {}),
+        ] + metric_calls
+
+    def get_sample_dataset(self, fraction, seed=None):
+        """Returns a new Dataset of the same type containing a random sample of the rows of this Dataset.
+
+        Each row is included with probability *fraction*, so the size of the sample is only approximately
+        fraction * row_count. The returned Dataset starts with an empty expectation suite.
+
+        Args:
+            fraction (float): the fraction of rows to sample, between 0 (exclusive) and 1 (inclusive)
+            seed (int or None): a seed for the random number generator, where the backend supports one
+
+        Returns:
+            Dataset: a Dataset containing the sampled rows
+        """
+        raise NotImplementedError
+
     @classmethod
     def from_dataset(cls, dataset=None):
         """This base implementation naively passes arguments on to the real constructor, which
@@ -265,6 +895,16 @@ class Dataset(MetaDataset):
         """Returns: int"""
         raise NotImplementedError
 
+    def _column_type_in_type_list(self, column, type_list):
+        """Check the type of a column against a list of type names using only the schema of the dataset, following
+        the semantics of expect_column_values_to_be_in_type_list.
+
+        Returns:
+            bool or None: whether the column type is in type_list, or None if that cannot be determined without \
+            inspecting the values of the column
+        """
+        return None
+
     def get_column_mean(self, column):
         """Returns: float"""
         raise NotImplementedError
@@ -324,6 +964,22 @@ class Dataset(MetaDataset):
         """
         raise NotImplementedError
 
+    def get_columns_medians(self, columns):
+        """Returns: Dict[str, any], the median of each of columns; backends computing the medians of several
+        columns in a single pass override this"""
+        return {column: self.get_column_median(column) for column in columns}
+
+    def get_columns_quantiles(self, column_quantiles, allow_relative_error=False):
+        """Returns: Dict[str, List[any]], the quantiles of each column of column_quantiles, a dictionary mapping
+        columns to their quantiles; backends computing the quantiles of several columns in a single pass override
+        this"""
+        return {
+            column: self.get_column_quantiles(
+                column, tuple(quantiles), allow_relative_error=allow_relative_error
+            )
+            for column, quantiles in column_quantiles.items()
+        }
+
     def get_column_stdev(self, column):
         """Returns: float"""
         raise NotImplementedError
@@ -401,6 +1057,63 @@ class Dataset(MetaDataset):
         """Returns: int"""
         raise NotImplementedError
 
+    def get_column_sample_values(self, column, sample_size, seed=None):
+        """Get a random sample of the non-null values of a column, loaded into memory.
+
+        Args:
+            column: the name of the column
+            sample_size (int): the maximum number of values to sample; all non-null values are returned if the \
+                column holds no more than that
+            seed (int or None): a seed for the random number generator, where the backend supports one
+
+        Returns:
+            np.ndarray: the sampled values, in no particular order
+        """
+        raise NotImplementedError
+
+    def get_column_quantile_sketch(self, column, k=200):
+        """Get a mergeable sketch of the non-null values of a numeric column, estimating their quantiles and ranks.
+
+        Args:
+            column: the name of the column
+            k (int): the accuracy parameter of the sketch; see QuantileSketch
+
+        Returns:
+            QuantileSketch
+        """
+        return self._build_column_sketch(column, QuantileSketch(k=k))
+
+    def get_column_distinct_count_sketch(self, column, p=12):
+        """Get a mergeable sketch of the non-null values of a column, estimating their number of distinct values.
+
+        Args:
+            column: the name of the column
+            p (int): the precision of the sketch; see DistinctCountSketch
+
+        Returns:
+            DistinctCountSketch
+        """
+        return self._build_column_sketch(column, DistinctCountSketch(p=p))
+
+    def get_column_frequent_values_sketch(self, column, capacity=100):
+        """Get a mergeable sketch of the non-null values of a column, counting the most frequent ones.
+
+        Args:
+            column: the name of the column
+            capacity (int): the maximum number of values counted; see FrequentValuesSketch
+
+        Returns:
+            FrequentValuesSketch
+        """
+        return self._build_column_sketch(
+            column, FrequentValuesSketch(capacity=capacity)
+        )
+
+    def _build_column_sketch(self, column, sketch):
+        """Update sketch with the non-null values of column, SKETCH_CHUNK_SIZE values at a time, and return it (or
+        the merged sketches of the parts of the dataset, for backends computing them in parallel)."""
+        raise NotImplementedError
+
     def get_crosstab(
         self,
         column_A,
@@ -3815,6 +4528,9 @@ class Dataset(MetaDataset):
             },
         }
 
+    # noinspection PyUnusedLocal
+    @DocInherit
+    @MetaDataset.column_aggregate_expectation
     def expect_column_bootstrapped_ks_test_p_value_to_be_greater_than(
         self,
         column,
@@ -3822,6 +4538,7 @@ class Dataset(MetaDataset):
         p=0.05,
         bootstrap_samples=None,
         bootstrap_sample_size=None,
+        seed=None,
         result_format=None,
         include_config=True,
         catch_exceptions=None,
@@ -3855,6 +4572,9 @@ class Dataset(MetaDataset):
             bootstrap_sample_size (int): \
                 The number of samples to take from the column for each bootstrap. A larger sample will increase the \
                 specificity of the test. Defaults to 2 * len(partition_object['weights'])
+            seed (int or None): \
+                A seed for the random number generator drawing the bootstrap samples, making the result \
+                reproducible. Defaults to None, which uses numpy's global random state.
 
         Other Parameters:
             result_format (str or None): \
@@ -3903,7 +4623,99 @@ class Dataset(MetaDataset):
                 }
 
         """
-        raise NotImplementedError
+        if not is_valid_continuous_partition_object(partition_object):
+            raise ValueError("Invalid continuous partition object.")
+
+        if (partition_object["bins"][0] == -np.inf) or (
+            partition_object["bins"][-1] == np.inf
+        ):
+            raise ValueError("Partition endpoints must be finite.")
+
+        if (
+            "tail_weights" in partition_object
+            and np.sum(partition_object["tail_weights"]) > 0
+        ):
+            raise ValueError(
+                "Partition cannot have tail weights -- endpoints must be finite."
+            )
+
+        test_cdf = np.append(np.array([0]), np.cumsum(partition_object["weights"]))
+
+        if bootstrap_samples is None:
+            bootstrap_samples = 1000
+
+        if bootstrap_sample_size is None:
+            bootstrap_sample_size = len(partition_object["weights"]) * 2
+
+        # Backends not holding the column in memory sample it into memory once, as many values as the bootstrap
+        # draws in total, and draw the bootstrap samples from that sample.
+        sample_values = self.get_column_sample_values(
+            column, bootstrap_samples * bootstrap_sample_size, seed
+        )
+        results = bootstrapped_ks_test_p_values(
+            sample_values,
+            partition_object,
+            bootstrap_samples,
+            bootstrap_sample_size,
+            seed,
+        )
+
+        test_result = (1 + int(np.sum(results >= p))) / (bootstrap_samples + 1)
+
+        bins = partition_object["bins"]
+        nonnull_count = self.get_column_nonnull_count(column)
+        hist = np.array(self.get_column_hist(column, tuple(bins)))
+        below_partition = self.get_column_count_in_range(
+            column, max_val=bins[0], strict_max=True
+        )
+        above_partition = self.get_column_count_in_range(
+            column, min_val=bins[-1], strict_min=True
+        )
+
+        # Expand observed partition to report, if necessary
+        if below_partition > 0 and above_partition > 0:
+            observed_bins = (
+                [self.get_column_min(column)] + bins + [self.get_column_max(column)]
+            )
+            observed_weights = (
+                np.concatenate(([below_partition], hist, [above_partition]))
+                / nonnull_count
+            )
+        elif below_partition > 0:
+            observed_bins = [self.get_column_min(column)] + bins
+            observed_weights = np.concatenate(([below_partition], hist)) / nonnull_count
+        elif above_partition > 0:
+            observed_bins = bins + [self.get_column_max(column)]
+            observed_weights = np.concatenate((hist, [above_partition])) / nonnull_count
+        else:
+            observed_bins = bins
+            observed_weights = hist / nonnull_count
+
+        observed_cdf_values = np.cumsum(observed_weights)
+
+        return {
+            "success": test_result > p,
+            "result": {
+                "observed_value": test_result,
+                "details": {
+                    "bootstrap_samples": bootstrap_samples,
+                    "bootstrap_sample_size": bootstrap_sample_size,
+                    "observed_partition": {
+                        "bins": observed_bins,
+                        "weights": observed_weights.tolist(),
+                    },
+                    "expected_partition": {
+                        "bins": bins,
+                        "weights": partition_object["weights"],
+                    },
+                    "observed_cdf": {
+                        "x": observed_bins,
+                        "cdf_values": [0] + observed_cdf_values.tolist(),
+                    },
+                    "expected_cdf": {"x": bins, "cdf_values": test_cdf.tolist(),},
+                },
+            },
+        }
 
     # noinspection PyUnusedLocal
     @DocInherit
@@ -3916,6 +4728,7 @@ class Dataset(MetaDataset):
         tail_weight_holdout=0,
         internal_weight_holdout=0,
         bucketize_data=True,
+        use_sketches=False,
         result_format=None,
         include_config=True,
         catch_exceptions=None,
@@ -3961,7 +4774,10 @@ class Dataset(MetaDataset):
             bucketize_data (boolean): If True, then continuous data will be bucketized before evaluation. Setting
                 this parameter to false allows evaluation of KL divergence with a None partition object for profiling
                 against discrete data.
-
+            use_sketches (boolean): If True, the observed partition is estimated from mergeable sketches of the \
+                column, which are computed in bounded memory and can be merged across partitions (see \
+                partition_metric_store): a QuantileSketch for continuous partitions, and a FrequentValuesSketch for \
+                categorical partitions, holding the most frequent values of the column.
 
         Other Parameters:
             result_format (str or None): \
@@ -4032,11 +4848,11 @@ class Dataset(MetaDataset):
         if partition_object is None:
             if bucketize_data:
                 partition_object = build_continuous_partition_object(
-                    dataset=self, column=column
+                    dataset=self, column=column, use_sketches=use_sketches
                 )
             else:
                 partition_object = build_categorical_partition_object(
-                    dataset=self, column=column
+                    dataset=self, column=column, use_sketches=use_sketches
                 )
 
         if not is_valid_partition_object(partition_object):
@@ -4076,9 +4892,13 @@ class Dataset(MetaDataset):
                 )
 
             # Data are expected to be discrete, use value_counts
-            observed_weights = self.get_column_value_counts(
-                column
-            ) / self.get_column_nonnull_count(column)
+            if use_sketches:
+                sketch = self.get_column_frequent_values_sketch(column)
+                observed_weights = sketch.get_frequencies() / sketch.count
+            else:
+                observed_weights = self.get_column_value_counts(
+                    column
+                ) / self.get_column_nonnull_count(column)
             expected_weights = pd.Series(
                 partition_object["weights"],
                 index=partition_object["values"],
@@ -4140,24 +4960,37 @@ class Dataset(MetaDataset):
                     "KL Divergence cannot be computed with a continuous partition object and the bucketize_data "
                     "parameter set to false."
                 )
-            # Build the histogram first using expected bins so that the largest bin is >=
-            hist = np.array(
-                self.get_column_hist(column, tuple(partition_object["bins"]))
-            )
-            # np.histogram(column, partition_object['bins'], density=False)
-            bin_edges = partition_object["bins"]
-            # Add in the frequencies observed above or below the provided partition
-            # below_partition = len(np.where(column < partition_object['bins'][0])[0])
-            # above_partition = len(np.where(column > partition_object['bins'][-1])[0])
-            below_partition = self.get_column_count_in_range(
-                column, max_val=partition_object["bins"][0]
-            )
-            above_partition = self.get_column_count_in_range(
-                column, min_val=partition_object["bins"][-1], strict_min=True
-            )
+            if use_sketches:
+                # the histogram and the frequencies outside of the partition are estimated from ranks in the sketch
+                sketch = self.get_column_quantile_sketch(column)
+                hist = np.array(sketch.get_hist(partition_object["bins"]))
+                below_partition = sketch.get_ranks([partition_object["bins"][0]])[0]
+                above_partition = (
+                    sketch.count
+                    - sketch.get_ranks([partition_object["bins"][-1]], inclusive=True)[
+                        0
+                    ]
+                )
+                nonnull_count = sketch.count
+            else:
+                # Build the histogram first using expected bins so that the largest bin is >=
+                hist = np.array(
+                    self.get_column_hist(column, tuple(partition_object["bins"]))
+                )
+                # np.histogram(column, partition_object['bins'], density=False)
+                # Add in the frequencies observed above or below the provided partition
+                # below_partition = len(np.where(column < partition_object['bins'][0])[0])
+                # above_partition = len(np.where(column > partition_object['bins'][-1])[0])
+                below_partition = self.get_column_count_in_range(
+                    column, max_val=partition_object["bins"][0]
+                )
+                above_partition = self.get_column_count_in_range(
+                    column, min_val=partition_object["bins"][-1], strict_min=True
+                )
+                nonnull_count = self.get_column_nonnull_count(column)
 
             # Observed Weights is just the histogram values divided by the total number of observations
-            observed_weights = np.array(hist) / self.get_column_nonnull_count(column)
+            observed_weights = np.array(hist) / nonnull_count
 
             # Adjust expected_weights to account for tail_weight and internal_weight
             if "tail_weights" in partition_object:
@@ -4233,17 +5066,11 @@ class Dataset(MetaDataset):
                 expected_weights = expected_weights[1:]
 
                 comb_observed_weights = np.concatenate(
-                    (
-                        observed_weights,
-                        [above_partition / self.get_column_nonnull_count(column)],
-                    )
+                    (observed_weights, [above_partition / nonnull_count],)
                 )
                 # Set aside left tail weight and above partition weight
                 observed_tail_weights = np.concatenate(
-                    (
-                        [observed_weights[0]],
-                        [above_partition / self.get_column_nonnull_count(column)],
-                    )
+                    ([observed_weights[0]], [above_partition / nonnull_count],)
                 )
                 # Remove left tail weight from main observed_weights
                 observed_weights = observed_weights[1:]
@@ -4269,17 +5096,11 @@ class Dataset(MetaDataset):
                 expected_weights = expected_weights[:-1]
 
                 comb_observed_weights = np.concatenate(
-                    (
-                        [below_partition / self.get_column_nonnull_count(column)],
-                        observed_weights,
-                    )
+                    ([below_partition / nonnull_count], observed_weights,)
                 )
                 # Set aside right tail weight and below partition weight
                 observed_tail_weights = np.concatenate(
-                    (
-                        [below_partition / self.get_column_nonnull_count(column)],
-                        [observed_weights[-1]],
-                    )
+                    ([below_partition / nonnull_count], [observed_weights[-1]],)
                 )
                 # Remove right tail weight from main observed_weights
                 observed_weights = observed_weights[:-1]
@@ -4310,15 +5131,16 @@ class Dataset(MetaDataset):
 
                 comb_observed_weights = np.concatenate(
                     (
-                        [below_partition / self.get_column_nonnull_count(column)],
+                        [below_partition / nonnull_count],
                         observed_weights,
-                        [above_partition / self.get_column_nonnull_count(column)],
+                        [above_partition / nonnull_count],
                     )
                 )
                 # Tail weights are just the counts on either side of the partition
-                observed_tail_weights = np.concatenate(
-                    ([below_partition], [above_partition])
-                ) / self.get_column_nonnull_count(column)
+                observed_tail_weights = (
+                    np.concatenate(([below_partition], [above_partition]))
+                    / nonnull_count
+                )
 
                 # Main expected_weights and main observed weights had no tail_weights, so nothing needs to be removed.
 
@@ -1,6 +1,7 @@
 import inspect
 import json
 import logging
+import re
 import warnings
 from datetime import datetime
 from functools import wraps
@@ -13,11 +14,17 @@ from dateutil.parser import parse
 from scipy import stats
 
 from great_expectations.core import ExpectationConfiguration
+from great_expectations.core.sketch import SKETCH_CHUNK_SIZE
 from great_expectations.data_asset import DataAsset
 from great_expectations.data_asset.util import DocInherit, parse_result_format
 from great_expectations.dataset.util import (
+    GE_CONDITION_PARSER,
     _scipy_distribution_positional_args_from_dict,
+    bootstrapped_ks_test_p_values,
+    build_row_condition,
+    compile_regex_list,
     is_valid_continuous_partition_object,
+    parse_row_condition,
     validate_distribution_parameters,
 )
 
@@ -25,6 +32,17 @@ from .dataset import Dataset
 
 logger = logging.getLogger(__name__)
 
+try:
+    from pandas._libs.tslibs.parsing import guess_datetime_format
+except ImportError:
+    guess_datetime_format = None
+
+# formats of complete dates, written with directives and separators only, for which pandas parses strings into the
+# same datetimes as dateutil; dateutil fills the parts missing from partial dates, such as "2020", from today's date
+_COMPLETE_DATETIME_FORMAT_PATTERN = re.compile(
+    r"(?=.*%Y)(?=.*%d)(?=.*%[mbB])(?:%[A-Za-z]|[^A-Za-z%]|T)*"
+)
+
 
 class MetaPandasDataset(Dataset):
     """MetaPandasDataset is a thin layer between Dataset and PandasDataset.
@@ -71,13 +89,13 @@ class MetaPandasDataset(Dataset):
 
             result_format = parse_result_format(result_format)
             if row_condition and self._supports_row_condition:
-                data = self._apply_row_condition(
-                    row_condition=row_condition, condition_parser=condition_parser
-                )
+                series = self._apply_row_condition(
+                    row_condition=row_condition,
+                    condition_parser=condition_parser,
+                    columns=[column],
+                )[column]
             else:
-                data = self
-
-            series = data[column]
+                series = self[column]
             if func.__name__ in [
                 "expect_column_values_to_not_be_null",
                 "expect_column_values_to_be_null",
@@ -102,12 +120,18 @@ class MetaPandasDataset(Dataset):
             boolean_mapped_success_values = func(self, nonnull_values, *args, **kwargs)
             success_count = np.count_nonzero(boolean_mapped_success_values)
 
-            unexpected_list = list(
-                nonnull_values[boolean_mapped_success_values == False]
-            )
-            unexpected_index_list = list(
-                nonnull_values[boolean_mapped_success_values == False].index
+            boolean_mapped_unexpected_values = np.asarray(
+                boolean_mapped_success_values == False
             )
+            if "output_strftime_format" in kwargs:
+                # all unexpected values are formatted, so that they are counted as formatted
+                unexpected_positions = np.flatnonzero(boolean_mapped_unexpected_values)
+            else:
+                unexpected_positions = self._get_reported_unexpected_positions(
+                    result_format, boolean_mapped_unexpected_values
+                )
+            unexpected_list = list(nonnull_values.iloc[unexpected_positions])
+            unexpected_index_list = list(nonnull_values.index[unexpected_positions])
 
             if "output_strftime_format" in kwargs:
                 output_strftime_format = kwargs["output_strftime_format"]
@@ -123,6 +147,15 @@ class MetaPandasDataset(Dataset):
                         )
                 unexpected_list = parsed_unexpected_list
 
+            # the most common unexpected values are counted with numpy, unless they are formatted
+            unexpected_values = None
+            if (
+                result_format["result_format"] in ["SUMMARY", "COMPLETE"]
+                and result_format["partial_unexpected_count"] > 0
+                and "output_strftime_format" not in kwargs
+            ):
+                unexpected_values = nonnull_values[boolean_mapped_unexpected_values]
+
             success, percent_success = self._calc_map_expectation_success(
                 success_count, nonnull_count, mostly
             )
@@ -132,9 +165,10 @@ class MetaPandasDataset(Dataset):
                 success,
                 element_count,
                 nonnull_count,
-                len(unexpected_list),
+                int(np.count_nonzero(boolean_mapped_unexpected_values)),
                 unexpected_list,
                 unexpected_index_list,
+                unexpected_values=unexpected_values,
             )
 
             # FIXME Temp fix for result format
@@ -184,8 +218,13 @@ class MetaPandasDataset(Dataset):
             if result_format is None:
                 result_format = self.default_expectation_args["result_format"]
 
+            result_format = parse_result_format(result_format)
             if row_condition:
-                self = self.query(row_condition).reset_index(drop=True)
+                self = self._apply_row_condition(
+                    row_condition=row_condition,
+                    condition_parser=condition_parser or "pandas",
+                    columns=[column_A, column_B],
+                )
 
             series_A = self[column_A]
             series_B = self[column_B]
@@ -195,7 +234,7 @@ class MetaPandasDataset(Dataset):
             elif ignore_row_if == "either_value_is_missing":
                 boolean_mapped_null_values = series_A.isnull() | series_B.isnull()
             elif ignore_row_if == "never":
-                boolean_mapped_null_values = series_A.map(lambda x: False)
+                boolean_mapped_null_values = pd.Series(False, index=series_A.index)
             else:
                 raise ValueError("Unknown value of ignore_row_if: %s", (ignore_row_if,))
 
@@ -209,39 +248,35 @@ class MetaPandasDataset(Dataset):
 
             nonnull_values_A = series_A[boolean_mapped_null_values == False]
             nonnull_values_B = series_B[boolean_mapped_null_values == False]
-            nonnull_values = [
-                value_pair
-                for value_pair in zip(list(nonnull_values_A), list(nonnull_values_B))
-            ]
 
             boolean_mapped_success_values = func(
                 self, nonnull_values_A, nonnull_values_B, *args, **kwargs
             )
             success_count = boolean_mapped_success_values.sum()
 
-            unexpected_list = [
-                value_pair
-                for value_pair in zip(
-                    list(
-                        series_A[
-                            (boolean_mapped_success_values == False)
-                            & (boolean_mapped_null_values == False)
-                        ]
-                    ),
-                    list(
-                        series_B[
-                            (boolean_mapped_success_values == False)
-                            & (boolean_mapped_null_values == False)
-                        ]
-                    ),
+            boolean_mapped_unexpected_values = ~boolean_mapped_null_values.values
+            boolean_mapped_unexpected_values[
+                boolean_mapped_unexpected_values
+            ] = np.asarray(boolean_mapped_success_values == False)
+
+            unexpected_positions = self._get_reported_unexpected_positions(
+                result_format, boolean_mapped_unexpected_values
+            )
+            unexpected_list = list(
+                zip(
+                    list(series_A.iloc[unexpected_positions]),
+                    list(series_B.iloc[unexpected_positions]),
                 )
-            ]
-            unexpected_index_list = list(
-                series_A[
-                    (boolean_mapped_success_values == False)
-                    & (boolean_mapped_null_values == False)
-                ].index
             )
+            unexpected_index_list = list(series_A.index[unexpected_positions])
+
+            # the most common unexpected value pairs are counted with numpy
+            unexpected_values = None
+            if result_format["result_format"] in ["SUMMARY", "COMPLETE"]:
+                unexpected_values = (
+                    series_A[boolean_mapped_unexpected_values],
+                    series_B[boolean_mapped_unexpected_values],
+                )
 
             success, percent_success = self._calc_map_expectation_success(
                 success_count, nonnull_count, mostly
@@ -252,9 +287,10 @@ class MetaPandasDataset(Dataset):
                 success,
                 element_count,
                 nonnull_count,
-                len(unexpected_list),
+                int(np.count_nonzero(boolean_mapped_unexpected_values)),
                 unexpected_list,
                 unexpected_index_list,
+                unexpected_values=unexpected_values,
             )
 
             return return_obj
@@ -288,8 +324,13 @@ class MetaPandasDataset(Dataset):
             if result_format is None:
                 result_format = self.default_expectation_args["result_format"]
 
+            result_format = parse_result_format(result_format)
             if row_condition:
-                self = self.query(row_condition).reset_index(drop=True)
+                self = self._apply_row_condition(
+                    row_condition=row_condition,
+                    condition_parser=condition_parser or "pandas",
+                    columns=column_list,
+                )
 
             test_df = self[column_list]
 
@@ -298,22 +339,31 @@ class MetaPandasDataset(Dataset):
             elif ignore_row_if == "any_value_is_missing":
                 boolean_mapped_skip_values = test_df.isnull().any(axis=1)
             elif ignore_row_if == "never":
-                boolean_mapped_skip_values = pd.Series([False] * len(test_df))
+                boolean_mapped_skip_values = pd.Series(False, index=test_df.index)
             else:
                 raise ValueError("Unknown value of ignore_row_if: %s", (ignore_row_if,))
 
+            # avoid copying the frame again when no rows are skipped
             boolean_mapped_success_values = func(
-                self, test_df[boolean_mapped_skip_values == False], *args, **kwargs
+                self,
+                test_df[boolean_mapped_skip_values == False]
+                if boolean_mapped_skip_values.any()
+                else test_df,
+                *args,
+                **kwargs,
             )
             success_count = boolean_mapped_success_values.sum()
             nonnull_count = (~boolean_mapped_skip_values).sum()
             element_count = len(test_df)
 
-            unexpected_list = test_df[
-                (boolean_mapped_skip_values == False)
-                & (boolean_mapped_success_values == False)
-            ]
-            unexpected_index_list = list(unexpected_list.index)
+            boolean_mapped_unexpected_values = ~boolean_mapped_skip_values.values
+            boolean_mapped_unexpected_values[
+                boolean_mapped_unexpected_values
+            ] = np.asarray(boolean_mapped_success_values == False)
+            unexpected_positions = self._get_reported_unexpected_positions(
+                result_format, boolean_mapped_unexpected_values
+            )
+            unexpected_rows = test_df.iloc[unexpected_positions]
 
             success, percent_success = self._calc_map_expectation_success(
                 success_count, nonnull_count, mostly
@@ -324,9 +374,9 @@ class MetaPandasDataset(Dataset):
                 success,
                 element_count,
                 nonnull_count,
-                len(unexpected_list),
-                unexpected_list.to_dict(orient="records"),
-                unexpected_index_list,
+                int(np.count_nonzero(boolean_mapped_unexpected_values)),
+                unexpected_rows.to_dict(orient="records"),
+                list(unexpected_rows.index),
             )
 
             return return_obj
@@ -384,6 +434,15 @@ Notes:
         "_expectation_suite",
         "_config",
         "caching",
+        "_prefetched_metrics",
+        "_metric_cache",
+        "_data_fingerprint",
+        "_row_condition_masks",
+        "_partition_metric_store",
+        "_partition_column",
+        "_partition_fingerprints",
+        "_partition_datasets",
+        "_merged_metrics",
         "default_expectation_args",
         "discard_subset_failing_expectations",
     ]
@@ -417,17 +476,175 @@ Notes:
         self.discard_subset_failing_expectations = kwargs.get(
             "discard_subset_failing_expectations", False
         )
+        self._row_condition_masks = {}
+
+    def _compute_data_fingerprint(self):
+        if "pandas_data_fingerprint_sampled" in self._batch_markers:
+            # the frame is too large to fingerprint in full, so its metrics are not cached
+            return None
+        fingerprint = self._batch_markers.get("pandas_data_fingerprint")
+        if fingerprint is None:
+            from great_expectations.datasource.util import fingerprint_pandas_dataframe
+
+            fingerprint = fingerprint_pandas_dataframe(self)
+        return fingerprint
+
+    def _get_partition_fingerprints(self, partition_column):
+        """Fingerprints each partition by its row count and the sum of the hashes of its rows, which are computed
+        for all partitions at once."""
+        codes, partition_values = pd.factorize(self[partition_column])
+        # null values have code -1, and are counted in the first slot
+        row_counts = np.bincount(codes + 1, minlength=len(partition_values) + 1)
+        try:
+            row_hashes = pd.util.hash_pandas_object(
+                pd.DataFrame(self), index=False
+            ).values
+        except TypeError:
+            # unhashable values, such as lists
+            row_hashes = None
+        if row_hashes is not None:
+            hash_sums = np.zeros(len(partition_values) + 1, dtype=np.uint64)
+            np.add.at(hash_sums, codes + 1, row_hashes)
+
+        partition_fingerprints = {}
+        for position, partition_value in enumerate([None] + list(partition_values)):
+            if row_counts[position] == 0:
+                continue
+            if isinstance(partition_value, np.generic):
+                partition_value = partition_value.item()
+            if row_hashes is None:
+                partition_fingerprints[partition_value] = None
+            else:
+                partition_fingerprints[partition_value] = "%d:%d" % (
+                    row_counts[position],
+                    hash_sums[position],
+                )
+        return partition_fingerprints
+
+    def _get_partition_dataset(self, partition_column, partition_value):
+        if partition_value is None:
+            mask = self[partition_column].isnull()
+        else:
+            mask = self[partition_column] == partition_value
+        return self.loc[np.asarray(mask, dtype=bool)]
+
+    def _get_row_condition_mask(self, row_condition, condition_parser):
+        """Evaluate row_condition to a boolean numpy mask over the rows of the dataset.
+
+        When caching is enabled, masks are kept per (row_condition, condition_parser), so that every
+        expectation sharing a condition reuses the same mask instead of evaluating it again.
+        """
+        key = (row_condition, condition_parser)
+        if self.caching and key in self._row_condition_masks:
+            return self._row_condition_masks[key]
+
+        if condition_parser == GE_CONDITION_PARSER:
+            mask = build_row_condition(
+                parse_row_condition(row_condition),
+                lambda name: self[name],
+                and_=lambda *operands: np.logical_and.reduce(operands),
+                or_=lambda *operands: np.logical_or.reduce(operands),
+                not_=np.logical_not,
+                is_null=lambda series: series.isnull(),
+            )
+        else:
+            mask = self.eval(row_condition, parser=condition_parser)
+        mask = np.asarray(mask, dtype=bool)
+        if self.caching:
+            self._row_condition_masks[key] = mask
+        return mask
 
-    def _apply_row_condition(self, row_condition, condition_parser):
-        if condition_parser not in ["python", "pandas"]:
+    def _apply_row_condition(self, row_condition, condition_parser, columns=None):
+        """Return the rows of the dataset satisfying row_condition, re-indexed from 0.
+
+        Only the given columns (all columns if None) are copied into the result.
+        """
+        if condition_parser not in ["python", "pandas", GE_CONDITION_PARSER]:
             raise ValueError(
                 "condition_parser is required when setting a row_condition,"
-                " and must be 'python' or 'pandas'"
+                " and must be 'python' or 'pandas' (or '{}')".format(
+                    GE_CONDITION_PARSER
+                )
+            )
+
+        mask = self._get_row_condition_mask(row_condition, condition_parser)
+        if columns is None:
+            data = self.loc[mask]
+        else:
+            data = self.loc[mask, list(dict.fromkeys(columns))]
+        # data is already a new frame, so its index can be replaced without the copy made by reset_index
+        data.index = pd.RangeIndex(len(data))
+        return data
+
+    @staticmethod
+    def _get_reported_unexpected_positions(
+        result_format, boolean_mapped_unexpected_values
+    ):
+        """Returns the positions of the unexpected values a map expectation reports: all of them for the COMPLETE
+        result_format, otherwise only the first partial_unexpected_count, so that only those become Python objects.
+        """
+        unexpected_positions = np.flatnonzero(boolean_mapped_unexpected_values)
+        if result_format["result_format"] == "COMPLETE":
+            return unexpected_positions
+        return unexpected_positions[: result_format["partial_unexpected_count"]]
+
+    def _get_most_common_values(self, values, n):
+        """Count the n most common values of a Series, or of the value tuples of a tuple of Series, with numpy.
+
+        Values are factorized in order of first occurrence and counted with bincount, and argpartition selects the
+        n largest counts, so ties are broken by first occurrence as with Counter.most_common, and only the n most
+        common values become Python objects.
+        """
+        if not isinstance(values, (pd.Series, tuple)):
+            return super()._get_most_common_values(values, n)
+        series_tuple = values if isinstance(values, tuple) else (values,)
+        codes = np.zeros(len(series_tuple[0]), dtype=np.int64)
+        for series in series_tuple:
+            series_codes, series_uniques = pd.factorize(series.values)
+            if (series_codes < 0).any():
+                # factorize leaves out missing values, which Counter counts by identity
+                return super()._get_most_common_values(
+                    list(zip(*series_tuple))
+                    if isinstance(values, tuple)
+                    else list(values),
+                    n,
+                )
+            codes = codes * len(series_uniques) + series_codes
+        if len(series_tuple) > 1:
+            codes, _ = pd.factorize(codes)
+        if len(codes) == 0 or n <= 0:
+            return []
+
+        counts = np.bincount(codes)
+        if len(counts) > n:
+            threshold = counts[np.argpartition(-counts, n - 1)[n - 1]]
+            larger = np.flatnonzero(counts > threshold)
+            selected = np.concatenate(
+                [larger, np.flatnonzero(counts == threshold)[: n - len(larger)]]
             )
         else:
-            return self.query(row_condition, parser=condition_parser).reset_index(
-                drop=True
+            selected = np.arange(len(counts))
+        selected = selected[np.argsort(-counts[selected], kind="stable")]
+
+        # codes are numbered in order of first occurrence, so the first occurrences of the codes are ordered too
+        first_positions = np.flatnonzero(~pd.Series(codes).duplicated().values)[
+            selected
+        ]
+        if isinstance(values, tuple):
+            most_common_values = list(
+                zip(*[list(series.iloc[first_positions]) for series in series_tuple])
             )
+        else:
+            most_common_values = list(values.iloc[first_positions])
+        return list(zip(most_common_values, counts[selected].tolist()))
+
+    def get_sample_dataset(self, fraction, seed=None):
+        return self.__class__(
+            pd.DataFrame(self)
+            .sample(frac=fraction, random_state=seed)
+            .reset_index(drop=True),
+            caching=self.caching,
+        )
 
     def get_row_count(self):
         return self.shape[0]
@@ -468,6 +685,9 @@ Notes:
         if collate is not None:
             raise ValueError("collate parameter is not supported in PandasDataset")
         counts = self[column].value_counts()
+        if pd.api.types.is_categorical_dtype(self[column]):
+            # categoricals also count the categories which no value of the column holds
+            counts = counts[counts > 0]
         if sort == "value":
             try:
                 counts.sort_index(inplace=True)
@@ -528,6 +748,18 @@ Notes:
                 result = result[result <= max_val]
         return len(result)
 
+    def get_column_sample_values(self, column, sample_size, seed=None):
+        values = self[column].dropna()
+        if len(values) > sample_size:
+            values = values.sample(n=sample_size, random_state=seed)
+        return values.values
+
+    def _build_column_sketch(self, column, sketch):
+        values = self[column].dropna()
+        for start in range(0, len(values), SKETCH_CHUNK_SIZE):
+            sketch.update(values.iloc[start : start + SKETCH_CHUNK_SIZE])
+        return sketch
+
     def get_crosstab(
         self,
         column_A,
@@ -1016,36 +1248,44 @@ Notes:
         if type_list is None:
             success = True
         else:
-            comp_types = []
-            for type_ in type_list:
-                try:
-                    comp_types.append(np.dtype(type_).type)
-                except TypeError:
-                    try:
-                        pd_type = getattr(pd, type_)
-                        if isinstance(pd_type, type):
-                            comp_types.append(pd_type)
-                    except AttributeError:
-                        pass
-
-                    try:
-                        pd_type = getattr(pd.core.dtypes.dtypes, type_)
-                        if isinstance(pd_type, type):
-                            comp_types.append(pd_type)
-                    except AttributeError:
-                        pass
-
-                native_type = self._native_type_type_map(type_)
-                if native_type is not None:
-                    comp_types.extend(native_type)
-
-            success = self[column].dtype.type in comp_types
+            success = self[column].dtype.type in self._get_dtype_types(type_list)
 
         return {
             "success": success,
             "result": {"observed_value": self[column].dtype.type.__name__},
         }
 
+    def _get_dtype_types(self, type_list):
+        comp_types = []
+        for type_ in type_list:
+            try:
+                comp_types.append(np.dtype(type_).type)
+            except TypeError:
+                try:
+                    pd_type = getattr(pd, type_)
+                    if isinstance(pd_type, type):
+                        comp_types.append(pd_type)
+                except AttributeError:
+                    pass
+
+                try:
+                    pd_type = getattr(pd.core.dtypes.dtypes, type_)
+                    if isinstance(pd_type, type):
+                        comp_types.append(pd_type)
+                except AttributeError:
+                    pass
+
+            native_type = self._native_type_type_map(type_)
+            if native_type is not None:
+                comp_types.extend(native_type)
+        return comp_types
+
+    def _column_type_in_type_list(self, column, type_list):
+        # values of "object" columns may be of any type and have to be checked individually
+        if self[column].dtype == "object":
+            return None
+        return self[column].dtype.type in self._get_dtype_types(type_list)
+
     @MetaPandasDataset.column_map_expectation
     def _expect_column_values_to_be_in_type_list__map(
         self,
@@ -1173,10 +1413,33 @@ Notes:
             if max_value:
                 max_value = parse(max_value)
 
-            try:
-                temp_column = column.map(parse)
-            except TypeError:
-                temp_column = column
+            temp_column = None
+            datetime_format = None
+            if (
+                guess_datetime_format is not None
+                and pd.api.types.infer_dtype(column, skipna=False) == "string"
+            ):
+                datetime_format = guess_datetime_format(column.iloc[0])
+            if (
+                datetime_format is not None
+                and _COMPLETE_DATETIME_FORMAT_PATTERN.fullmatch(datetime_format)
+            ):
+                # parse all strings at once when they share a format of complete dates; other values, and values
+                # pandas cannot parse in bulk (or into a single datetime64 dtype), are parsed one by one below
+                try:
+                    temp_column = pd.to_datetime(column, format=datetime_format)
+                except (ValueError, TypeError, OverflowError):
+                    pass
+                if temp_column is not None and not (
+                    pd.api.types.is_datetime64_any_dtype(temp_column)
+                ):
+                    temp_column = None
+
+            if temp_column is None:
+                try:
+                    temp_column = column.map(parse)
+                except TypeError:
+                    temp_column = column
 
         else:
             temp_column = column
@@ -1184,6 +1447,12 @@ Notes:
         if min_value is not None and max_value is not None and min_value > max_value:
             raise ValueError("min_value cannot be greater than max_value")
 
+        between = self._get_values_between_vectorized(
+            temp_column, min_value, max_value, strict_min, strict_max
+        )
+        if between is not None:
+            return between
+
         def is_between(val):
             # TODO Might be worth explicitly defining comparisons between types (for example, between strings and ints).
             # Ensure types can be compared since some types in Python 3 cannot be logically compared.
@@ -1270,6 +1539,47 @@ Notes:
 
         return temp_column.map(is_between)
 
+    @staticmethod
+    def _get_values_between_vectorized(
+        column, min_value, max_value, strict_min, strict_max
+    ):
+        """Compare the values of column to min_value and max_value with vectorized comparisons.
+
+        Returns None, so that values are compared one by one, unless every value and bound is comparable without
+        a TypeError and with the same result as comparing Python objects: numeric columns with numeric bounds,
+        datetime columns with datetime bounds of the same time zone awareness, and columns of strings with string
+        bounds. Mixed-type columns and cross-type comparisons are always compared one by one.
+        """
+        bounds = [bound for bound in [min_value, max_value] if bound is not None]
+        dtype = column.dtype
+
+        if isinstance(dtype, np.dtype) and dtype.kind in "iufb":
+            if not all(
+                isinstance(bound, (int, float, np.integer, np.floating, np.bool_))
+                for bound in bounds
+            ):
+                return None
+        elif pd.api.types.is_datetime64_any_dtype(dtype):
+            is_tz_aware = getattr(dtype, "tz", None) is not None
+            if not all(
+                isinstance(bound, datetime)
+                and (bound.tzinfo is not None) == is_tz_aware
+                for bound in bounds
+            ):
+                return None
+        elif dtype == object and pd.api.types.infer_dtype(column) == "string":
+            if not all(isinstance(bound, str) for bound in bounds):
+                return None
+        else:
+            return None
+
+        between = pd.Series(True, index=column.index)
+        if min_value is not None:
+            between &= (column > min_value) if strict_min else (column >= min_value)
+        if max_value is not None:
+            between &= (column < max_value) if strict_max else (column <= max_value)
+        return between
+
     @DocInherit
     @MetaPandasDataset.column_map_expectation
     def expect_column_values_to_be_increasing(
@@ -1408,6 +1718,40 @@ Notes:
     ):
         return column.str.len() == value
 
+    @staticmethod
+    def _match_regex_list(column, regex_list, match_on="any"):
+        """Returns whether each value of column, as a string, matches any or all of the regexes of regex_list.
+
+        The column is converted to strings once for all regexes. With match_on "any", the regexes are combined into
+        a single alternation where possible; otherwise each regex is only searched for in the values not yet known to
+        match (or, for "all", not yet known not to match).
+        """
+        if match_on not in ["any", "all"]:
+            raise ValueError("match_on must be either 'any' or 'all'")
+        if len(regex_list) == 0:
+            raise ValueError("regex_list must contain at least one regex")
+
+        strings = column.astype(str)
+        compiled_regexes = compile_regex_list(
+            tuple(regex_list), combine=match_on == "any"
+        )
+        # positional masks, since the index of the column need not be unique
+        if match_on == "any":
+            matches = np.zeros(len(strings), dtype=bool)
+            for compiled_regex in compiled_regexes:
+                undecided = ~matches
+                matches[undecided] = (
+                    strings[undecided].str.contains(compiled_regex).values
+                )
+        else:
+            matches = np.ones(len(strings), dtype=bool)
+            for compiled_regex in compiled_regexes:
+                undecided = matches.copy()
+                matches[undecided] = (
+                    strings[undecided].str.contains(compiled_regex).values
+                )
+        return pd.Series(matches, index=column.index)
+
     @DocInherit
     @MetaPandasDataset.column_map_expectation
     def expect_column_values_to_match_regex(
@@ -1422,7 +1766,7 @@ Notes:
         catch_exceptions=None,
         meta=None,
     ):
-        return column.astype(str).str.contains(regex)
+        return self._match_regex_list(column, [regex])
 
     @DocInherit
     @MetaPandasDataset.column_map_expectation
@@ -1438,7 +1782,7 @@ Notes:
         catch_exceptions=None,
         meta=None,
     ):
-        return ~column.astype(str).str.contains(regex)
+        return ~self._match_regex_list(column, [regex])
 
     @DocInherit
     @MetaPandasDataset.column_map_expectation
@@ -1456,17 +1800,7 @@ Notes:
         meta=None,
     ):
 
-        regex_matches = []
-        for regex in regex_list:
-            regex_matches.append(column.astype(str).str.contains(regex))
-        regex_match_df = pd.concat(regex_matches, axis=1, ignore_index=True)
-
-        if match_on == "any":
-            return regex_match_df.any(axis="columns")
-        elif match_on == "all":
-            return regex_match_df.all(axis="columns")
-        else:
-            raise ValueError("match_on must be either 'any' or 'all'")
+        return self._match_regex_list(column, regex_list, match_on=match_on)
 
     @DocInherit
     @MetaPandasDataset.column_map_expectation
@@ -1482,12 +1816,7 @@ Notes:
         catch_exceptions=None,
         meta=None,
     ):
-        regex_matches = []
-        for regex in regex_list:
-            regex_matches.append(column.astype(str).str.contains(regex))
-        regex_match_df = pd.concat(regex_matches, axis=1, ignore_index=True)
-
-        return ~regex_match_df.any(axis="columns")
+        return ~self._match_regex_list(column, regex_list)
 
     @DocInherit
     @MetaPandasDataset.column_map_expectation
@@ -1662,6 +1991,7 @@ Notes:
         p=0.05,
         bootstrap_samples=None,
         bootstrap_sample_size=None,
+        seed=None,
         result_format=None,
         row_condition=None,
         condition_parser=None,
@@ -1669,7 +1999,7 @@ Notes:
         catch_exceptions=None,
         meta=None,
     ):
-        column = self[column]
+        column = self[column].dropna()
 
         if not is_valid_continuous_partition_object(partition_object):
             raise ValueError("Invalid continuous partition object.")
@@ -1690,9 +2020,6 @@ Notes:
 
         test_cdf = np.append(np.array([0]), np.cumsum(partition_object["weights"]))
 
-        def estimated_cdf(x):
-            return np.interp(x, partition_object["bins"], test_cdf)
-
         if bootstrap_samples is None:
             bootstrap_samples = 1000
 
@@ -1704,14 +2031,11 @@ Notes:
             # for nonoverlapping ranges.
             bootstrap_sample_size = len(partition_object["weights"]) * 2
 
-        results = [
-            stats.kstest(
-                np.random.choice(column, size=bootstrap_sample_size), estimated_cdf
-            )[1]
-            for _ in range(bootstrap_samples)
-        ]
+        results = bootstrapped_ks_test_p_values(
+            column, partition_object, bootstrap_samples, bootstrap_sample_size, seed
+        )
 
-        test_result = (1 + sum(x >= p for x in results)) / (bootstrap_samples + 1)
+        test_result = (1 + int(np.sum(results >= p))) / (bootstrap_samples + 1)
 
         hist, bin_edges = np.histogram(column, partition_object["bins"])
         below_partition = len(np.where(column < partition_object["bins"][0])[0])
@@ -1882,6 +2206,26 @@ Notes:
             meta=meta,
         )
 
+    @staticmethod
+    def _get_values_equal(column_A, column_B):
+        """Returns whether the values of two columns are equal in each row, as a numpy array. Like
+        DataFrame.nunique(dropna=False), NaN and NaT values equal each other but not None.
+        """
+        values_A = column_A.values
+        values_B = column_B.values
+        with warnings.catch_warnings():
+            # numpy warns before giving up on comparing arrays of incomparable dtypes
+            warnings.simplefilter("ignore")
+            try:
+                equal = values_A == values_B
+            except TypeError:
+                equal = None
+        if not isinstance(equal, np.ndarray):
+            values_A = column_A.astype(object).values
+            values_B = column_B.astype(object).values
+            equal = values_A == values_B
+        return equal | ((values_A != values_A) & (values_B != values_B))
+
     @DocInherit
     @MetaPandasDataset.multicolumn_map_expectation
     def expect_select_column_values_to_be_unique_within_record(
@@ -1894,9 +2238,19 @@ Notes:
         catch_exceptions=None,
         meta=None,
     ):
-        threshold = len(column_list.columns)
-        # Do not dropna here, since we have separately dealt with na in decorator
-        return column_list.nunique(dropna=False, axis=1) >= threshold
+        if not all(isinstance(dtype, np.dtype) for dtype in column_list.dtypes):
+            # extension dtypes hold missing values (pd.NA) which do not compare as booleans
+            threshold = len(column_list.columns)
+            # Do not dropna here, since we have separately dealt with na in decorator
+            return column_list.nunique(dropna=False, axis=1) >= threshold
+
+        # compare each pair of columns rather than counting the unique values of each row
+        unique = np.ones(len(column_list), dtype=bool)
+        columns = [column_list.iloc[:, idx] for idx in range(column_list.shape[1])]
+        for idx, column_A in enumerate(columns):
+            for column_B in columns[idx + 1 :]:
+                unique &= ~self._get_values_equal(column_A, column_B)
+        return pd.Series(unique, index=column_list.index)
 
     @DocInherit
     @MetaPandasDataset.multicolumn_map_expectation
@@ -1934,5 +2288,15 @@ Notes:
         meta=None,
     ):
         # Do not dropna here, since we have separately dealt with na in decorator
+        # Only rows whose combined hash repeats can be duplicates; compare just those rows to rule out hash collisions
+        duplicated = (
+            pd.util.hash_pandas_object(column_list, index=False)
+            .duplicated(keep=False)
+            .values
+        )
+        if duplicated.any():
+            duplicated[duplicated] = (
+                column_list[duplicated].duplicated(keep=False).values
+            )
         # Invert boolean so that duplicates are False and non-duplicates are True
-        return ~column_list.duplicated(keep=False)
+        return pd.Series(~duplicated, index=column_list.index)
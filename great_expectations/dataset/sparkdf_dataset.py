@@ -6,6 +6,7 @@ import warnings
 from collections import OrderedDict
 from datetime import datetime
 from functools import reduce, wraps
+from itertools import islice
 from typing import List
 
 import jsonschema
@@ -13,8 +14,16 @@ import numpy as np
 import pandas as pd
 from dateutil.parser import parse
 
+from great_expectations.core import expectationSuiteSchema
+from great_expectations.core.sketch import SKETCH_CHUNK_SIZE
 from great_expectations.data_asset import DataAsset
 from great_expectations.data_asset.util import DocInherit, parse_result_format
+from great_expectations.dataset.util import (
+    GE_CONDITION_PARSER,
+    build_row_condition,
+    combine_regex_list,
+    parse_row_condition,
+)
 
 from .dataset import Dataset
 from .pandas_dataset import PandasDataset
@@ -23,29 +32,33 @@ logger = logging.getLogger(__name__)
 
 try:
     import pyspark.sql.types as sparktypes
+    from pyspark import StorageLevel
     from pyspark.ml.feature import Bucketizer
     from pyspark.sql import SQLContext, Window
     from pyspark.sql.functions import (
         array,
+        avg,
         col,
         count,
         countDistinct,
         datediff,
         desc,
         expr,
-        isnan,
-        lag,
     )
+    from pyspark.sql.functions import hash as hash_
+    from pyspark.sql.functions import isnan, lag
     from pyspark.sql.functions import length as length_
+    from pyspark.sql.functions import lit
+    from pyspark.sql.functions import max as max_
+    from pyspark.sql.functions import min as min_
     from pyspark.sql.functions import (
-        lit,
         monotonically_increasing_id,
+        rand,
         stddev_samp,
         struct,
-        udf,
-        when,
-        year,
     )
+    from pyspark.sql.functions import sum as sum_
+    from pyspark.sql.functions import udf, when, year
 except ImportError as e:
     logger.debug(str(e))
     logger.debug(
@@ -81,8 +94,19 @@ class MetaSparkDFDataset(Dataset):
         @cls.expectation(argspec)
         @wraps(func)
         def inner_wrapper(
-            self, column, mostly=None, result_format=None, *args, **kwargs,
+            self,
+            column,
+            mostly=None,
+            result_format=None,
+            row_condition=None,
+            condition_parser=None,
+            *args,
+            **kwargs,
         ):
+            if row_condition:
+                self = self._apply_row_condition(
+                    row_condition=row_condition, condition_parser=condition_parser
+                )
             """
             This whole decorator is pending a re-write. Currently there is are huge performance issues
             when the # of unexpected elements gets large (10s of millions). Additionally, there is likely
@@ -107,10 +131,8 @@ class MetaSparkDFDataset(Dataset):
             else:
                 unexpected_count_limit = result_format["partial_unexpected_count"]
 
+            # the column is read from the rows persisted for the batch, if any, rather than cached again
             col_df = self.spark_df.select(col(eval_col))  # pyspark.sql.DataFrame
-
-            # a couple of tests indicate that caching here helps performance
-            col_df.persist()
             element_count = self.get_row_count()
 
             # FIXME temporary fix for missing/ignored value
@@ -196,8 +218,6 @@ class MetaSparkDFDataset(Dataset):
                 except KeyError:
                     pass
 
-            col_df.unpersist()
-
             return return_obj
 
         inner_wrapper.__name__ = func.__name__
@@ -222,9 +242,15 @@ class MetaSparkDFDataset(Dataset):
             mostly=None,
             ignore_row_if="both_values_are_missing",
             result_format=None,
+            row_condition=None,
+            condition_parser=None,
             *args,
             **kwargs,
         ):
+            if row_condition:
+                self = self._apply_row_condition(
+                    row_condition=row_condition, condition_parser=condition_parser
+                )
             # Rename column so we only have to handle dot notation here
             eval_col_A = "__eval_col_A_" + column_A.replace(".", "__").replace("`", "_")
             eval_col_B = "__eval_col_B_" + column_B.replace(".", "__").replace("`", "_")
@@ -250,8 +276,10 @@ class MetaSparkDFDataset(Dataset):
                 "__row", monotonically_increasing_id()
             )  # pyspark.sql.DataFrame
 
-            # a couple of tests indicate that caching here helps performance
-            cols_df.cache()
+            # the row ids joining the two columns must be the same in every job, which the rows persisted for the
+            # batch guarantee; they are only cached here if the batch is not persisted
+            if self._persisted_df is None:
+                cols_df.cache()
             element_count = self.get_row_count()
 
             if ignore_row_if == "both_values_are_missing":
@@ -362,7 +390,8 @@ class MetaSparkDFDataset(Dataset):
             #     except KeyError:
             #         pass
 
-            cols_df.unpersist()
+            if self._persisted_df is None:
+                cols_df.unpersist()
 
             return return_obj
 
@@ -387,9 +416,15 @@ class MetaSparkDFDataset(Dataset):
             mostly=None,
             ignore_row_if="all_values_are_missing",
             result_format=None,
+            row_condition=None,
+            condition_parser=None,
             *args,
             **kwargs,
         ):
+            if row_condition:
+                self = self._apply_row_condition(
+                    row_condition=row_condition, condition_parser=condition_parser
+                )
             # Rename column so we only have to handle dot notation here
             eval_cols = []
             for col_name in column_list:
@@ -409,10 +444,8 @@ class MetaSparkDFDataset(Dataset):
             else:
                 unexpected_count_limit = result_format["partial_unexpected_count"]
 
+            # the columns are read from the rows persisted for the batch, if any, rather than cached again
             temp_df = self.spark_df.select(*eval_cols)  # pyspark.sql.DataFrame
-
-            # a couple of tests indicate that caching here helps performance
-            temp_df.cache()
             element_count = self.get_row_count()
 
             if ignore_row_if == "all_values_are_missing":
@@ -507,8 +540,6 @@ class MetaSparkDFDataset(Dataset):
                 unexpected_index_list=None,
             )
 
-            temp_df.unpersist()
-
             return return_obj
 
         inner_wrapper.__name__ = func.__name__
@@ -590,6 +621,8 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
 --ge-feature-maturity-info--
     """
 
+    _supports_row_condition = True
+
     @classmethod
     def from_dataset(cls, dataset=None):
         if isinstance(dataset, SparkDFDataset):
@@ -597,14 +630,177 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         else:
             raise ValueError("from_dataset requires a SparkDFDataset dataset")
 
+    # values of the persist option, by the strategy they select
+    PERSIST_STRATEGIES = {
+        True: "full",
+        "full": "full",
+        "projected": "projected",
+        False: "none",
+        "none": "none",
+    }
+
     def __init__(self, spark_df, *args, **kwargs):
+        """
+        Args:
+            spark_df: the Spark DataFrame holding the batch
+            persist: how the rows of spark_df are cached for the expectations evaluated on them. "full" (or True, the
+                default) persists all columns of spark_df. "projected" persists only the columns the expectation suite
+                of the dataset refers to (see ExpectationSuite.get_referenced_columns), or all columns if those are not
+                known; expectations on other columns cannot be evaluated, but table expectations on the set of columns
+                still see all of them. "none" (or False) persists nothing, so that each Spark job reads the source
+                again; only use it if spark_df is already persisted, or too large to persist and computed the same way
+                by every job.
+            storage_level: the pyspark StorageLevel, or the name of one (such as "MEMORY_ONLY" or "DISK_ONLY"), to
+                persist rows with; by default, the default storage level of DataFrame.persist.
+
+        Persisted rows are unpersisted by close(), or when leaving a with block on the dataset. Map expectations read
+        their columns from them instead of caching copies of their own.
+        """
         # Creation of the Spark DataFrame is done outside this class
+        # with a partition_column, partial metrics are computed on (persisted) partitions rather than on all rows
+        self._persist = kwargs.pop(
+            "persist", "none" if kwargs.get("partition_column") else True
+        )
+        self._storage_level = kwargs.pop("storage_level", None)
+        if self._persist not in self.PERSIST_STRATEGIES:
+            raise ValueError(
+                "persist must be one of True, False, 'full', 'projected' or 'none'."
+            )
+        persist_strategy = self.PERSIST_STRATEGIES[self._persist]
+
+        projected_columns = (kwargs.get("batch_kwargs") or {}).get("columns")
+        if not projected_columns and persist_strategy == "projected":
+            expectation_suite = kwargs.get("expectation_suite")
+            if isinstance(expectation_suite, dict):
+                expectation_suite = expectationSuiteSchema.load(expectation_suite)
+            if expectation_suite is not None:
+                projected_columns = expectation_suite.get_referenced_columns(
+                    table_columns_from_schema=True
+                )
+        self._schema_columns = None
+        if projected_columns:
+            # only the columns of the batch are read and persisted; the other columns of the source are still known
+            # from its schema, for table expectations
+            self._schema_columns = spark_df.columns
+            # columns missing from the source are left to fail the expectations referring to them
+            projected_columns = [
+                column
+                for column in projected_columns
+                if column in set(self._schema_columns)
+            ]
+        if projected_columns:
+            spark_df = spark_df.select(*projected_columns)
         self.spark_df = spark_df
-        self._persist = kwargs.pop("persist", True)
-        if self._persist:
-            self.spark_df.persist()
+
+        # expectations add columns to spark_df, so the persisted DataFrame is kept to unpersist it
+        self._persisted_df = None
+        if persist_strategy != "none":
+            storage_level = self._storage_level
+            if isinstance(storage_level, str):
+                storage_level = getattr(StorageLevel, storage_level.upper())
+            if storage_level is None:
+                self.spark_df.persist()
+            else:
+                self.spark_df.persist(storage_level)
+            self._persisted_df = self.spark_df
+        self._row_condition_datasets = {}
         super().__init__(*args, **kwargs)
 
+    def close(self):
+        """Unpersists the rows of this dataset, and of the datasets filtered from it for row conditions and
+        partitions."""
+        for dataset in self._row_condition_datasets.values():
+            dataset.close()
+        self._row_condition_datasets = {}
+        for dataset in self._partition_datasets.values():
+            dataset.close()
+        self._partition_datasets = {}
+        if self._persisted_df is not None:
+            self._persisted_df.unpersist()
+            self._persisted_df = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _get_row_condition_filter(self, row_condition, condition_parser):
+        """Compiles row_condition into a filter of spark_df.
+
+        row_condition may use the great_expectations condition syntax (condition_parser
+        "great_expectations__experimental__"), or be a Spark SQL boolean expression (condition_parser "spark").
+        """
+        if condition_parser == GE_CONDITION_PARSER:
+            return build_row_condition(
+                parse_row_condition(row_condition),
+                col,
+                and_=lambda *operands: reduce(lambda a, b: a & b, operands),
+                or_=lambda *operands: reduce(lambda a, b: a | b, operands),
+                not_=lambda operand: ~operand,
+                is_null=lambda column: column.isNull(),
+            )
+        elif condition_parser == "spark":
+            return expr(row_condition)
+        raise ValueError(
+            "condition_parser is required when setting a row_condition,"
+            " and must be '{}' or 'spark'".format(GE_CONDITION_PARSER)
+        )
+
+    def _apply_row_condition(self, row_condition, condition_parser, columns=None):
+        """Returns a SparkDFDataset of the rows of this dataset satisfying row_condition.
+
+        The filter is part of the plan of every job run for an expectation, so Spark pushes it down to the
+        scan; when caching is enabled, the filtered dataset (and its persisted rows) is reused by all expectations
+        sharing the condition and unpersisted by close(). Otherwise it is not persisted, and reads the rows
+        persisted for this dataset. All columns are kept, so columns is ignored.
+        """
+        key = (row_condition, condition_parser)
+        if key in self._row_condition_datasets:
+            return self._row_condition_datasets[key]
+
+        dataset = self.__class__(
+            self.spark_df.filter(
+                self._get_row_condition_filter(row_condition, condition_parser)
+            ),
+            batch_kwargs=self.batch_kwargs,
+            caching=self.caching,
+            persist=self._persist if self.caching else False,
+            storage_level=self._storage_level,
+        )
+        dataset._schema_columns = self._schema_columns
+        if self.caching:
+            self._row_condition_datasets[key] = dataset
+        return dataset
+
+    def _get_partition_fingerprints(self, partition_column):
+        """Fingerprints each partition by its row count and the sum of the hashes of its rows, computed for all
+        partitions in a single aggregation."""
+        rows = (
+            self.spark_df.groupBy(col(partition_column))
+            .agg(
+                count(lit(1)),
+                sum_(hash_(*[col(column) for column in self.spark_df.columns])),
+            )
+            .collect()
+        )
+        return {row[0]: "%d:%d" % (row[1], row[2]) for row in rows}
+
+    def _get_partition_dataset(self, partition_column, partition_value):
+        if partition_value is None:
+            partition_filter = col(partition_column).isNull()
+        else:
+            partition_filter = col(partition_column) == lit(partition_value)
+        dataset = self.__class__(
+            self.spark_df.filter(partition_filter),
+            batch_kwargs=self.batch_kwargs,
+            caching=self.caching,
+            persist=True,
+            storage_level=self._storage_level,
+        )
+        dataset._schema_columns = self._schema_columns
+        return dataset
+
     def head(self, n=5):
         """Returns a *PandasDataset* with the first *n* rows of the given Dataset"""
         return PandasDataset(
@@ -617,13 +813,22 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
             ),
         )
 
+    def get_sample_dataset(self, fraction, seed=None):
+        return self.__class__(
+            self.spark_df.sample(withReplacement=False, fraction=fraction, seed=seed),
+            caching=self.caching,
+            persist=self._persist,
+        )
+
     def get_row_count(self):
         return self.spark_df.count()
 
     def get_column_count(self):
-        return len(self.spark_df.columns)
+        return len(self.get_table_columns())
 
     def get_table_columns(self) -> List[str]:
+        if self._schema_columns is not None:
+            return list(self._schema_columns)
         return self.spark_df.columns
 
     def get_column_nonnull_count(self, column):
@@ -640,19 +845,42 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
     def get_column_sum(self, column):
         return self.spark_df.select(column).groupBy().sum().collect()[0][0]
 
-    # TODO: consider getting all basic statistics in one go:
-    def _describe_column(self, column):
-        # temp_column = self.spark_df.select(column).where(col(column).isNotNull())
-        # return self.spark_df.select(
-        #     [
-        #         count(temp_column),
-        #         mean(temp_column),
-        #         stddev(temp_column),
-        #         min(temp_column),
-        #         max(temp_column)
-        #     ]
-        # )
-        pass
+    def _get_column_metrics_batch(self, columns, metrics):
+        aggregates = [count(lit(1)).alias("row_count")]
+        for idx, column in enumerate(columns):
+            for metric in metrics:
+                aggregates.append(
+                    self._get_column_metric_expression(column, metric).alias(
+                        "{}_{}".format(metric, idx)
+                    )
+                )
+        row = self.spark_df.agg(*aggregates).collect()[0]
+
+        column_metrics = {}
+        for idx, column in enumerate(columns):
+            column_metrics[column] = {
+                metric: row["{}_{}".format(metric, idx)] for metric in metrics
+            }
+        return row["row_count"], column_metrics
+
+    @staticmethod
+    def _get_column_metric_expression(column, metric):
+        """Return the aggregate expression computing metric, matching the corresponding get_column_<metric>"""
+        if metric == "nonnull_count":
+            return count(col(column))
+        elif metric == "min":
+            return min_(col(column))
+        elif metric == "max":
+            return max_(col(column))
+        elif metric == "mean":
+            return avg(col(column))
+        elif metric == "sum":
+            return sum_(col(column))
+        elif metric == "unique_count":
+            return countDistinct(col(column))
+        elif metric == "stdev":
+            return stddev_samp(col(column))
+        raise ValueError("Unsupported metric for batched computation: %s" % metric)
 
     def get_column_max(self, column, parse_strings_as_datetimes=False):
         temp_column = self.spark_df.select(column).where(col(column).isNotNull())
@@ -764,16 +992,16 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         # Further, it *always* follows the numpy convention of lower_bound <= bin < upper_bound
         # for all but the last bin
 
-        # But, since the last bin in our case will often be +infinity, we need to
-        # find the number of values exactly equal to the upper bound to add those
-
-        # We'll try for an optimization by asking for it at the same time
+        # But, since the last bin in our case will often be +infinity, values exactly equal to
+        # the upper bound are moved from the +infinity bucket into the last bin, so that the
+        # histogram is computed in a single pass over the data
         if added_max:
-            upper_bound_count = (
-                temp_column.select(column).filter(col(column) == bins[-2]).count()
+            bucketed = bucketed.withColumn(
+                "buckets",
+                when(col(column) == bins[-2], float(len(bins) - 3)).otherwise(
+                    col("buckets")
+                ),
             )
-        else:
-            upper_bound_count = 0
 
         hist_rows = bucketed.groupBy("buckets").count().collect()
         # Spark only returns buckets that have nonzero counts.
@@ -781,8 +1009,6 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         for row in hist_rows:
             hist[int(row["buckets"])] = row["count"]
 
-        hist[-2] += upper_bound_count
-
         if added_min:
             below_bins = hist.pop(0)
             bins.pop(0)
@@ -818,6 +1044,33 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
                 result = result.filter(col(column) <= max_val)
         return result.count()
 
+    def get_column_sample_values(self, column, sample_size, seed=None):
+        values = self.spark_df.select(column).filter(col(column).isNotNull())
+        if values.count() > sample_size:
+            # ordering on a random number and taking the first rows only keeps the top rows of each partition
+            values = values.orderBy(rand(seed)).limit(sample_size)
+        return np.array([row[0] for row in values.collect()], dtype=float)
+
+    def _build_column_sketch(self, column, sketch):
+        """Build a sketch of each partition of spark_df on its executor, and merge them."""
+        empty_sketch = sketch
+
+        def build_partition_sketch(rows):
+            partition_sketch = copy.deepcopy(empty_sketch)
+            while True:
+                values = [row[0] for row in islice(rows, SKETCH_CHUNK_SIZE)]
+                if not values:
+                    break
+                partition_sketch.update(values)
+            yield partition_sketch
+
+        return (
+            self.spark_df.select(column)
+            .filter(col(column).isNotNull())
+            .rdd.mapPartitions(build_partition_sketch)
+            .fold(sketch, lambda partition_sketch, other: partition_sketch.merge(other))
+        )
+
     # Utils
     @staticmethod
     def _apply_dateutil_parse(column):
@@ -1221,19 +1474,30 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         if type_list is None:
             success = True
         else:
-            types = []
-            for type_ in type_list:
-                try:
-                    type_class = getattr(sparktypes, type_)
-                    types.append(type_class)
-                except AttributeError:
-                    logger.debug("Unrecognized type: %s" % type_)
-            if len(types) == 0:
-                raise ValueError("No recognized spark types in type_list")
-            types = tuple(types)
-            success = issubclass(col_type, types)
+            success = issubclass(col_type, self._get_type_classes(type_list))
         return {"success": success, "result": {"observed_value": col_type.__name__}}
 
+    @staticmethod
+    def _get_type_classes(type_list):
+        types = []
+        for type_ in type_list:
+            try:
+                type_class = getattr(sparktypes, type_)
+                types.append(type_class)
+            except AttributeError:
+                logger.debug("Unrecognized type: %s" % type_)
+        if len(types) == 0:
+            raise ValueError("No recognized spark types in type_list")
+        return tuple(types)
+
+    def _column_type_in_type_list(self, column, type_list):
+        try:
+            col_type = type(self.spark_df.schema[column].dataType)
+        except KeyError:
+            # e.g. a nested field referenced with dot notation
+            return None
+        return issubclass(col_type, self._get_type_classes(type_list))
+
     @DocInherit
     @MetaSparkDFDataset.column_map_expectation
     def expect_column_values_to_match_regex(
@@ -1246,7 +1510,9 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         catch_exceptions=None,
         meta=None,
     ):
-        return column.withColumn("__success", column[0].rlike(regex))
+        return column.withColumn(
+            "__success", self._rlike_regex_list(column[0], [regex])
+        )
 
     @DocInherit
     @MetaSparkDFDataset.column_map_expectation
@@ -1260,7 +1526,9 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         catch_exceptions=None,
         meta=None,
     ):
-        return column.withColumn("__success", ~column[0].rlike(regex))
+        return column.withColumn(
+            "__success", ~self._rlike_regex_list(column[0], [regex])
+        )
 
     @DocInherit
     @MetaSparkDFDataset.column_map_expectation
@@ -1275,15 +1543,51 @@ This class holds an attribute `spark_df` which is a spark.sql.DataFrame.
         catch_exceptions=None,
         meta=None,
     ):
+        return column.withColumn(
+            "__success",
+            self._rlike_regex_list(column[0], regex_list, match_on=match_on),
+        )
+
+    @DocInherit
+    @MetaSparkDFDataset.column_map_expectation
+    def expect_column_values_to_not_match_regex_list(
+        self,
+        column,
+        regex_list,
+        mostly=None,
+        result_format=None,
+        include_config=True,
+        catch_exceptions=None,
+        meta=None,
+    ):
+        return column.withColumn(
+            "__success", ~self._rlike_regex_list(column[0], regex_list)
+        )
+
+    @staticmethod
+    def _rlike_regex_list(column, regex_list, match_on="any"):
+        """Returns a boolean column expression telling whether the values of column match any or all of the regexes
+        of regex_list, combining the regexes into a single rlike alternation where possible for match_on "any"."""
+        if match_on not in ["any", "all"]:
+            raise ValueError("match_on must be either 'any' or 'all'")
+        if len(regex_list) == 0:
+            raise ValueError("regex_list must contain at least one regex")
+
         if match_on == "any":
-            return column.withColumn("__success", column[0].rlike("|".join(regex_list)))
-        elif match_on == "all":
-            formatted_regex_list = ["(?={})".format(regex) for regex in regex_list]
-            return column.withColumn(
-                "__success", column[0].rlike("".join(formatted_regex_list))
+            combined_regex = combine_regex_list(tuple(regex_list))
+            if combined_regex is not None:
+                return column.rlike(combined_regex)
+            return reduce(
+                lambda matches, regex: matches | column.rlike(regex),
+                regex_list[1:],
+                column.rlike(regex_list[0]),
             )
-        else:
-            raise ValueError("match_on must be either 'any' or 'all'")
+        # a single pattern of lookaheads would only match where all regexes match at the same position
+        return reduce(
+            lambda matches, regex: matches & column.rlike(regex),
+            regex_list[1:],
+            column.rlike(regex_list[0]),
+        )
 
     @DocInherit
     @MetaSparkDFDataset.column_pair_map_expectation
@@ -1,22 +1,36 @@
+import asyncio
+import hashlib
 import inspect
+import json
 import logging
+import os
+import re
+import tempfile
+import threading
+import time
 import traceback
 import uuid
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from functools import wraps
+from fractions import Fraction
+from functools import partial, wraps
 from typing import Dict, Iterable, List
 
 import numpy as np
 import pandas as pd
 from dateutil.parser import parse
 
+from great_expectations.core.sketch import SKETCH_CHUNK_SIZE
 from great_expectations.data_asset import DataAsset
 from great_expectations.data_asset.util import DocInherit, parse_result_format
 from great_expectations.dataset.util import (
+    GE_CONDITION_PARSER,
+    build_row_condition,
     check_sql_engine_dialect,
     get_approximate_percentile_disc_sql,
     get_sql_dialect_floating_point_infinity_value,
+    parse_row_condition,
 )
 from great_expectations.util import import_library_module
 
@@ -36,7 +50,7 @@ try:
     from sqlalchemy.sql.elements import Label, TextClause, WithinGroup, quoted_name
     from sqlalchemy.sql.expression import BinaryExpression, literal
     from sqlalchemy.sql.operators import custom_op
-    from sqlalchemy.sql.selectable import CTE, Select
+    from sqlalchemy.sql.selectable import CTE, Alias, Select
 except ImportError:
     logger.debug(
         "Unable to load SqlAlchemy context; install optional sqlalchemy dependency for support"
@@ -48,6 +62,7 @@ except ImportError:
     literal = None
     Select = None
     CTE = None
+    Alias = None
     custom_op = None
     Label = None
     WithinGroup = None
@@ -119,8 +134,174 @@ except ImportError:
     pyathena = None
 
 
+class SqlAlchemyReflectionCache:
+    """Caches the results of reflecting database catalogs, keyed by engine url, schema and table name.
+
+    A cache is shared by all batches of a datasource, so that the catalog is queried once per table instead of once
+    per batch. Entries expire after *ttl* seconds (never if ttl is None), and can be invalidated explicitly when
+    tables are known to have changed.
+    """
+
+    def __init__(self, ttl=None):
+        self._ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get_inspector(self, engine):
+        """Returns an inspector for *engine* whose reflection methods are served from this cache."""
+        return CachedInspector(self, engine)
+
+    def invalidate(self, table_name=None, schema=None):
+        """Invalidates the columns of *table_name* in *schema*, along with the table and view lists that may include
+        it. A table_name or schema of None matches any table or schema."""
+        with self._lock:
+            for key in list(self._entries.keys()):
+                _, _, key_schema, key_table_name = key
+                if schema is not None and key_schema != schema:
+                    continue
+                if (
+                    table_name is not None
+                    and key_table_name is not None
+                    and key_table_name != table_name
+                ):
+                    continue
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _get(self, engine, method_name, schema=None, table_name=None):
+        key = (str(engine.engine.url), method_name, schema, table_name)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None:
+            value, expires_at = entry
+            if expires_at is None or time.monotonic() < expires_at:
+                return value
+
+        # a new inspector is used for every miss, since inspectors memoize reflection results for as long as they live
+        insp = reflection.Inspector.from_engine(engine)
+        if method_name == "default_schema_name":
+            value = insp.default_schema_name
+        elif table_name is not None:
+            value = getattr(insp, method_name)(table_name, schema=schema)
+        elif method_name == "get_schema_names":
+            value = insp.get_schema_names()
+        else:
+            value = getattr(insp, method_name)(schema=schema)
+        expires_at = time.monotonic() + self._ttl if self._ttl is not None else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+        return value
+
+
+class CachedInspector:
+    """Exposes the reflection methods of a SqlAlchemy Inspector used by Great Expectations, backed by a
+    SqlAlchemyReflectionCache."""
+
+    def __init__(self, reflection_cache, engine):
+        self._reflection_cache = reflection_cache
+        self._engine = engine
+
+    @property
+    def default_schema_name(self):
+        return self._reflection_cache._get(self._engine, "default_schema_name")
+
+    def get_schema_names(self):
+        return list(self._reflection_cache._get(self._engine, "get_schema_names"))
+
+    def get_table_names(self, schema=None):
+        return list(
+            self._reflection_cache._get(self._engine, "get_table_names", schema=schema)
+        )
+
+    def get_view_names(self, schema=None):
+        return list(
+            self._reflection_cache._get(self._engine, "get_view_names", schema=schema)
+        )
+
+    def get_columns(self, table_name, schema=None):
+        # callers may modify the returned column dictionaries
+        return [
+            dict(column)
+            for column in self._reflection_cache._get(
+                self._engine, "get_columns", schema=schema, table_name=table_name
+            )
+        ]
+
+
+class SqlAlchemyQueryExecutor:
+    """Runs independent queries concurrently in a pool of threads, with at most *max_concurrent_queries* of them in
+    flight at a time.
+
+    An executor is usually shared by all batches of a datasource, which bounds the number of concurrent queries
+    against the database of the datasource. Each query runs on its own connection from the connection pool of the
+    engine, so the pool should allow at least max_concurrent_queries connections.
+    """
+
+    def __init__(self, max_concurrent_queries=4):
+        if max_concurrent_queries < 1:
+            raise ValueError("max_concurrent_queries must be at least 1.")
+        self._max_concurrent_queries = max_concurrent_queries
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @property
+    def max_concurrent_queries(self):
+        return self._max_concurrent_queries
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_concurrent_queries,
+                    thread_name_prefix="ge_sqlalchemy_query",
+                )
+            return self._executor
+
+    def run(self, calls):
+        """Runs *calls*, functions without arguments, concurrently.
+
+        Returns:
+            list: the value returned by each call, or the exception it raised, in the order of calls
+        """
+        futures = [self._get_executor().submit(call) for call in calls]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+        return results
+
+    async def run_async(self, calls):
+        """Awaitable version of run, for use within an asyncio event loop."""
+        loop = asyncio.get_event_loop()
+        return await asyncio.gather(
+            *[loop.run_in_executor(self._get_executor(), call) for call in calls],
+            return_exceptions=True,
+        )
+
+    def shutdown(self, wait=True):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait)
+                self._executor = None
+
+
 class SqlAlchemyBatchReference:
-    def __init__(self, engine, table_name=None, schema=None, query=None):
+    def __init__(
+        self,
+        engine,
+        table_name=None,
+        schema=None,
+        query=None,
+        create_temp_table=None,
+        reflection_cache=None,
+        query_executor=None,
+        projected_columns=None,
+    ):
         self._engine = engine
         if table_name is None and query is None:
             raise ValueError("Table_name or query must be specified")
@@ -128,6 +309,10 @@ class SqlAlchemyBatchReference:
         self._table_name = table_name
         self._schema = schema
         self._query = query
+        self._create_temp_table = create_temp_table
+        self._reflection_cache = reflection_cache
+        self._query_executor = query_executor
+        self._projected_columns = projected_columns
 
     def get_init_kwargs(self):
         if self._table_name and self._query:
@@ -144,6 +329,14 @@ class SqlAlchemyBatchReference:
             kwargs = {"engine": self._engine, "custom_sql": self._query}
         if self._schema:
             kwargs["schema"] = self._schema
+        if self._query and self._create_temp_table is not None:
+            kwargs["create_temp_table"] = self._create_temp_table
+        if self._reflection_cache is not None:
+            kwargs["reflection_cache"] = self._reflection_cache
+        if self._query_executor is not None:
+            kwargs["query_executor"] = self._query_executor
+        if self._query and self._projected_columns:
+            kwargs["projected_columns"] = self._projected_columns
 
         return kwargs
 
@@ -165,8 +358,19 @@ class MetaSqlAlchemyDataset(Dataset):
         @cls.expectation(argspec)
         @wraps(func)
         def inner_wrapper(
-            self, column, mostly=None, result_format=None, *args, **kwargs
+            self,
+            column,
+            mostly=None,
+            result_format=None,
+            row_condition=None,
+            condition_parser=None,
+            *args,
+            **kwargs,
         ):
+            if row_condition:
+                self = self._apply_row_condition(
+                    row_condition=row_condition, condition_parser=condition_parser
+                )
             if self.batch_kwargs.get("use_quoted_name"):
                 column = quoted_name(column, quote=True)
             if result_format is None:
@@ -178,7 +382,7 @@ class MetaSqlAlchemyDataset(Dataset):
                 warnings.warn(
                     "Setting result format to COMPLETE for a SqlAlchemyDataset can be dangerous because it will not limit the number of returned results."
                 )
-                unexpected_count_limit = None
+                unexpected_count_limit = self._max_unexpected_values_in_memory
             else:
                 unexpected_count_limit = result_format["partial_unexpected_count"]
 
@@ -257,8 +461,16 @@ class MetaSqlAlchemyDataset(Dataset):
             count_results["null_count"] = int(count_results["null_count"])
             count_results["unexpected_count"] = int(count_results["unexpected_count"])
 
+            # Unexpected values that do not fit in memory are only retrieved if they can be spilled to disk
+            spill_unexpected_values = (
+                result_format["result_format"] == "COMPLETE"
+                and self._unexpected_values_spill_dir is not None
+                and unexpected_count_limit is not None
+                and count_results["unexpected_count"] > unexpected_count_limit
+            )
+
             # Retrieve unexpected values
-            unexpected_query_results = self.engine.execute(
+            unexpected_query = (
                 sa.select([sa.column(column)])
                 .select_from(self._table)
                 .where(
@@ -266,29 +478,23 @@ class MetaSqlAlchemyDataset(Dataset):
                         sa.not_(expected_condition), sa.not_(ignore_values_condition)
                     )
                 )
-                .limit(unexpected_count_limit)
+                .limit(None if spill_unexpected_values else unexpected_count_limit)
+            )
+            (
+                maybe_limited_unexpected_list,
+                unexpected_values_spill_file,
+            ) = self._fetch_unexpected_values(
+                unexpected_query,
+                column,
+                max_values=unexpected_count_limit,
+                output_strftime_format=kwargs.get("output_strftime_format"),
+                spill=spill_unexpected_values,
             )
 
             nonnull_count: int = count_results["element_count"] - count_results[
                 "null_count"
             ]
 
-            if "output_strftime_format" in kwargs:
-                output_strftime_format = kwargs["output_strftime_format"]
-                maybe_limited_unexpected_list = []
-                for x in unexpected_query_results.fetchall():
-                    if isinstance(x[column], str):
-                        col = parse(x[column])
-                    else:
-                        col = x[column]
-                    maybe_limited_unexpected_list.append(
-                        datetime.strftime(col, output_strftime_format)
-                    )
-            else:
-                maybe_limited_unexpected_list = [
-                    x[column] for x in unexpected_query_results.fetchall()
-                ]
-
             success_count = nonnull_count - count_results["unexpected_count"]
             success, percent_success = self._calc_map_expectation_success(
                 success_count, nonnull_count, mostly
@@ -304,6 +510,16 @@ class MetaSqlAlchemyDataset(Dataset):
                 None,
             )
 
+            if (
+                result_format["result_format"] == "COMPLETE"
+                and len(maybe_limited_unexpected_list)
+                < count_results["unexpected_count"]
+            ):
+                details = return_obj["result"].setdefault("details", {})
+                details["unexpected_list_truncated"] = True
+                if unexpected_values_spill_file is not None:
+                    details["unexpected_list_file"] = unexpected_values_spill_file
+
             if func.__name__ in [
                 "expect_column_values_to_not_be_null",
                 "expect_column_values_to_be_null",
@@ -325,6 +541,68 @@ class MetaSqlAlchemyDataset(Dataset):
 
         return inner_wrapper
 
+    def _fetch_unexpected_values(
+        self,
+        unexpected_query,
+        column,
+        max_values=None,
+        output_strftime_format=None,
+        spill=False,
+    ):
+        """Fetches the values of column selected by unexpected_query.
+
+        Rows are streamed through a server-side cursor on dialects supporting one, a batch of
+        UNEXPECTED_VALUES_FETCH_SIZE rows at a time, and at most max_values values are returned. If spill, every
+        value is also written, as it is fetched, to a file of JSON values (one per line) in the
+        unexpected_values_spill_dir of the dataset.
+
+        Returns:
+            A tuple of the list of values held in memory and the path of the spill file (or None).
+        """
+        values = []
+        spill_file_path = None
+        spill_file = None
+        if spill:
+            spill_fd, spill_file_path = tempfile.mkstemp(
+                prefix="ge_unexpected_values_",
+                suffix=".jsonl",
+                dir=self._unexpected_values_spill_dir,
+            )
+            spill_file = os.fdopen(spill_fd, "w")
+
+        results = self.engine.execute(
+            unexpected_query.execution_options(stream_results=True)
+        )
+        try:
+            while True:
+                rows = results.fetchmany(self.UNEXPECTED_VALUES_FETCH_SIZE)
+                if not rows:
+                    break
+                for row in rows:
+                    value = row[column]
+                    if output_strftime_format is not None:
+                        if isinstance(value, str):
+                            value = parse(value)
+                        value = datetime.strftime(value, output_strftime_format)
+                    if max_values is None or len(values) < max_values:
+                        values.append(value)
+                    if spill_file is not None:
+                        spill_file.write(
+                            json.dumps(convert_to_json_serializable(value)) + "\n"
+                        )
+                if (
+                    spill_file is None
+                    and max_values is not None
+                    and len(values) >= max_values
+                ):
+                    break
+        finally:
+            results.close()
+            if spill_file is not None:
+                spill_file.close()
+
+        return values, spill_file_path
+
     def _get_count_query_mssql(
         self,
         expected_condition: BinaryExpression,
@@ -437,9 +715,23 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
 --ge-feature-maturity-info--
 """
 
+    _supports_row_condition = True
+
+    # number of rows fetched at a time when retrieving unexpected values
+    UNEXPECTED_VALUES_FETCH_SIZE = 10000
+    # largest denominator of the integer fractions approximating quantiles in window-function ranking queries
+    QUANTILE_MAX_DENOMINATOR = 1000000
+
     @classmethod
     def from_dataset(cls, dataset=None):
         if isinstance(dataset, SqlAlchemyDataset):
+            if not isinstance(dataset._table, sa.Table):
+                query = dataset._table.element
+                return cls(
+                    custom_sql=query if isinstance(query, Select) else str(query),
+                    engine=dataset.engine,
+                    create_temp_table=False,
+                )
             return cls(table_name=str(dataset._table.name), engine=dataset.engine)
         else:
             raise ValueError("from_dataset requires a SqlAlchemy dataset")
@@ -451,9 +743,53 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         connection_string=None,
         custom_sql=None,
         schema=None,
+        create_temp_table=None,
+        reflection_cache=None,
+        data_fingerprint_column=None,
+        max_unexpected_values_in_memory=1000000,
+        unexpected_values_spill_dir=None,
+        query_executor=None,
+        projected_columns=None,
         *args,
         **kwargs,
     ):
+        """
+        Args:
+            table_name: name of the table holding the batch; generated when a custom_sql query is given without one
+            engine: SqlAlchemy engine or connection to run queries with
+            connection_string: used to create an engine if none is given
+            custom_sql: query defining the batch, as SQL text or as a SqlAlchemy select, which is always expanded as
+                a subquery
+            schema: schema of the table
+            create_temp_table: whether to materialize custom_sql into a temporary table (True) or to expand it as a
+                named subquery in every statement run against the batch (False). By default, queries that are cheap
+                to re-run and return the same rows every time they run are expanded as subqueries, and all other
+                queries are materialized. For subqueries, only the types of columns selected unchanged from the
+                source table are reflected.
+            reflection_cache: SqlAlchemyReflectionCache to reflect tables with, usually shared by all batches of a
+                datasource
+            data_fingerprint_column: a column whose maximum changes whenever rows are added or updated, such as an
+                update timestamp. If given, the data is fingerprinted by its table or query, row count and the
+                maximum of this column, so that metrics can be cached in a metric cache store.
+            max_unexpected_values_in_memory: the maximum number of unexpected values retrieved into an
+                unexpected_list with the COMPLETE result_format; None does not limit them. Results with more
+                unexpected values are marked with details.unexpected_list_truncated.
+            unexpected_values_spill_dir: if given, COMPLETE results with more than max_unexpected_values_in_memory
+                unexpected values write all of them, as they are fetched, to a file of JSON values (one per line) in
+                this directory, whose path is set as details.unexpected_list_file.
+            query_executor: SqlAlchemyQueryExecutor used to run independent metric queries concurrently (see
+                compute_metrics), usually shared by all batches of a datasource. Without one, or for batches reading
+                a temporary table or an in-memory sqlite database, all queries run one after another on the
+                connection of the batch.
+            projected_columns: the columns of custom_sql to copy into the temporary table, or to select in the
+                subquery, of the batch. Table expectations on the set of columns still see all columns of custom_sql.
+        """
+
+        query_select = None
+        if isinstance(custom_sql, Select):
+            # a select keeps its bound parameters, which cannot always be rendered as literals in SQL text
+            query_select, custom_sql = custom_sql, str(custom_sql)
+            create_temp_table = False
 
         if custom_sql and not table_name:
             # NOTE: Eugene 2020-01-31: @James, this is a not a proper fix, but without it the "public" schema
@@ -470,6 +806,17 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         if table_name is None:
             raise ValueError("No table_name provided.")
 
+        self._reflection_cache = reflection_cache
+        self._custom_sql = custom_sql if query_select is None else query_select
+        self._query_executor = query_executor
+        self._uses_temporary_table = False
+        # connections checked out by threads computing metrics concurrently, used instead of the batch connection
+        self._thread_connections = threading.local()
+        self._data_fingerprint_column = data_fingerprint_column
+        self._row_condition_datasets = {}
+        self._max_unexpected_values_in_memory = max_unexpected_values_in_memory
+        self._unexpected_values_spill_dir = unexpected_values_spill_dir
+
         if engine is None and connection_string is None:
             raise ValueError("Engine or connection_string must be provided.")
 
@@ -522,9 +869,7 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         else:
             self.dialect = None
 
-        if engine and engine.dialect.name.lower() in ["sqlite", "mssql", "snowflake"]:
-            # sqlite/mssql/snowflake temp tables only persist within a connection so override the engine
-            self.engine = engine.connect()
+        self._owns_connection = False
 
         if schema is not None and custom_sql is not None:
             # temporary table will be written to temp schema, so don't allow
@@ -545,8 +890,40 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                     "default dataset in engine url"
                 )
 
-        if custom_sql:
+        if custom_sql and create_temp_table is None:
+            create_temp_table = (
+                self.generated_table_name is None
+                or self.engine.dialect.name.lower() == "mssql"
+                or not self._is_query_cheap_to_inline(custom_sql)
+            )
+
+        self._schema_columns = None
+        if custom_sql and projected_columns:
+            self._schema_columns = self._get_query_column_names(custom_sql)
+            # columns missing from the query are left to fail the expectations referring to them
+            projected_columns = [
+                column
+                for column in projected_columns
+                if column in set(self._schema_columns)
+            ]
+        if custom_sql and projected_columns:
+            custom_sql = self._get_projected_query(custom_sql, projected_columns)
+
+        if query_select is not None:
+            self._table = query_select.alias(table_name.lstrip("#"))
+        elif custom_sql and not create_temp_table:
+            self._table = (
+                self._get_query_text(custom_sql).columns().alias(table_name.lstrip("#"))
+            )
+        elif custom_sql:
+            if isinstance(self.engine, sa.engine.Engine):
+                # Temporary tables are only visible within the connection that created them, so check out a single
+                # connection that is reused by all queries of this batch until it is closed. Autocommit ends each
+                # statement's transaction, so that the connection is not left idle in transaction.
+                self.engine = self.engine.connect().execution_options(autocommit=True)
+                self._owns_connection = True
             self.create_temporary_table(table_name, custom_sql, schema_name=schema)
+            self._uses_temporary_table = True
 
             if self.generated_table_name is not None:
                 if self.engine.dialect.name.lower() == "bigquery":
@@ -562,13 +939,28 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                         )
                     )
 
-        try:
-            insp = reflection.Inspector.from_engine(self.engine)
-            self.columns = insp.get_columns(table_name, schema=schema)
-        except KeyError:
-            # we will get a KeyError for temporary tables, since
-            # reflection will not find the temporary schema
+        if not isinstance(self._table, sa.Table):
+            # a subquery cannot be reflected, but the types of the columns it selects unchanged can
             self.columns = self.column_reflection_fallback()
+            column_types = (
+                self._get_subquery_column_types(self._custom_sql)
+                if query_select is None
+                else {}
+            )
+            for column in self.columns:
+                if column["name"].lower() in column_types:
+                    column["type"] = column_types[column["name"].lower()]
+        else:
+            try:
+                # temporary tables are specific to this batch, so there is no point in caching their columns
+                insp = self._get_inspector(
+                    use_reflection_cache=self.generated_table_name is None
+                )
+                self.columns = insp.get_columns(table_name, schema=schema)
+            except KeyError:
+                # we will get a KeyError for temporary tables, since
+                # reflection will not find the temporary schema
+                self.columns = self.column_reflection_fallback()
 
         # Use fallback because for mssql reflection doesn't throw an error but returns an empty list
         if len(self.columns) == 0:
@@ -577,6 +969,353 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         # Only call super once connection is established and table_name and columns known to allow autoinspection
         super().__init__(*args, **kwargs)
 
+    # A query reading a single table, optionally filtered, is about as cheap to re-run for every statement as the
+    # temporary table it would otherwise be copied into
+    _CHEAP_QUERY_PATTERN = re.compile(
+        r"\s*select\s+(?P<columns>.+?)\s+from\s+(?P<table>[^\s,()]+)(?:\s+(?:as\s+)?\w+)?"
+        r"(?:\s+where\s+.+)?\s*;?\s*",
+        re.IGNORECASE | re.DOTALL,
+    )
+    # Queries using any of these keywords are either expensive to re-run for every statement or may return different
+    # rows each time they run
+    _MATERIALIZED_QUERY_KEYWORDS = re.compile(
+        r"\b(join|group|having|distinct|union|intersect|except|over|order|limit|top|offset|fetch|"
+        r"sample|tablesample|random|rand|newid|uuid|now|current_timestamp|with)\b",
+        re.IGNORECASE,
+    )
+
+    @staticmethod
+    def _get_query_text(query):
+        """Returns a text clause for *query*, in which colons are never taken for bind parameters.
+
+        Without escaping, a colon followed by a word, such as in the string literal 'x :y', is a bind parameter.
+        """
+        return sa.text(
+            re.sub(r"(?<![:\w\\]):(?=\w)", r"\\:", query.strip().rstrip(";"))
+        )
+
+    @classmethod
+    def _match_cheap_query(cls, query):
+        """Matches *query* against _CHEAP_QUERY_PATTERN, returning None for queries that should be materialized."""
+        # ignore the contents of string literals and quoted identifiers
+        unquoted_query = re.sub(r"'(?:[^']|'')*'|\"[^\"]*\"|`[^`]*`", "''", query)
+        if (
+            ";" in unquoted_query.strip().rstrip(";")
+            or len(re.findall(r"\bselect\b", unquoted_query, re.IGNORECASE)) != 1
+            or cls._MATERIALIZED_QUERY_KEYWORDS.search(unquoted_query) is not None
+        ):
+            return None
+        return cls._CHEAP_QUERY_PATTERN.fullmatch(query)
+
+    @classmethod
+    def _is_query_cheap_to_inline(cls, query):
+        """Returns whether *query* can be expanded as a subquery in every statement run against the batch instead of
+        being materialized into a temporary table."""
+        return cls._match_cheap_query(query) is not None
+
+    def _get_subquery_column_types(self, query):
+        """Returns the types of the columns *query* selects unchanged from its source table, by lower-cased name."""
+        match = self._match_cheap_query(query)
+        if match is None:
+            return {}
+        table_name_parts = [
+            part.strip('"`[]') for part in match.group("table").split(".")
+        ]
+        if self.engine.dialect.name.lower() == "bigquery":
+            table_name, schema = ".".join(table_name_parts), None
+        else:
+            table_name = table_name_parts[-1]
+            schema = table_name_parts[-2] if len(table_name_parts) > 1 else None
+        try:
+            source_columns = self._get_inspector().get_columns(
+                table_name, schema=schema
+            )
+        except (sa.exc.SQLAlchemyError, KeyError):
+            return {}
+
+        column_types = {
+            column["name"].lower(): column["type"] for column in source_columns
+        }
+        selected_column_names = set()
+        for item in match.group("columns").split(","):
+            column_match = re.fullmatch(
+                r"\s*(?:[\w\"`\[\]]+\.)?[\"`\[]?(\w+|\*)[\"`\]]?\s*", item
+            )
+            if column_match is None:
+                # expressions and aliased columns may have any type
+                continue
+            if column_match.group(1) == "*":
+                return column_types
+            selected_column_names.add(column_match.group(1).lower())
+        return {
+            name: type_
+            for name, type_ in column_types.items()
+            if name in selected_column_names
+        }
+
+    def _get_query_column_names(self, query):
+        """Returns the names of the columns *query* selects, without fetching any of its rows."""
+        subquery = self._get_query_text(query).columns().alias("ge_source")
+        return list(
+            self.engine.execute(
+                sa.select([sa.text("*")]).select_from(subquery).where(sa.false())
+            ).keys()
+        )
+
+    def _get_projected_query(self, query, columns):
+        """Returns a query selecting only *columns* from the rows of *query*."""
+        subquery = self._get_query_text(query).columns().alias("ge_source")
+        return str(
+            sa.select([sa.column(column) for column in columns])
+            .select_from(subquery)
+            .compile(self.engine, compile_kwargs={"literal_binds": True})
+        )
+
+    def _compute_data_fingerprint(self):
+        if self._data_fingerprint_column is None:
+            return None
+        row_count, max_value = self.engine.execute(
+            sa.select(
+                [
+                    sa.func.count(),
+                    sa.func.max(sa.column(self._data_fingerprint_column)),
+                ]
+            ).select_from(self._table)
+        ).fetchone()
+        if isinstance(self._custom_sql, Select):
+            query = self._custom_sql.compile(self.engine)
+            source = [str(query), query.params]
+        elif self._custom_sql is not None:
+            source = self._custom_sql
+        else:
+            source = [self._table.schema, self._table.name]
+        return hashlib.md5(
+            json.dumps(
+                [repr(self.engine.engine.url), source, row_count, max_value],
+                default=str,
+            ).encode("utf-8")
+        ).hexdigest()
+
+    def _get_row_condition_clause(self, row_condition, condition_parser):
+        """Compiles row_condition into a SqlAlchemy clause.
+
+        row_condition may use the great_expectations condition syntax (condition_parser
+        "great_expectations__experimental__"), or be a boolean SQL expression in the dialect of the engine
+        (condition_parser "sql").
+        """
+        if condition_parser == GE_CONDITION_PARSER:
+
+            def column(name):
+                if self.batch_kwargs.get("use_quoted_name"):
+                    name = quoted_name(name, quote=True)
+                return sa.column(name)
+
+            return build_row_condition(
+                parse_row_condition(row_condition),
+                column,
+                and_=sa.and_,
+                or_=sa.or_,
+                not_=sa.not_,
+                is_null=lambda col: col.is_(None),
+            )
+        elif condition_parser == "sql":
+            return self._get_query_text(row_condition)
+        raise ValueError(
+            "condition_parser is required when setting a row_condition,"
+            " and must be '{}' or 'sql'".format(GE_CONDITION_PARSER)
+        )
+
+    def _apply_row_condition(self, row_condition, condition_parser, columns=None):
+        """Returns a SqlAlchemyDataset of the rows of this dataset satisfying row_condition.
+
+        The returned dataset selects from this one through a subquery filtering on the condition, so that the
+        condition is pushed down into every statement run for an expectation instead of materializing the rows.
+        When caching is enabled, the dataset is reused by all expectations sharing the condition. All columns
+        are kept, so columns is ignored.
+        """
+        key = (row_condition, condition_parser)
+        if key in self._row_condition_datasets:
+            return self._row_condition_datasets[key]
+
+        dataset = self._get_filtered_dataset(
+            self._get_row_condition_clause(row_condition, condition_parser)
+        )
+        if self.caching:
+            self._row_condition_datasets[key] = dataset
+        return dataset
+
+    def _get_filtered_dataset(self, clause):
+        """Returns a SqlAlchemyDataset selecting the rows of this dataset satisfying clause through a subquery."""
+        dataset = self.__class__(
+            engine=self.engine,
+            custom_sql=sa.select(["*"]).select_from(self._table).where(clause),
+            reflection_cache=self._reflection_cache,
+            data_fingerprint_column=self._data_fingerprint_column,
+            max_unexpected_values_in_memory=self._max_unexpected_values_in_memory,
+            unexpected_values_spill_dir=self._unexpected_values_spill_dir,
+            query_executor=self._query_executor,
+            batch_kwargs=self.batch_kwargs,
+            caching=self.caching,
+        )
+        dataset._uses_temporary_table = self._uses_temporary_table
+        dataset._schema_columns = self._schema_columns
+        # filtering rows does not change the columns, or their reflected types
+        dataset.columns = [dict(column) for column in self.columns]
+        return dataset
+
+    def _get_partition_fingerprints(self, partition_column):
+        """Fingerprints each partition by its row count, and the maximum of its data_fingerprint_column if the
+        dataset has one, with a single GROUP BY over partition_column.
+
+        Without a data_fingerprint_column, only partitions to which rows are appended (or from which rows are
+        deleted) are recognized as changed, so a warning is logged.
+        """
+        aggregates = [sa.func.count()]
+        if self._data_fingerprint_column is not None:
+            aggregates.append(sa.func.max(sa.column(self._data_fingerprint_column)))
+        else:
+            logger.warning(
+                "Partitions of %s are fingerprinted by their row count only, so partial metrics of partitions "
+                "updated in place are reused; set a data_fingerprint_column to detect updates.",
+                self._table,
+            )
+        partition = self._get_reflected_column(partition_column)
+        rows = self.engine.execute(
+            sa.select([partition] + aggregates)
+            .select_from(self._table)
+            .group_by(partition)
+        ).fetchall()
+        return {
+            row[0]: ":".join(str(aggregate) for aggregate in row[1:]) for row in rows
+        }
+
+    def _get_column_moments(self, column):
+        """Computes the sum of squared deviations with a second aggregate rather than from the standard deviation,
+        which not every dialect provides."""
+        count, mean = self.engine.execute(
+            sa.select(
+                [sa.func.count(sa.column(column)), sa.func.avg(sa.column(column))]
+            ).select_from(self._table)
+        ).fetchone()
+        if count == 0:
+            return [0, 0.0, 0.0]
+        mean = float(mean)
+        deviation = sa.column(column) - sa.literal(mean)
+        m2 = self.engine.execute(
+            sa.select([sa.func.sum(deviation * deviation)]).select_from(self._table)
+        ).scalar()
+        return [int(count), mean, float(m2)]
+
+    def _get_partition_dataset(self, partition_column, partition_value):
+        partition = self._get_reflected_column(partition_column)
+        if partition_value is None:
+            clause = partition.is_(None)
+        else:
+            clause = partition == partition_value
+        return self._get_filtered_dataset(clause)
+
+    def _get_reflected_column(self, column):
+        """Returns a column clause with the reflected type of *column*, so that its values are converted to and from
+        the Python types of the column (e.g. dates) in every dialect."""
+        for reflected_column in self.columns:
+            if reflected_column["name"] == column and "type" in reflected_column:
+                return sa.column(column, reflected_column["type"])
+        return sa.column(column)
+
+    def _get_inspector(self, use_reflection_cache=True):
+        """Returns an inspector for the engine, backed by the reflection cache of the batch if it has one."""
+        if use_reflection_cache and self._reflection_cache is not None:
+            return self._reflection_cache.get_inspector(self.engine)
+        return reflection.Inspector.from_engine(self.engine)
+
+    def close(self):
+        """Returns the connection checked out by this dataset for its temporary table to the connection pool of its
+        engine.
+
+        The temporary table is no longer available once the connection is closed. Batches reading a table or a
+        subquery check out a connection per query, and hold no connection that needs to be closed.
+        """
+        if self._owns_connection and not self.engine.closed:
+            self.engine.close()
+
+    @property
+    def engine(self):
+        thread_connection = getattr(self._thread_connections, "connection", None)
+        if thread_connection is not None:
+            return thread_connection
+        return self._engine
+
+    @engine.setter
+    def engine(self, engine):
+        self._engine = engine
+
+    def _can_compute_metrics_concurrently(self):
+        if (
+            self._query_executor is None
+            or self._query_executor.max_concurrent_queries < 2
+        ):
+            return False
+        # temporary tables are only visible within the connection of the batch
+        if self._uses_temporary_table:
+            return False
+        # every connection to an in-memory sqlite database opens a database of its own
+        return not (
+            self.engine.dialect.name.lower() == "sqlite"
+            and self.engine.engine.url.database in [None, "", ":memory:"]
+        )
+
+    def compute_metrics(self, metric_calls):
+        """Compute several metrics, running their queries concurrently through the query_executor of the batch.
+
+        Each metric is computed on a connection of its own, checked out from the connection pool of the engine.
+        Metrics are computed one after another on the connection of the batch if it cannot compute them
+        concurrently (see the query_executor argument).
+
+        Args:
+            metric_calls (list of tuple): a (getter_name, args, kwargs) tuple for each metric
+
+        Returns:
+            list: the value of each metric, or the exception raised while computing it, in the order of metric_calls
+        """
+        if len(metric_calls) < 2 or not self._can_compute_metrics_concurrently():
+            return super().compute_metrics(metric_calls)
+        return self._query_executor.run(self._get_metric_thread_calls(metric_calls))
+
+    async def compute_metrics_async(self, metric_calls):
+        """Awaitable version of compute_metrics, for use within an asyncio event loop."""
+        if not self._can_compute_metrics_concurrently():
+            return self.compute_metrics(metric_calls)
+        return await self._query_executor.run_async(
+            self._get_metric_thread_calls(metric_calls)
+        )
+
+    def _get_metric_thread_calls(self, metric_calls):
+        return [
+            partial(
+                self._compute_metric_on_own_connection,
+                getattr(self, getter_name),
+                args,
+                kwargs,
+            )
+            for getter_name, args, kwargs in metric_calls
+        ]
+
+    def _compute_metric_on_own_connection(self, getter, args, kwargs):
+        with self._engine.engine.connect() as connection:
+            self._thread_connections.connection = connection.execution_options(
+                autocommit=True
+            )
+            try:
+                return getter(*args, **kwargs)
+            finally:
+                self._thread_connections.connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     @property
     def sql_engine_dialect(self) -> DefaultDialect:
         return self.engine.dialect
@@ -602,37 +1341,45 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
     def head(self, n=5):
         """Returns a *PandasDataset* with the first *n* rows of the given Dataset"""
 
-        try:
-            df = next(
-                pd.read_sql_table(
-                    table_name=self._table.name,
-                    schema=self._table.schema,
-                    con=self.engine,
-                    chunksize=n,
-                )
+        if not isinstance(self._table, sa.Table):
+            df = pd.read_sql(
+                sa.select(["*"]).select_from(self._table).limit(n), con=self.engine
             )
-        except (ValueError, NotImplementedError):
-            # it looks like MetaData that is used by pd.read_sql_table
-            # cannot work on a temp table.
-            # If it fails, we are trying to get the data using read_sql
-            head_sql_str = "select * from "
-            if self._table.schema and self.engine.dialect.name.lower() != "bigquery":
-                head_sql_str += self._table.schema + "." + self._table.name
-            elif self.engine.dialect.name.lower() == "bigquery":
-                head_sql_str += "`" + self._table.name + "`"
-            else:
-                head_sql_str += self._table.name
-            head_sql_str += " limit {:d}".format(n)
-
-            # Limit is unknown in mssql! Use top instead!
-            if self.engine.dialect.name.lower() == "mssql":
-                head_sql_str = "select top({n}) * from {table}".format(
-                    n=n, table=self._table.name
+        else:
+            try:
+                df = next(
+                    pd.read_sql_table(
+                        table_name=self._table.name,
+                        schema=self._table.schema,
+                        con=self.engine,
+                        chunksize=n,
+                    )
                 )
+            except (ValueError, NotImplementedError):
+                # it looks like MetaData that is used by pd.read_sql_table
+                # cannot work on a temp table.
+                # If it fails, we are trying to get the data using read_sql
+                head_sql_str = "select * from "
+                if (
+                    self._table.schema
+                    and self.engine.dialect.name.lower() != "bigquery"
+                ):
+                    head_sql_str += self._table.schema + "." + self._table.name
+                elif self.engine.dialect.name.lower() == "bigquery":
+                    head_sql_str += "`" + self._table.name + "`"
+                else:
+                    head_sql_str += self._table.name
+                head_sql_str += " limit {:d}".format(n)
 
-            df = pd.read_sql(head_sql_str, con=self.engine)
-        except StopIteration:
-            df = pd.DataFrame(columns=self.get_table_columns())
+                # Limit is unknown in mssql! Use top instead!
+                if self.engine.dialect.name.lower() == "mssql":
+                    head_sql_str = "select top({n}) * from {table}".format(
+                        n=n, table=self._table.name
+                    )
+
+                df = pd.read_sql(head_sql_str, con=self.engine)
+            except StopIteration:
+                df = pd.DataFrame(columns=self.get_table_columns())
 
         return PandasDataset(
             df,
@@ -644,6 +1391,75 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
             ),
         )
 
+    def get_sample_dataset(self, fraction, seed=None):
+        """Returns a *SqlAlchemyDataset* backed by a temporary table holding a random sample of this table.
+
+        Tables of dialects supporting it are sampled with TABLESAMPLE; subqueries (such as cheap custom_sql queries
+        and datasets filtered on a row condition), and tables of other dialects, filter rows on a random number
+        instead. seed makes the sample repeatable with TABLESAMPLE on postgresql, snowflake and mssql, and with
+        MySQL's rand(); other dialects cannot seed their random numbers, and ignore it with a warning.
+        """
+        dialect_name = self.engine.dialect.name.lower()
+        percent = round(fraction * 100, 6)
+        tablesample_clause = None
+        # TABLESAMPLE only applies to tables, not to subqueries
+        use_tablesample = isinstance(self._table, sa.Table)
+        if (
+            seed is not None
+            and dialect_name != "mysql"
+            and not (
+                use_tablesample and dialect_name in ["postgresql", "snowflake", "mssql"]
+            )
+        ):
+            logger.warning(
+                "Ignoring the seed of the sample, which cannot be seeded in this %s query."
+                % dialect_name
+            )
+        if use_tablesample and dialect_name in ["postgresql", "snowflake"]:
+            sample_query = sa.select(["*"]).select_from(
+                sa.tablesample(
+                    self._table,
+                    sa.func.bernoulli(percent),
+                    seed=sa.literal_column(str(int(seed)))
+                    if seed is not None
+                    else None,
+                )
+            )
+        elif use_tablesample and dialect_name in ["mssql", "bigquery"]:
+            # these dialects expect TABLESAMPLE directly after the table name, before any alias
+            sample_query = sa.select(["*"]).select_from(self._table)
+            tablesample_clause = f" TABLESAMPLE SYSTEM ({percent} PERCENT)"
+            if dialect_name == "mssql" and seed is not None:
+                tablesample_clause += f" REPEATABLE ({int(seed)})"
+        else:
+            if dialect_name == "sqlite":
+                # sqlite's random() returns a signed 64-bit integer
+                sample_condition = sa.func.abs(sa.func.random()) % 1000000 < int(
+                    fraction * 1000000
+                )
+            elif dialect_name == "mysql":
+                sample_condition = sa.func.rand(
+                    *([int(seed)] if seed is not None else [])
+                ) < float(fraction)
+            else:
+                sample_condition = sa.func.random() < float(fraction)
+            sample_query = (
+                sa.select(["*"]).select_from(self._table).where(sample_condition)
+            )
+
+        custom_sql = str(
+            sample_query.compile(self.engine, compile_kwargs={"literal_binds": True})
+        )
+        if tablesample_clause is not None:
+            custom_sql += tablesample_clause
+        # the sample must be drawn once, so it is always materialized
+        return self.__class__(
+            engine=self.engine,
+            custom_sql=custom_sql,
+            create_temp_table=True,
+            caching=self.caching,
+        )
+
     def get_row_count(self, table_name=None):
         if table_name is None:
             table_name = self._table
@@ -653,9 +1469,11 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         return int(self.engine.execute(count_query).scalar())
 
     def get_column_count(self):
-        return len(self.columns)
+        return len(self.get_table_columns())
 
     def get_table_columns(self) -> List[str]:
+        if self._schema_columns is not None:
+            return list(self._schema_columns)
         return [col["name"] for col in self.columns]
 
     def get_column_nonnull_count(self, column):
@@ -753,153 +1571,211 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         ).scalar()
 
     def get_column_median(self, column):
-        # AWS Athena does not support offset
-        if self.sql_engine_dialect.name.lower() == "awsathena":
-            raise NotImplementedError("AWS Athena does not support OFFSET.")
-        nonnull_count = self.get_column_nonnull_count(column)
-        element_values = self.engine.execute(
-            sa.select([sa.column(column)])
-            .order_by(sa.column(column))
-            .where(sa.column(column) != None)
-            .offset(max(nonnull_count // 2 - 1, 0))
-            .limit(2)
-            .select_from(self._table)
-        )
+        return self.get_columns_medians([column])[column]
 
-        column_values = list(element_values.fetchall())
+    def get_columns_medians(self, columns: Iterable) -> Dict[str, float]:
+        """Compute the medians of several columns in a single statement.
+
+        The non-null values of each column are ranked with window functions and the center values are picked out of
+        the ranking with conditional aggregates, so neither a separate count query nor OFFSET (which is not supported
+        by every dialect, e.g. AWS Athena) is needed.
+
+        Args:
+            columns: the names of the columns for which to compute the median
 
-        if len(column_values) == 0:
-            column_median = None
-        elif nonnull_count % 2 == 0:
-            # An even number of column values: take the average of the two center values
-            column_median = (
-                float(
-                    column_values[0][0]
-                    + column_values[1][0]  # left center value  # right center value
+        Returns:
+            dict: a dictionary mapping each column to its median, or None if the column has no non-null values
+        """
+        columns = list(columns)
+        ranked_columns: Alias = self._get_ranked_columns_subquery(columns)
+
+        selects: List[Label] = []
+        for idx in range(len(columns)):
+            value = ranked_columns.c[f"value_{idx}"]
+            rank = ranked_columns.c[f"rank_{idx}"]
+            nonnull_count = ranked_columns.c[f"nonnull_count_{idx}"]
+            selects.extend(
+                [
+                    sa.func.min(sa.case([(2 * rank >= nonnull_count, value)])).label(
+                        f"left_center_{idx}"
+                    ),
+                    sa.func.min(sa.case([(2 * rank > nonnull_count, value)])).label(
+                        f"right_center_{idx}"
+                    ),
+                    sa.func.max(nonnull_count).label(f"nonnull_count_{idx}"),
+                ]
+            )
+        medians_results: RowProxy = self._execute_quantiles_query(
+            sa.select(selects).select_from(ranked_columns)
+        )
+
+        column_medians = {}
+        for idx, column in enumerate(columns):
+            nonnull_count = medians_results[f"nonnull_count_{idx}"]
+            if not nonnull_count:
+                column_medians[column] = None
+            elif nonnull_count % 2 == 0:
+                # An even number of column values: take the average of the two center values
+                column_medians[column] = (
+                    float(
+                        medians_results[f"left_center_{idx}"]
+                        + medians_results[f"right_center_{idx}"]
+                    )
+                    / 2.0
                 )
-                / 2.0
-            )  # Average center values
-        else:
-            # An odd number of column values, we can just take the center value
-            column_median = column_values[1][0]  # True center value
-        return column_median
+            else:
+                # An odd number of column values, we can just take the center value
+                column_medians[column] = medians_results[f"left_center_{idx}"]
+        return column_medians
 
     def get_column_quantiles(
         self, column: str, quantiles: Iterable, allow_relative_error: bool = False
     ) -> list:
-        if self.sql_engine_dialect.name.lower() == "mssql":
-            return self._get_column_quantiles_mssql(column=column, quantiles=quantiles)
-        elif self.sql_engine_dialect.name.lower() == "bigquery":
-            return self._get_column_quantiles_bigquery(
-                column=column, quantiles=quantiles
+        return self.get_columns_quantiles(
+            {column: quantiles}, allow_relative_error=allow_relative_error
+        )[column]
+
+    def get_columns_quantiles(
+        self, column_quantiles: Dict[str, Iterable], allow_relative_error: bool = False
+    ) -> Dict[str, list]:
+        """Compute the quantiles of several columns in a single statement.
+
+        Quantiles follow the semantics of PERCENTILE_DISC (the smallest value whose cumulative distribution is at least
+        the quantile). Each dialect uses the construct it supports best: PERCENTILE_DISC ... WITHIN GROUP, a windowed
+        PERCENTILE_DISC (mssql and BigQuery), APPROX_PERCENTILE (AWS Athena and Presto when allow_relative_error is
+        True), or a window-function ranking of the values (sqlite, MySQL, and exact quantiles on AWS Athena and Presto).
+
+        Args:
+            column_quantiles: a dictionary mapping each column to the quantiles to compute for it
+            allow_relative_error: whether approximate quantiles may be computed where the dialect offers them
+
+        Returns:
+            dict: a dictionary mapping each column to the list of its quantile values
+        """
+        # pymysql cannot handle conversion of numpy float64 to float; convert just in case
+        column_quantiles: Dict[str, List[float]] = {
+            column: [float(quantile) for quantile in quantiles]
+            for column, quantiles in column_quantiles.items()
+        }
+        dialect_name: str = self.sql_engine_dialect.name.lower()
+
+        if dialect_name in ["mysql", "sqlite"] or (
+            dialect_name in ["awsathena", "presto", "trino"]
+            and not allow_relative_error
+        ):
+            quantiles_query: Select = self._get_ranked_quantiles_query(column_quantiles)
+        elif dialect_name in ["awsathena", "presto", "trino"]:
+            selects: List[Label] = [
+                sa.func.approx_percentile(sa.column(column), quantile)
+                for column, quantiles in column_quantiles.items()
+                for quantile in quantiles
+            ]
+            quantiles_query: Select = sa.select(selects).select_from(self._table)
+        elif dialect_name == "mssql":
+            # mssql requires over(), so we add an empty over() clause; every row then holds the quantiles
+            selects: List[WithinGroup] = [
+                sa.func.percentile_disc(quantile)
+                .within_group(sa.column(column).asc())
+                .over()
+                for column, quantiles in column_quantiles.items()
+                for quantile in quantiles
+            ]
+            quantiles_query: Select = sa.select(selects).select_from(self._table).limit(
+                1
+            )
+        elif dialect_name == "bigquery":
+            # BigQuery does not support "WITHIN", so we need a special case for it
+            selects: List[WithinGroup] = [
+                sa.func.percentile_disc(sa.column(column), quantile).over()
+                for column, quantiles in column_quantiles.items()
+                for quantile in quantiles
+            ]
+            quantiles_query: Select = sa.select(selects).select_from(self._table).limit(
+                1
             )
-        elif self.sql_engine_dialect.name.lower() == "mysql":
-            return self._get_column_quantiles_mysql(column=column, quantiles=quantiles)
         else:
-            return self._get_column_quantiles_generic_sqlalchemy(
-                column=column,
-                quantiles=quantiles,
+            return self._get_columns_quantiles_generic_sqlalchemy(
+                column_quantiles=column_quantiles,
                 allow_relative_error=allow_relative_error,
             )
 
-    def _get_column_quantiles_mssql(self, column: str, quantiles: Iterable) -> list:
-        # mssql requires over(), so we add an empty over() clause
-        selects: List[WithinGroup] = [
-            sa.func.percentile_disc(quantile)
-            .within_group(sa.column(column).asc())
-            .over()
-            for quantile in quantiles
-        ]
-        quantiles_query: Select = sa.select(selects).select_from(self._table)
+        return self._split_quantiles_results(
+            column_quantiles, self._execute_quantiles_query(quantiles_query)
+        )
 
-        try:
-            quantiles_results: RowProxy = self.engine.execute(
-                quantiles_query
-            ).fetchone()
-            return list(quantiles_results)
-        except ProgrammingError as pe:
-            exception_message: str = "An SQL syntax Exception occurred."
-            exception_traceback: str = traceback.format_exc()
-            exception_message += f'{type(pe).__name__}: "{str(pe)}".  Traceback: "{exception_traceback}".'
-            logger.error(exception_message)
-            raise pe
+    def _get_ranked_columns_subquery(self, columns: List[str]) -> Alias:
+        """Return a subquery ranking the values of each column with window functions.
 
-    def _get_column_quantiles_bigquery(self, column: str, quantiles: Iterable) -> list:
-        # BigQuery does not support "WITHIN", so we need a special case for it
-        selects: List[WithinGroup] = [
-            sa.func.percentile_disc(sa.column(column), quantile).over()
-            for quantile in quantiles
-        ]
-        quantiles_query: Select = sa.select(selects).select_from(self._table)
+        For the column at position idx, the subquery holds the value (value_idx), the rank of the value among the
+        non-null values of the column in ascending order (rank_idx, starting at 1), and the number of non-null values
+        of the column (nonnull_count_idx).
+        """
+        selects: List[Label] = []
+        for idx, column in enumerate(columns):
+            selects.extend(
+                [
+                    sa.column(column).label(f"value_{idx}"),
+                    sa.func.row_number()
+                    .over(
+                        # null values are ranked in a partition of their own, whichever end of the order they sort to
+                        partition_by=sa.case(
+                            [(sa.column(column).is_(None), 1)], else_=0
+                        ),
+                        order_by=sa.column(column).asc(),
+                    )
+                    .label(f"rank_{idx}"),
+                    sa.func.count(sa.column(column))
+                    .over()
+                    .label(f"nonnull_count_{idx}"),
+                ]
+            )
+        return sa.select(selects).select_from(self._table).alias("ranked_columns")
 
-        try:
-            quantiles_results: RowProxy = self.engine.execute(
-                quantiles_query
-            ).fetchone()
-            return list(quantiles_results)
-        except ProgrammingError as pe:
-            exception_message: str = "An SQL syntax Exception occurred."
-            exception_traceback: str = traceback.format_exc()
-            exception_message += f'{type(pe).__name__}: "{str(pe)}".  Traceback: "{exception_traceback}".'
-            logger.error(exception_message)
-            raise pe
+    def _get_ranked_quantiles_query(
+        self, column_quantiles: Dict[str, List[float]]
+    ) -> Select:
+        """Return a query computing quantiles from the ranked values of the columns, for dialects without percentiles.
 
-    def _get_column_quantiles_mysql(self, column: str, quantiles: Iterable) -> list:
-        # MySQL does not support "percentile_disc", so we implement it as a compound query.
-        # Please see https://stackoverflow.com/questions/19770026/calculate-percentile-value-using-mysql for reference.
-        percent_rank_query: CTE = sa.select(
-            [
-                sa.column(column),
-                sa.cast(
-                    sa.func.percent_rank().over(order_by=sa.column(column).asc()),
-                    sa.dialects.mysql.DECIMAL(18, 15),
-                ).label("p"),
-            ]
-        ).order_by(sa.column("p").asc()).select_from(self._table).cte("t")
-
-        selects: List[WithinGroup] = []
-        for idx, quantile in enumerate(quantiles):
-            # pymysql cannot handle conversion of numpy float64 to float; convert just in case
-            if np.issubdtype(type(quantile), np.float_):
-                quantile = float(quantile)
-            quantile_column: Label = sa.func.first_value(sa.column(column)).over(
-                order_by=sa.case(
-                    [
-                        (
-                            percent_rank_query.c.p
-                            <= sa.cast(quantile, sa.dialects.mysql.DECIMAL(18, 15)),
-                            percent_rank_query.c.p,
-                        )
-                    ],
-                    else_=None,
-                ).desc()
-            ).label(f"q_{idx}")
-            selects.append(quantile_column)
-        quantiles_query: Select = sa.select(selects).distinct().order_by(
-            percent_rank_query.c.p.desc()
+        The quantile q of a column is the value of smallest rank r with r >= q * n, where n is the number of non-null
+        values; the comparison uses the quantile as a fraction of integers, so that it is exact in SQL.
+        """
+        ranked_columns: Alias = self._get_ranked_columns_subquery(
+            list(column_quantiles.keys())
         )
-
-        try:
-            quantiles_results: RowProxy = self.engine.execute(
-                quantiles_query
-            ).fetchone()
-            return list(quantiles_results)
-        except ProgrammingError as pe:
-            exception_message: str = "An SQL syntax Exception occurred."
-            exception_traceback: str = traceback.format_exc()
-            exception_message += f'{type(pe).__name__}: "{str(pe)}".  Traceback: "{exception_traceback}".'
-            logger.error(exception_message)
-            raise pe
+        selects: List[Label] = []
+        for idx, quantiles in enumerate(column_quantiles.values()):
+            value = ranked_columns.c[f"value_{idx}"]
+            rank = ranked_columns.c[f"rank_{idx}"]
+            nonnull_count = ranked_columns.c[f"nonnull_count_{idx}"]
+            for quantile in quantiles:
+                quantile_fraction = Fraction(str(quantile)).limit_denominator(
+                    self.QUANTILE_MAX_DENOMINATOR
+                )
+                selects.append(
+                    sa.func.min(
+                        sa.case(
+                            [
+                                (
+                                    rank * quantile_fraction.denominator
+                                    >= nonnull_count * quantile_fraction.numerator,
+                                    value,
+                                )
+                            ]
+                        )
+                    )
+                )
+        return sa.select(selects).select_from(ranked_columns)
 
     # Support for computing the quantiles column for PostGreSQL and Redshift is included in the same method as that for
     # the generic sqlalchemy compatible DBMS engine, because users often use the postgresql driver to connect to Redshift
     # The key functional difference is that Redshift does not support the aggregate function
     # "percentile_disc", but does support the approximate percentile_disc or percentile_cont function version instead.```
-    def _get_column_quantiles_generic_sqlalchemy(
-        self, column: str, quantiles: Iterable, allow_relative_error: bool
-    ) -> list:
+    def _get_columns_quantiles_generic_sqlalchemy(
+        self, column_quantiles: Dict[str, List[float]], allow_relative_error: bool
+    ) -> Dict[str, list]:
         selects: List[WithinGroup] = [
             sa.func.percentile_disc(quantile).within_group(sa.column(column).asc())
+            for column, quantiles in column_quantiles.items()
             for quantile in quantiles
         ]
         quantiles_query: Select = sa.select(selects).select_from(self._table)
@@ -908,7 +1784,7 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
             quantiles_results: RowProxy = self.engine.execute(
                 quantiles_query
             ).fetchone()
-            return list(quantiles_results)
+            return self._split_quantiles_results(column_quantiles, quantiles_results)
         except ProgrammingError:
             # ProgrammingError: (psycopg2.errors.SyntaxError) Aggregate function "percentile_disc" is not supported;
             # use approximate percentile_disc or percentile_cont instead.
@@ -922,17 +1798,10 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                     self._table
                 )
                 if allow_relative_error:
-                    try:
-                        quantiles_results: RowProxy = self.engine.execute(
-                            quantiles_query_approx
-                        ).fetchone()
-                        return list(quantiles_results)
-                    except ProgrammingError as pe:
-                        exception_message: str = "An SQL syntax Exception occurred."
-                        exception_traceback: str = traceback.format_exc()
-                        exception_message += f'{type(pe).__name__}: "{str(pe)}".  Traceback: "{exception_traceback}".'
-                        logger.error(exception_message)
-                        raise pe
+                    return self._split_quantiles_results(
+                        column_quantiles,
+                        self._execute_quantiles_query(quantiles_query_approx),
+                    )
                 else:
                     raise ValueError(
                         f'The SQL engine dialect "{str(self.sql_engine_dialect)}" does not support computing quantiles '
@@ -944,6 +1813,31 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
                     "approximation error; set allow_relative_error to False to disable approximate quantiles."
                 )
 
+    def _execute_quantiles_query(self, quantiles_query: Select) -> RowProxy:
+        try:
+            return self.engine.execute(quantiles_query).fetchone()
+        except ProgrammingError as pe:
+            exception_message: str = "An SQL syntax Exception occurred."
+            exception_traceback: str = traceback.format_exc()
+            exception_message += f'{type(pe).__name__}: "{str(pe)}".  Traceback: "{exception_traceback}".'
+            logger.error(exception_message)
+            raise pe
+
+    @staticmethod
+    def _split_quantiles_results(
+        column_quantiles: Dict[str, List[float]], quantiles_results: RowProxy
+    ) -> Dict[str, list]:
+        """Split the single row of quantile values computed for several columns into a list per column"""
+        quantiles_results: list = list(quantiles_results)
+        columns_quantiles: Dict[str, list] = {}
+        start: int = 0
+        for column, quantiles in column_quantiles.items():
+            columns_quantiles[column] = quantiles_results[
+                start : start + len(quantiles)
+            ]
+            start += len(quantiles)
+        return columns_quantiles
+
     def get_column_stdev(self, column):
         if self.sql_engine_dialect.name.lower() == "mssql":
             # Note: "stdev_samp" is not a recognized built-in function name (but "stdev" does exist for "mssql").
@@ -962,13 +1856,178 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
             ).fetchone()
         return float(res[0])
 
+    def _get_column_metrics_batch(self, columns, metrics):
+        selects = [sa.func.count().label("row_count")]
+        for idx, column in enumerate(columns):
+            if self.batch_kwargs.get("use_quoted_name"):
+                column = quoted_name(column, quote=True)
+            for metric in metrics:
+                selects.append(
+                    self._get_column_metric_expression(column, metric).label(
+                        f"{metric}_{idx}"
+                    )
+                )
+        row = self.engine.execute(
+            sa.select(selects).select_from(self._table)
+        ).fetchone()
+
+        column_metrics = {}
+        for idx, column in enumerate(columns):
+            column_metrics[column] = {}
+            for metric in metrics:
+                value = row[f"{metric}_{idx}"]
+                if metric == "nonnull_count":
+                    value = int(value or 0)
+                elif metric == "stdev" and value is not None:
+                    value = float(value)
+                column_metrics[column][metric] = value
+        return int(row["row_count"]), column_metrics
+
+    def _get_column_metric_expression(self, column, metric):
+        """Return the aggregate expression computing metric, matching the corresponding get_column_<metric>"""
+        if metric == "nonnull_count":
+            return sa.func.count(sa.column(column))
+        elif metric == "min":
+            return sa.func.min(sa.column(column))
+        elif metric == "max":
+            return sa.func.max(sa.column(column))
+        elif metric == "mean":
+            return sa.func.avg(sa.column(column))
+        elif metric == "sum":
+            return sa.func.sum(sa.column(column))
+        elif metric == "unique_count":
+            return sa.func.count(sa.func.distinct(sa.column(column)))
+        elif metric == "stdev":
+            if self.sql_engine_dialect.name.lower() == "mssql":
+                return sa.func.stdev(sa.column(column))
+            return sa.func.stddev_samp(sa.column(column))
+        raise ValueError("Unsupported metric for batched computation: %s" % metric)
+
     def get_column_hist(self, column, bins):
         """return a list of counts corresponding to bins
 
+        Values are counted per bin with a single GROUP BY over the index of the bin holding each value, rather than
+        with one SUM(CASE ...) per bin. Each bin includes its lower edge, the last bin also its upper edge, and infinite
+        outer edges leave the outer bins unbounded.
+
         Args:
             column: the name of the column for which to get the histogram
             bins: tuple of bin edges for which to get histogram values; *must* be tuple to support caching
         """
+        bins = list(bins)
+        if len(bins) < 3:
+            return self._get_column_hist_with_case_conditions(column, bins)
+
+        n_bins = len(bins) - 1
+        lower_is_infinite = bins[0] in [
+            get_sql_dialect_floating_point_infinity_value(
+                schema="api_np", negative=True
+            ),
+            get_sql_dialect_floating_point_infinity_value(
+                schema="api_cast", negative=True
+            ),
+        ]
+        upper_is_infinite = bins[-1] in [
+            get_sql_dialect_floating_point_infinity_value(
+                schema="api_np", negative=False
+            ),
+            get_sql_dialect_floating_point_infinity_value(
+                schema="api_cast", negative=False
+            ),
+        ]
+
+        conditions = [sa.column(column) != None]
+        if not lower_is_infinite:
+            conditions.append(sa.column(column) >= bins[0])
+        if not upper_is_infinite:
+            conditions.append(sa.column(column) <= bins[-1])
+        bucket = self._get_column_hist_bucket_expression(
+            column, bins, lower_is_infinite, upper_is_infinite
+        )
+        bucketed = (
+            sa.select([bucket.label("bucket")])
+            .select_from(self._table)
+            .where(sa.and_(*conditions))
+            .alias("bucketed")
+        )
+        query = (
+            sa.select([sa.column("bucket"), sa.func.count().label("bucket_count")])
+            .select_from(bucketed)
+            .group_by(sa.column("bucket"))
+        )
+
+        hist = [0] * n_bins
+        for bucket_index, bucket_count in self.engine.execute(query).fetchall():
+            hist[min(int(bucket_index), n_bins - 1)] += int(bucket_count)
+        return hist
+
+    def _get_column_hist_bucket_expression(
+        self, column, bins, lower_is_infinite, upper_is_infinite
+    ):
+        """Returns an expression of the index of the bin holding the value of column, which is the number of inner
+        bin edges less than or equal to the value.
+
+        Postgres counts the edges with width_bucket over an array of them. Otherwise, uniform bins with integral
+        edges compute the index with FLOOR, and any other bins with CASE expressions nested to binary search the
+        edges, so that each value is compared with about log2(len(bins)) edges. Infinite outer edges are not inner edges,
+        so they need no special handling.
+        """
+        inner_edges = bins[1:-1]
+        if self.sql_engine_dialect.name.lower() == "postgresql":
+            from sqlalchemy.dialects import postgresql
+
+            return sa.func.width_bucket(
+                sa.cast(sa.column(column), sa.Float),
+                sa.cast(postgresql.array(inner_edges), postgresql.ARRAY(sa.Float)),
+            )
+
+        if not lower_is_infinite and not upper_is_infinite:
+            lower, width = bins[0], bins[1] - bins[0]
+            if (
+                width > 0
+                and all(
+                    isinstance(edge, (int, float, np.integer))
+                    and float(edge).is_integer()
+                    for edge in bins
+                )
+                and all(bins[idx] == lower + idx * width for idx in range(len(bins)))
+            ):
+                lower, width = int(lower), int(width)
+                # the arithmetic on integral edges is exact, but dividing a value may round it across an edge,
+                # so the estimate is corrected against the edges either side of it. Values are at least bins[0],
+                # so truncating to an integer takes the floor (not every dialect has a FLOOR function).
+                estimate = sa.cast(
+                    (sa.column(column) - lower) / float(width), sa.Integer
+                )
+                return sa.case(
+                    [
+                        (sa.column(column) < estimate * width + lower, estimate - 1),
+                        (
+                            sa.column(column) >= (estimate + 1) * width + lower,
+                            estimate + 1,
+                        ),
+                    ],
+                    else_=estimate,
+                )
+
+        def count_edges_less_than_or_equal(low, high):
+            # the value is known to be at least inner_edges[low - 1] and less than inner_edges[high]
+            if low == high:
+                return sa.literal(low)
+            mid = (low + high) // 2
+            return sa.case(
+                [
+                    (
+                        sa.column(column) < inner_edges[mid],
+                        count_edges_less_than_or_equal(low, mid),
+                    )
+                ],
+                else_=count_edges_less_than_or_equal(mid + 1, high),
+            )
+
+        return count_edges_less_than_or_equal(0, len(inner_edges))
+
+    def _get_column_hist_with_case_conditions(self, column, bins):
         case_conditions = []
         idx = 0
         bins = list(bins)
@@ -1150,6 +2209,51 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
 
         return self.engine.execute(query).scalar()
 
+    def get_column_sample_values(self, column, sample_size, seed=None):
+        """Fetch up to sample_size non-null values of column, chosen by ordering the rows on a random number.
+
+        Only MySQL seeds its random number generator per query; other dialects ignore the seed. Values are returned \
+        as floats, for sampling numeric columns.
+        """
+        query = (
+            sa.select([sa.column(column)])
+            .where(sa.column(column) != None)
+            .select_from(self._table)
+        )
+        if self.get_column_nonnull_count(column) > sample_size:
+            dialect_name = self.engine.dialect.name.lower()
+            if dialect_name == "mysql":
+                random_value = sa.func.rand(*([int(seed)] if seed is not None else []))
+            elif dialect_name == "mssql":
+                random_value = sa.func.newid()
+            elif dialect_name == "bigquery":
+                random_value = sa.func.rand()
+            else:
+                random_value = sa.func.random()
+            query = query.order_by(random_value).limit(sample_size)
+        # PRECISION NOTE: NUMERIC columns produce Decimal values, which are cast to float for numpy
+        return np.array(
+            [row[0] for row in self.engine.execute(query).fetchall()], dtype=float
+        )
+
+    def _build_column_sketch(self, column, sketch):
+        """Stream the non-null values of column from a single query, updating sketch with each chunk of rows
+        fetched, so that the values are never all held in memory."""
+        result = self.engine.execute(
+            sa.select([sa.column(column)])
+            .where(sa.column(column) != None)
+            .select_from(self._table)
+            .execution_options(stream_results=True)
+        )
+        try:
+            while True:
+                rows = result.fetchmany(SKETCH_CHUNK_SIZE)
+                if not rows:
+                    return sketch
+                sketch.update([row[0] for row in rows])
+        finally:
+            result.close()
+
     def create_temporary_table(self, table_name, custom_sql, schema_name=None):
         """
         Create Temporary table based on sql query. This will be used as a basis for executing expectations.
@@ -1228,7 +2332,9 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
     def column_reflection_fallback(self):
         """If we can't reflect the table, use a query to at least get column names."""
         col_info_dict_list: List[Dict]
-        if self.sql_engine_dialect.name.lower() == "mssql":
+        if self.sql_engine_dialect.name.lower() == "mssql" and isinstance(
+            self._table, sa.Table
+        ):
             type_module = self._get_dialect_type_module()
             # Get column names and types from the database
             # StackOverflow to the rescue: https://stackoverflow.com/a/38634368
@@ -1251,6 +2357,13 @@ WHERE
                 {"name": col_name, "type": getattr(type_module, col_type.upper())()}
                 for col_name, col_type in col_info_tuples_list
             ]
+        elif not isinstance(self._table, sa.Table):
+            # a subquery may have to be computed in full to find a single row, so select no rows at all
+            query: Select = sa.select([sa.text("*")]).select_from(self._table).where(
+                sa.false()
+            )
+            col_names: list = self.engine.execute(query).keys()
+            col_info_dict_list = [{"name": col_name} for col_name in col_names]
         else:
             query: Select = sa.select([sa.text("*")]).select_from(self._table).limit(1)
             col_names: list = self.engine.execute(query).keys()
@@ -1532,23 +2645,31 @@ WHERE
         if type_list is None:
             success = True
         else:
-            types = []
-            type_module = self._get_dialect_type_module()
-            for type_ in type_list:
-                try:
-                    type_class = getattr(type_module, type_)
-                    types.append(type_class)
-                except AttributeError:
-                    logger.debug("Unrecognized type: %s" % type_)
-            if len(types) == 0:
-                logger.warning(
-                    "No recognized sqlalchemy types in type_list for current dialect."
-                )
-            types = tuple(types)
-            success = issubclass(col_type, types)
+            success = issubclass(col_type, self._get_type_classes(type_list))
 
         return {"success": success, "result": {"observed_value": col_type.__name__}}
 
+    def _get_type_classes(self, type_list):
+        types = []
+        type_module = self._get_dialect_type_module()
+        for type_ in type_list:
+            try:
+                type_class = getattr(type_module, type_)
+                types.append(type_class)
+            except AttributeError:
+                logger.debug("Unrecognized type: %s" % type_)
+        if len(types) == 0:
+            logger.warning(
+                "No recognized sqlalchemy types in type_list for current dialect."
+            )
+        return tuple(types)
+
+    def _column_type_in_type_list(self, column, type_list):
+        col_data = [col for col in self.columns if col["name"] == column]
+        if len(col_data) == 0 or "type" not in col_data[0]:
+            return None
+        return issubclass(type(col_data[0]["type"]), self._get_type_classes(type_list))
+
     @DocInherit
     @MetaSqlAlchemyDataset.column_map_expectation
     def expect_column_values_to_be_in_set(
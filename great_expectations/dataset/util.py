@@ -1,13 +1,29 @@
 # Utility methods for dealing with Dataset objects
 
 import logging
+import operator
+import re
 import warnings
+from functools import lru_cache
 from typing import Any, Dict, List, Union
 
 import numpy as np
 import pandas as pd
+from pyparsing import (
+    CaselessKeyword,
+    Group,
+    ParseException,
+    QuotedString,
+    Regex,
+    Suppress,
+    infixNotation,
+    oneOf,
+    opAssoc,
+)
 from scipy import stats
 
+from great_expectations.core.sketch import QuantileSketch
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -136,7 +152,8 @@ def kde_partition_data(data, estimate_tails=True):
     """Convenience method for building a partition and weights using a gaussian Kernel Density Estimate and default bandwidth.
 
     Args:
-        data (list-like): The data from which to construct the estimate
+        data (list-like or QuantileSketch): The data from which to construct the estimate; the estimate of a \
+            QuantileSketch is built from the values it keeps, weighted by the number of values each stands for
         estimate_tails (bool): Whether to estimate the tails of the distribution to keep the partition object finite
 
     Returns:
@@ -149,7 +166,12 @@ def kde_partition_data(data, estimate_tails=True):
 
         See :ref:`partition_object`.
     """
-    kde = stats.kde.gaussian_kde(data)
+    if isinstance(data, QuantileSketch):
+        values, weights = data.get_weighted_values()
+        kde = stats.kde.gaussian_kde(values, weights=weights)
+        data = np.array([data.min, data.max])
+    else:
+        kde = stats.kde.gaussian_kde(data)
     evaluation_bins = np.linspace(
         start=np.min(data) - (kde.covariance_factor() / 2),
         stop=np.max(data) + (kde.covariance_factor() / 2),
@@ -227,7 +249,12 @@ def continuous_partition_data(data, bins="auto", n_bins=10, **kwargs):
 
 
 def build_continuous_partition_object(
-    dataset, column, bins="auto", n_bins=10, allow_relative_error=False
+    dataset,
+    column,
+    bins="auto",
+    n_bins=10,
+    allow_relative_error=False,
+    use_sketches=False,
 ):
     """Convenience method for building a partition object on continuous data from a dataset and column
 
@@ -241,6 +268,8 @@ def build_continuous_partition_object(
             values, True to allow approximate values on systems with only binary choice (e.g. Redshift), and to a
             value between zero and one for systems that allow specification of relative error (e.g.
             SparkDFDataset).
+        use_sketches (boolean): if True, the bins and weights are estimated from the mergeable quantile sketch of \
+            the column (see Dataset.get_column_quantile_sketch) rather than from exact quantiles and histograms.
 
     Returns:
 
@@ -253,15 +282,20 @@ def build_continuous_partition_object(
 
             See :ref:`partition_object`.
     """
-    bins = dataset.get_column_partition(column, bins, n_bins, allow_relative_error)
-    if isinstance(bins, np.ndarray):
-        bins = bins.tolist()
+    if use_sketches:
+        sketch = dataset.get_column_quantile_sketch(column)
+        bins = get_quantile_sketch_partition(sketch, bins, n_bins).tolist()
+        weights = list(np.array(sketch.get_hist(bins)) / sketch.count)
     else:
-        bins = list(bins)
-    weights = list(
-        np.array(dataset.get_column_hist(column, tuple(bins)))
-        / dataset.get_column_nonnull_count(column)
-    )
+        bins = dataset.get_column_partition(column, bins, n_bins, allow_relative_error)
+        if isinstance(bins, np.ndarray):
+            bins = bins.tolist()
+        else:
+            bins = list(bins)
+        weights = list(
+            np.array(dataset.get_column_hist(column, tuple(bins)))
+            / dataset.get_column_nonnull_count(column)
+        )
     tail_weights = (1 - sum(weights)) / 2
     partition_object = {
         "bins": bins,
@@ -271,7 +305,41 @@ def build_continuous_partition_object(
     return partition_object
 
 
-def build_categorical_partition_object(dataset, column, sort="value"):
+def get_quantile_sketch_partition(sketch, bins="uniform", n_bins=10):
+    """Get a partition of the range of the values summarized by a QuantileSketch, estimated as
+    Dataset.get_column_partition computes it from exact quantiles.
+
+    Args:
+        sketch (QuantileSketch): the sketch of the values
+        bins: 'uniform' for evenly spaced bins, 'ntile' for bins spaced according to quantiles, or 'auto'
+        n_bins: the number of bins to produce, unless bins is 'auto'
+
+    Returns:
+        np.ndarray: the bin edges
+    """
+    if bins == "uniform":
+        return np.linspace(start=sketch.min, stop=sketch.max, num=n_bins + 1)
+    elif bins in ["ntile", "quantile", "percentile"]:
+        return np.array(
+            sketch.get_quantiles(tuple(np.linspace(start=0, stop=1, num=n_bins + 1)))
+        )
+    elif bins == "auto":
+        # Use the method from numpy histogram_bin_edges, as get_column_partition
+        sturges = np.log2(sketch.count + 1)
+        min_, _25, _75, max_ = sketch.get_quantiles((0.0, 0.25, 0.75, 1.0))
+        iqr = _75 - _25
+        if iqr < 1e-10:  # Consider IQR 0 and do not use variance-based estimator
+            n_bins = int(np.ceil(sturges))
+        else:
+            fd = (2 * float(iqr)) / (sketch.count ** (1 / 3))
+            n_bins = max(int(np.ceil(sturges)), int(np.ceil(float(max_ - min_) / fd)))
+        return np.linspace(start=min_, stop=max_, num=n_bins + 1)
+    raise ValueError("Invalid parameter for bins argument")
+
+
+def build_categorical_partition_object(
+    dataset, column, sort="value", use_sketches=False
+):
     """Convenience method for building a partition object on categorical data from a dataset and column
 
     Args:
@@ -281,6 +349,9 @@ def build_categorical_partition_object(dataset, column, sort="value"):
             - if "value" then values in the resulting partition object will be sorted lexigraphically
             - if "count" then values will be sorted according to descending count (frequency)
             - if "none" then values will not be sorted
+        use_sketches (boolean): if True, the weights are estimated from the mergeable frequent values sketch of the \
+            column (see Dataset.get_column_frequent_values_sketch). Only the most frequent values are kept by the \
+            sketch if the column holds more distinct values than its capacity, and the weights are normalized over them.
 
     Returns:
         A new partition_object::
@@ -291,6 +362,13 @@ def build_categorical_partition_object(dataset, column, sort="value"):
         }
         See :ref:`partition_object`.
     """
+    if use_sketches:
+        sketch = dataset.get_column_frequent_values_sketch(column)
+        counts = sketch.get_frequencies(sort)
+        return {
+            "values": list(counts.index),
+            "weights": list(np.array(counts) / counts.sum()),
+        }
     counts = dataset.get_column_value_counts(column, sort)
     return {
         "values": list(counts.index),
@@ -298,6 +376,62 @@ def build_categorical_partition_object(dataset, column, sort="value"):
     }
 
 
+# the number of values drawn at once when bootstrapping, bounding the memory used by the bootstrap sample matrix
+BOOTSTRAP_CHUNK_SIZE = 1000000
+
+
+def bootstrapped_ks_test_p_values(
+    values, partition_object, bootstrap_samples, bootstrap_sample_size, seed=None
+):
+    """Compute the p-values of two-sided Kolmogorov-Smirnov tests of bootstrap samples of values against the
+    piecewise uniform distribution described by a continuous partition object.
+
+    Rather than running one scipy.stats.kstest per bootstrap sample, the samples are drawn as the rows of a single
+    (bootstrap_samples, bootstrap_sample_size) matrix, sorted along each row, and the KS statistics of all rows are
+    evaluated against the interpolated CDF at once.
+
+    Args:
+        values (array-like): the values to draw the bootstrap samples from, with replacement
+        partition_object (dict): a valid continuous partition object with finite endpoints
+        bootstrap_samples (int): the number of bootstrap samples
+        bootstrap_sample_size (int): the number of values in each bootstrap sample
+        seed (int or None): a seed for the random number generator; if None, numpy's global random state is used
+
+    Returns:
+        np.ndarray: the p-value of the KS test of each bootstrap sample
+    """
+    values = np.asarray(values)
+    bins = partition_object["bins"]
+    cdf_values = np.append(np.array([0]), np.cumsum(partition_object["weights"]))
+    random_state = np.random.RandomState(seed) if seed is not None else np.random
+    n = bootstrap_sample_size
+    # the empirical CDF just after and just before each of the sorted values of a sample
+    upper_ecdf = np.arange(1.0, n + 1) / n
+    lower_ecdf = np.arange(0.0, n) / n
+    kstwo = getattr(stats, "kstwo", None)
+
+    chunk_rows = max(1, BOOTSTRAP_CHUNK_SIZE // n)
+    p_values = []
+    for start in range(0, bootstrap_samples, chunk_rows):
+        rows = min(chunk_rows, bootstrap_samples - start)
+        samples = np.sort(random_state.choice(values, size=(rows, n)), axis=1)
+        if kstwo is None:
+            # scipy < 1.4 lacks the exact distribution of the two-sided statistic that kstest uses since
+            p_values.append(
+                [
+                    stats.kstest(sample, lambda x: np.interp(x, bins, cdf_values))[1]
+                    for sample in samples
+                ]
+            )
+            continue
+        cdf = np.interp(samples, bins, cdf_values)
+        statistics = np.maximum(
+            (upper_ecdf - cdf).max(axis=1), (cdf - lower_ecdf).max(axis=1)
+        )
+        p_values.append(np.clip(kstwo.sf(statistics, n), 0, 1))
+    return np.concatenate(p_values) if p_values else np.array([])
+
+
 def infer_distribution_parameters(data, distribution, params=None):
     """Convenience method for determining the shape parameters of a given distribution
 
@@ -622,3 +756,160 @@ def check_sql_engine_dialect(
         return isinstance(actual_sql_engine_dialect, candidate_sql_engine_dialect)
     except (AttributeError, TypeError):
         return False
+
+
+# condition_parser for row_conditions written in the backend-independent great_expectations condition syntax
+GE_CONDITION_PARSER = "great_expectations__experimental__"
+
+_ROW_CONDITION_COMPARISON_OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+
+_row_condition_grammar = None
+
+
+def _get_row_condition_grammar():
+    """Builds the grammar of the great_expectations condition syntax, e.g.
+
+        col("age") >= 18 & (col("state") == "CA" | col("state").isNull())
+
+    Comparisons of a column against a string or number literal and null checks may be combined with
+    & / and, | / or, ~ / not and parentheses.
+    """
+    global _row_condition_grammar
+    if _row_condition_grammar is None:
+        column = (
+            Suppress("col(")
+            + (QuotedString('"', escChar="\\") | QuotedString("'", escChar="\\"))
+            + Suppress(")")
+        )
+        number = Regex(r"[+-]?\d+(?:\.\d*)?(?:[eE][+-]?\d+)?").setParseAction(
+            lambda t: float(t[0]) if any(c in t[0] for c in ".eE") else int(t[0])
+        )
+        string = QuotedString('"', escChar="\\") | QuotedString("'", escChar="\\")
+        comparison = Group(
+            column
+            + oneOf(list(_ROW_CONDITION_COMPARISON_OPERATORS))
+            + (string | number)
+        ).setParseAction(lambda t: ("compare",) + tuple(t[0]))
+        null_check = Group(
+            column + Suppress(".") + oneOf(["isNull", "notNull"]) + Suppress("()")
+        ).setParseAction(lambda t: (t[0][1], t[0][0]))
+        _row_condition_grammar = infixNotation(
+            comparison | null_check,
+            [
+                (CaselessKeyword("not") | "~", 1, opAssoc.RIGHT),
+                (CaselessKeyword("and") | "&", 2, opAssoc.LEFT),
+                (CaselessKeyword("or") | "|", 2, opAssoc.LEFT),
+            ],
+        )
+    return _row_condition_grammar
+
+
+def parse_row_condition(row_condition):
+    """Parses a row_condition written in the great_expectations condition syntax into a tree of tuples:
+    ("compare", column, operator, value), ("isNull", column), ("notNull", column), ("not", operand),
+    ("and", [operands]) and ("or", [operands]).
+
+    Raises:
+        ValueError if the row_condition is not valid
+    """
+    try:
+        parsed = _get_row_condition_grammar().parseString(row_condition, parseAll=True)
+    except ParseException as e:
+        raise ValueError(
+            "Unable to parse row_condition {}: {}".format(repr(row_condition), e)
+        )
+    return _build_row_condition_tree(parsed[0])
+
+
+def _build_row_condition_tree(parsed):
+    if isinstance(parsed, tuple):
+        return parsed
+    tokens = list(parsed)
+    if len(tokens) == 2:
+        return ("not", _build_row_condition_tree(tokens[1]))
+    # binary operations are grouped as [operand, operator, operand, operator, ...]
+    op = "and" if tokens[1].lower() in ["and", "&"] else "or"
+    return (op, [_build_row_condition_tree(operand) for operand in tokens[::2]])
+
+
+def build_row_condition(tree, column, and_, or_, not_, is_null):
+    """Builds a backend-specific filter from a tree returned by parse_row_condition.
+
+    Args:
+        tree: the parsed row_condition
+        column: function returning the backend column object for a column name
+        and_, or_: functions combining any number of filters
+        not_: function negating a filter
+        is_null: function returning the filter selecting null values of a column object
+    """
+    kind = tree[0]
+    if kind == "compare":
+        _, column_name, op, value = tree
+        return _ROW_CONDITION_COMPARISON_OPERATORS[op](column(column_name), value)
+    elif kind == "isNull":
+        return is_null(column(tree[1]))
+    elif kind == "notNull":
+        return not_(is_null(column(tree[1])))
+    elif kind == "not":
+        return not_(build_row_condition(tree[1], column, and_, or_, not_, is_null))
+    operands = [
+        build_row_condition(operand, column, and_, or_, not_, is_null)
+        for operand in tree[1]
+    ]
+    return and_(*operands) if kind == "and" else or_(*operands)
+
+
+# constructs whose meaning changes when a regex is embedded in an alternation of several regexes: backreferences,
+# conditional group references and named groups, whose numbers and names would clash between the regexes, and inline
+# flags applying to the whole regex
+UNCOMBINABLE_REGEX_PATTERN = re.compile(
+    r"\\[1-9]|\\k<|\(\?\(|\(\?P[<=]|\(\?<[A-Za-z]|\(\?[aiLmsux]+\)"
+)
+
+
+@lru_cache(maxsize=1024)
+def combine_regex_list(regex_list):
+    """Combine regexes into a single alternation, which matches (e.g. with re.search or rlike) wherever any of them
+    matches.
+
+    Args:
+        regex_list (tuple of str): the regexes to combine
+
+    Returns:
+        str or None: the combined regex, or None if any of the regexes uses a construct whose meaning depends on its \
+        position in the combined regex (see UNCOMBINABLE_REGEX_PATTERN), in which case the regexes must be evaluated \
+        separately
+    """
+    if len(regex_list) == 1:
+        return regex_list[0]
+    if any(UNCOMBINABLE_REGEX_PATTERN.search(regex) for regex in regex_list):
+        return None
+    return "|".join("(?:{})".format(regex) for regex in regex_list)
+
+
+@lru_cache(maxsize=1024)
+def compile_regex_list(regex_list, combine=False):
+    """Compile regexes, caching the compiled patterns for expectations evaluating the same regexes again.
+
+    Args:
+        regex_list (tuple of str): the regexes to compile
+        combine (bool): whether to combine the regexes into a single pattern matching wherever any of them matches, \
+            where possible (see combine_regex_list)
+
+    Returns:
+        tuple of re.Pattern: the compiled regexes, or the single compiled combined regex
+    """
+    # compile each regex on its own first, so that invalid regexes raise the same errors whether combined or not
+    compiled_regexes = tuple(re.compile(regex) for regex in regex_list)
+    if combine:
+        combined_regex = combine_regex_list(regex_list)
+        if combined_regex is not None:
+            return (re.compile(combined_regex),)
+    return compiled_regexes
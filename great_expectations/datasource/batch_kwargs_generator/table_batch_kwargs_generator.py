@@ -101,6 +101,10 @@ class TableBatchKwargsGenerator(BatchKwargsGenerator):
             self.engine = datasource.engine
             try:
                 self.inspector = sqlalchemy.inspect(self.engine)
+                # share reflection results with the batches of the datasource
+                reflection_cache = getattr(datasource, "reflection_cache", None)
+                if reflection_cache is not None:
+                    self.inspector = reflection_cache.get_inspector(self.engine)
 
             except sqlalchemy.exc.OperationalError:
                 logger.warning(
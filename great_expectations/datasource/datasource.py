@@ -109,6 +109,9 @@ to configure the datasource to load and return DataAssets of the custom type.
     """
 
     recognized_batch_parameters = {"limit"}
+    # whether batches loading only some columns of their source (see the "columns" batch_kwargs) still report all of
+    # its columns, from its schema, to table expectations on the set of columns
+    table_columns_from_schema = False
 
     @classmethod
     def from_configuration(cls, **kwargs):
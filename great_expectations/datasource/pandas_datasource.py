@@ -14,21 +14,34 @@ from great_expectations.types import ClassConfig
 
 from ..types.configurations import classConfigSchema
 from .datasource import Datasource
-from .util import S3Url, hash_pandas_dataframe
+from .util import (
+    S3Url,
+    fingerprint_file,
+    fingerprint_pandas_dataframe,
+    fingerprint_s3_object,
+)
 
 logger = logging.getLogger(__name__)
 
 HASH_THRESHOLD = 1e9
+# Object columns of frames larger than HASH_THRESHOLD are fingerprinted from a sample of this many rows
+FINGERPRINT_OBJECT_SAMPLE_SIZE = 100000
 
 
 class PandasDatasource(Datasource):
     """The PandasDatasource produces PandasDataset objects and supports generators capable of
     interacting with the local filesystem (the default subdir_reader generator), and from
     existing in-memory dataframes.
+
+    With reader_engine "pyarrow", csv and parquet files are read with pyarrow, decoding on several threads (see
+    _read_with_pyarrow). With prune_columns, batches that a DataContext
+    builds for an expectation suite only load the columns the suite refers to (see
+    ExpectationSuite.get_referenced_columns), by adding them to the batch_kwargs as "columns".
     """
 
     recognized_batch_parameters = {
         "reader_method",
+        "reader_engine",
         "reader_options",
         "limit",
         "dataset_options",
@@ -44,6 +57,8 @@ class PandasDatasource(Datasource):
         reader_method=None,
         reader_options=None,
         limit=None,
+        reader_engine=None,
+        prune_columns=False,
         **kwargs
     ):
         """
@@ -56,6 +71,8 @@ class PandasDatasource(Datasource):
             reader_method: Optional default reader_method for generated batches
             reader_options: Optional default reader_options for generated batches
             limit: Optional default limit for generated batches
+            reader_engine: Optional default reader_engine for generated batches: "pandas" or "pyarrow"
+            prune_columns: Whether batches built for an expectation suite load only the columns it refers to
             **kwargs: Additional kwargs to be part of the datasource constructor's initialization
 
         Returns:
@@ -101,6 +118,12 @@ class PandasDatasource(Datasource):
         if limit is not None:
             configuration["limit"] = limit
 
+        if reader_engine is not None:
+            configuration["reader_engine"] = reader_engine
+
+        if prune_columns:
+            configuration["prune_columns"] = prune_columns
+
         return configuration
 
     def __init__(
@@ -113,6 +136,8 @@ class PandasDatasource(Datasource):
         reader_method=None,
         reader_options=None,
         limit=None,
+        reader_engine=None,
+        prune_columns=False,
         **kwargs
     ):
         configuration_with_defaults = PandasDatasource.build_configuration(
@@ -122,6 +147,8 @@ class PandasDatasource(Datasource):
             reader_method=reader_method,
             reader_options=reader_options,
             limit=limit,
+            reader_engine=reader_engine,
+            prune_columns=prune_columns,
             **kwargs
         )
 
@@ -142,9 +169,15 @@ class PandasDatasource(Datasource):
         self._reader_method = configuration_with_defaults.get("reader_method", None)
         self._reader_options = configuration_with_defaults.get("reader_options", None)
         self._limit = configuration_with_defaults.get("limit", None)
+        self._reader_engine = configuration_with_defaults.get("reader_engine", None)
 
     def process_batch_parameters(
-        self, reader_method=None, reader_options=None, limit=None, dataset_options=None,
+        self,
+        reader_method=None,
+        reader_options=None,
+        limit=None,
+        dataset_options=None,
+        reader_engine=None,
     ):
         # Note that we do not pass limit up, since even that will be handled by PandasDatasource
         batch_kwargs = super().process_batch_parameters(dataset_options=dataset_options)
@@ -178,6 +211,12 @@ class PandasDatasource(Datasource):
         if reader_method is not None:
             batch_kwargs["reader_method"] = reader_method
 
+        if self._reader_engine:
+            batch_kwargs["reader_engine"] = self._reader_engine
+
+        if reader_engine is not None:
+            batch_kwargs["reader_engine"] = reader_engine
+
         return batch_kwargs
 
     def get_batch(self, batch_kwargs, batch_parameters=None):
@@ -193,11 +232,32 @@ class PandasDatasource(Datasource):
             }
         )
 
+        reader_engine = batch_kwargs.get("reader_engine")
+        if reader_engine not in [None, "pandas", "pyarrow"]:
+            raise BatchKwargsError(
+                "Unknown reader_engine %s; use pandas or pyarrow." % reader_engine,
+                batch_kwargs,
+            )
+        columns = batch_kwargs.get("columns")
+
         if "path" in batch_kwargs:
             path = batch_kwargs["path"]
             reader_method = batch_kwargs.get("reader_method")
-            reader_fn = self._get_reader_fn(reader_method, path)
-            df = reader_fn(path, **reader_options)
+            if reader_engine == "pyarrow":
+                df = self._read_with_pyarrow(
+                    path, reader_method, path, reader_options, columns
+                )
+            else:
+                reader_fn = self._get_reader_fn(reader_method, path)
+                df = reader_fn(
+                    path,
+                    **self._get_projected_reader_options(
+                        reader_fn, reader_options, columns
+                    )
+                )
+            file_fingerprint = fingerprint_file(path)
+            if file_fingerprint is not None:
+                batch_markers["file_fingerprint"] = file_fingerprint
 
         elif "s3" in batch_kwargs:
             try:
@@ -215,17 +275,34 @@ class PandasDatasource(Datasource):
                 "Fetching s3 object. Bucket: {} Key: {}".format(url.bucket, url.key)
             )
             s3_object = s3.get_object(Bucket=url.bucket, Key=url.key)
-            reader_fn = self._get_reader_fn(reader_method, url.key)
-            default_reader_options = self._infer_default_options(
-                reader_fn, reader_options
-            )
-            if not reader_options.get("encoding") and default_reader_options.get(
-                "encoding"
-            ):
-                reader_options["encoding"] = s3_object.get(
-                    "ContentEncoding", default_reader_options.get("encoding")
+            if reader_engine == "pyarrow":
+                df = self._read_with_pyarrow(
+                    BytesIO(s3_object["Body"].read()),
+                    reader_method,
+                    url.key,
+                    reader_options,
+                    columns,
+                )
+            else:
+                reader_fn = self._get_reader_fn(reader_method, url.key)
+                default_reader_options = self._infer_default_options(
+                    reader_fn, reader_options
+                )
+                if not reader_options.get("encoding") and default_reader_options.get(
+                    "encoding"
+                ):
+                    reader_options["encoding"] = s3_object.get(
+                        "ContentEncoding", default_reader_options.get("encoding")
+                    )
+                df = reader_fn(
+                    BytesIO(s3_object["Body"].read()),
+                    **self._get_projected_reader_options(
+                        reader_fn, reader_options, columns
+                    )
                 )
-            df = reader_fn(BytesIO(s3_object["Body"].read()), **reader_options)
+            file_fingerprint = fingerprint_s3_object(s3_object)
+            if file_fingerprint is not None:
+                batch_markers["file_fingerprint"] = file_fingerprint
 
         elif "dataset" in batch_kwargs and isinstance(
             batch_kwargs["dataset"], (pd.DataFrame, pd.Series)
@@ -242,8 +319,20 @@ class PandasDatasource(Datasource):
                 batch_kwargs,
             )
 
+        if columns is not None:
+            columns = set(columns)
+            if any(column not in columns for column in df.columns):
+                df = df[[column for column in df.columns if column in columns]]
+
         if df.memory_usage().sum() < HASH_THRESHOLD:
-            batch_markers["pandas_data_fingerprint"] = hash_pandas_dataframe(df)
+            batch_markers["pandas_data_fingerprint"] = fingerprint_pandas_dataframe(df)
+        else:
+            # a sampled fingerprint can miss changes, so it is never used as a metric cache key
+            batch_markers[
+                "pandas_data_fingerprint_sampled"
+            ] = fingerprint_pandas_dataframe(
+                df, object_sample_size=FINGERPRINT_OBJECT_SAMPLE_SIZE
+            )
 
         return Batch(
             datasource_name=self.name,
@@ -296,6 +385,90 @@ class PandasDatasource(Datasource):
         else:
             return {"encoding": "utf-8"}
 
+    @staticmethod
+    def _get_projected_reader_options(reader_fn, reader_options, columns):
+        """Return the reader options to read only the given columns, where the pandas reader supports selecting
+        columns while reading. Columns missing from the data are ignored; batches read otherwise are projected after
+        reading.
+        """
+        reader_name = getattr(reader_fn, "func", reader_fn).__name__
+        if columns is None or reader_name != "read_csv":
+            return reader_options
+        # index_col refers to positions among the columns read
+        if "usecols" in reader_options or reader_options.get("index_col") not in [
+            None,
+            False,
+        ]:
+            return reader_options
+        columns = set(columns)
+        return dict(reader_options, usecols=lambda column: column in columns)
+
+    def _read_with_pyarrow(self, source, reader_method, path, reader_options, columns):
+        """Read a csv or parquet file into a DataFrame with pyarrow, decoding on several threads and reading only the
+        given columns (all columns if None) that the file holds.
+
+        For csv files, reader_options may hold read_options, parse_options and convert_options dictionaries for the
+        corresponding pyarrow.csv classes; for parquet files, reader_options are passed to pyarrow.parquet.read_table.
+        Their to_pandas_options are passed to pyarrow.Table.to_pandas; {"strings_to_categorical": True} loads string
+        columns as categoricals, holding each distinct string once. String columns are loaded as plain strings by
+        default, since expectations on the minimum, maximum or type of a column treat categoricals differently.
+        """
+        try:
+            import pyarrow.csv
+            import pyarrow.parquet
+        except ImportError:
+            raise BatchKwargsError(
+                "Unable to load pyarrow to read the batch; install the optional pyarrow dependency for the "
+                "pyarrow reader_engine.",
+                {"reader_engine": "pyarrow"},
+            )
+
+        if reader_method is None:
+            reader_method = self.guess_reader_method_from_path(path)["reader_method"]
+        reader_options = dict(reader_options)
+        to_pandas_options = reader_options.pop("to_pandas_options", {})
+
+        if reader_method == "read_parquet":
+            if columns is not None:
+                file_columns = pyarrow.parquet.read_schema(source).names
+                columns = [column for column in file_columns if column in set(columns)]
+                if hasattr(source, "seek"):
+                    source.seek(0)
+            table = pyarrow.parquet.read_table(
+                source, columns=columns, use_threads=True, **reader_options
+            )
+        elif reader_method == "read_csv":
+            read_options = pyarrow.csv.ReadOptions(
+                use_threads=True, **reader_options.get("read_options", {})
+            )
+            parse_options = pyarrow.csv.ParseOptions(
+                **reader_options.get("parse_options", {})
+            )
+            convert_options = dict(reader_options.get("convert_options", {}))
+            if columns is not None and "include_columns" not in convert_options:
+                # pyarrow fails on included columns missing from the file, so select from the columns of its header
+                file_columns = pyarrow.csv.open_csv(
+                    source, read_options=read_options, parse_options=parse_options
+                ).schema.names
+                convert_options["include_columns"] = [
+                    column for column in file_columns if column in set(columns)
+                ]
+                if hasattr(source, "seek"):
+                    source.seek(0)
+            table = pyarrow.csv.read_csv(
+                source,
+                read_options=read_options,
+                parse_options=parse_options,
+                convert_options=pyarrow.csv.ConvertOptions(**convert_options),
+            )
+        else:
+            raise BatchKwargsError(
+                "The pyarrow reader_engine can only read csv and parquet files, not with reader_method %s."
+                % reader_method,
+                {"reader_method": reader_method, "reader_engine": "pyarrow"},
+            )
+        return table.to_pandas(**to_pandas_options)
+
     def _get_reader_fn(self, reader_method=None, path=None):
         """Static helper for parsing reader types. If reader_method is not provided, path will be used to guess the
         correct reader_method.
@@ -32,6 +32,11 @@ class SparkDFDatasource(Datasource):
         - InMemoryBatchKwargs ("dataset" key)
         - QueryBatchKwargs ("query" key)
 
+    With a "columns" batch kwarg, batches read and persist only those columns, which Spark prunes from the scan of
+    columnar sources such as parquet; table expectations on the set of columns still see all columns of the source,
+    from its schema. With prune_columns, batches that a DataContext builds for an expectation suite only load the
+    columns the suite refers to (see ExpectationSuite.get_referenced_columns).
+
 --ge-feature-maturity-info--
 
     id: datasource_hdfs_spark
@@ -58,6 +63,7 @@ class SparkDFDatasource(Datasource):
         "limit",
         "dataset_options",
     }
+    table_columns_from_schema = True
 
     @classmethod
     def build_configuration(
@@ -6,7 +6,11 @@ from urllib.parse import urlparse
 
 from great_expectations.core.batch import Batch
 from great_expectations.core.util import nested_update
-from great_expectations.dataset.sqlalchemy_dataset import SqlAlchemyBatchReference
+from great_expectations.dataset.sqlalchemy_dataset import (
+    SqlAlchemyBatchReference,
+    SqlAlchemyQueryExecutor,
+    SqlAlchemyReflectionCache,
+)
 from great_expectations.datasource import Datasource
 from great_expectations.datasource.types import BatchMarkers
 from great_expectations.exceptions import (
@@ -52,6 +56,14 @@ class SqlAlchemyDatasource(Datasource):
 A SqlAlchemyDatasource will provide data_assets converting batch_kwargs using the following rules:
     - if the batch_kwargs include a table key, the datasource will provide a dataset object connected to that table
     - if the batch_kwargs include a query key, the datasource will create a temporary table usingthat query. The query can be parameterized according to the standard python Template engine, which uses $parameter, with additional kwargs passed to the get_batch method.
+    - with a columns batch_kwarg, the temporary table or subquery of a query, or of a table read with a limit or offset, only selects those columns; table expectations on the set of columns still see all columns of the query. With prune_columns, batches that a DataContext builds for an expectation suite only select the columns the suite refers to (see ExpectationSuite.get_referenced_columns).
+    - the create_temp_table batch_kwarg controls whether the query is materialized into a temporary table (True) or expanded as a named subquery in every statement run against the batch (False). By default, only queries that are expensive to re-run or that may return different rows each time they run are materialized.
+
+The engine's connection pool can be tuned with the pool_size, max_overflow and pool_pre_ping configuration keys, which are passed through to sqlalchemy.create_engine. Each batch checks out a single connection from the pool and holds it until the batch is closed.
+
+Table reflection results are shared by all batches of the datasource and by its TableBatchKwargsGenerators through reflection_cache, a SqlAlchemyReflectionCache. They expire after reflection_cache_ttl seconds (300 by default; null never expires them and 0 disables the cache) and can be invalidated explicitly with reflection_cache.invalidate(table_name, schema).
+
+With max_concurrent_queries greater than 1 (it is 1 by default), the metrics that the expectations of a suite rely on are computed concurrently before validation, each on a connection of its own, with at most max_concurrent_queries queries in flight across all batches of the datasource; pool_size should allow for that many connections besides those held by batches. Batches reading a temporary table, or an in-memory sqlite database, always run their queries one after another.
 
 --ge-feature-maturity-info--
     id: datasource_postgresql
@@ -168,6 +180,7 @@ A SqlAlchemyDatasource will provide data_assets converting batch_kwargs using th
     """
 
     recognized_batch_parameters = {"query_parameters", "limit", "dataset_options"}
+    table_columns_from_schema = True
 
     @classmethod
     def build_configuration(
@@ -235,6 +248,33 @@ A SqlAlchemyDatasource will provide data_assets converting batch_kwargs using th
         else:
             credentials = {}
 
+        # connection pool options apply however the engine is built, so that
+        # batches from this datasource share a bounded set of live connections
+        pool_kwargs = {
+            key: kwargs.pop(key)
+            for key in ["pool_size", "max_overflow", "pool_pre_ping"]
+            if key in kwargs
+        }
+
+        # tables are reflected once per reflection_cache_ttl seconds for all batches; 0 disables the cache
+        reflection_cache_ttl = kwargs.pop("reflection_cache_ttl", 300)
+        if reflection_cache_ttl == 0:
+            self.reflection_cache = None
+        else:
+            self.reflection_cache = SqlAlchemyReflectionCache(ttl=reflection_cache_ttl)
+
+        # used by the DataContext building batches, not by the engine
+        kwargs.pop("prune_columns", None)
+
+        # independent metric queries of the batches run concurrently, at most max_concurrent_queries at a time
+        max_concurrent_queries = kwargs.pop("max_concurrent_queries", 1)
+        if max_concurrent_queries > 1:
+            self.query_executor = SqlAlchemyQueryExecutor(
+                max_concurrent_queries=max_concurrent_queries
+            )
+        else:
+            self.query_executor = None
+
         try:
             # if an engine was provided, use that
             if "engine" in kwargs:
@@ -243,12 +283,12 @@ A SqlAlchemyDatasource will provide data_assets converting batch_kwargs using th
             # if a connection string or url was provided, use that
             elif "connection_string" in kwargs:
                 connection_string = kwargs.pop("connection_string")
-                self.engine = create_engine(connection_string, **kwargs)
+                self.engine = create_engine(connection_string, **pool_kwargs, **kwargs)
                 self.engine.connect()
             elif "url" in credentials:
                 url = credentials.pop("url")
                 self.drivername = urlparse(url).scheme
-                self.engine = create_engine(url, **kwargs)
+                self.engine = create_engine(url, **pool_kwargs, **kwargs)
                 self.engine.connect()
 
             # Otherwise, connect using remaining kwargs
@@ -259,7 +299,9 @@ A SqlAlchemyDatasource will provide data_assets converting batch_kwargs using th
                     drivername,
                 ) = self._get_sqlalchemy_connection_options(**kwargs)
                 self.drivername = drivername
-                self.engine = create_engine(options, **create_engine_kwargs)
+                self.engine = create_engine(
+                    options, **pool_kwargs, **create_engine_kwargs
+                )
                 self.engine.connect()
 
             # since we switched to lazy loading of Datasources when we initialise a DataContext,
@@ -396,6 +438,10 @@ A SqlAlchemyDatasource will provide data_assets converting batch_kwargs using th
                 query=query,
                 table_name=query_support_table_name,
                 schema=batch_kwargs.get("schema"),
+                create_temp_table=batch_kwargs.get("create_temp_table"),
+                reflection_cache=self.reflection_cache,
+                query_executor=self.query_executor,
+                projected_columns=batch_kwargs.get("columns"),
             )
         elif "table" in batch_kwargs:
             table = batch_kwargs["table"]
@@ -441,12 +487,17 @@ A SqlAlchemyDatasource will provide data_assets converting batch_kwargs using th
                     query=query,
                     table_name=query_support_table_name,
                     schema=batch_kwargs.get("schema"),
+                    reflection_cache=self.reflection_cache,
+                    query_executor=self.query_executor,
+                    projected_columns=batch_kwargs.get("columns"),
                 )
             else:
                 batch_reference = SqlAlchemyBatchReference(
                     engine=self.engine,
                     table_name=table,
                     schema=batch_kwargs.get("schema"),
+                    reflection_cache=self.reflection_cache,
+                    query_executor=self.query_executor,
                 )
         else:
             raise ValueError(
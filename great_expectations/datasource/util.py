@@ -1,9 +1,19 @@
 import hashlib
+import os
 import pickle
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 
+import numpy as np
 import pandas as pd
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+FINGERPRINT_CHUNK_SIZE = 1000000
+
 
 # S3Url class courtesy: https://stackoverflow.com/questions/42641315/s3-urls-get-bucket-name-and-path
 class S3Url:
@@ -58,3 +68,105 @@ def hash_pandas_dataframe(df):
         obj = pickle.dumps(df, pickle.HIGHEST_PROTOCOL)
 
     return hashlib.md5(obj).hexdigest()
+
+
+def _new_fingerprint_hasher():
+    if xxhash is not None:
+        return xxhash.xxh64()
+    return hashlib.blake2b(digest_size=16)
+
+
+def _hash_object_chunk(chunk):
+    try:
+        return pd.util.hash_pandas_object(chunk, index=False).values
+    except TypeError:
+        # In case of facing unhashable objects (like dict), use pickle
+        return pickle.dumps(chunk.tolist(), pickle.HIGHEST_PROTOCOL)
+
+
+def _fingerprint_series(series, chunk_size, object_sample_size):
+    hasher = _new_fingerprint_hasher()
+    hasher.update(repr((series.name, str(series.dtype), len(series))).encode())
+    values = series.values
+    if isinstance(values, np.ndarray) and values.dtype != object:
+        # Fixed-width columns are hashed directly from their buffers, one chunk
+        # at a time, so that at most one chunk is ever copied.
+        for start in range(0, len(values), chunk_size):
+            chunk = np.ascontiguousarray(values[start : start + chunk_size])
+            hasher.update(chunk.view(np.uint8))
+    else:
+        if object_sample_size is not None and len(series) > object_sample_size:
+            positions = np.linspace(
+                0, len(series) - 1, num=object_sample_size, dtype=np.int64
+            )
+            series = series.iloc[positions]
+        for start in range(0, len(series), chunk_size):
+            hasher.update(_hash_object_chunk(series.iloc[start : start + chunk_size]))
+    return hasher.digest()
+
+
+def fingerprint_pandas_dataframe(
+    df, chunk_size=FINGERPRINT_CHUNK_SIZE, object_sample_size=None, max_workers=None,
+):
+    """Compute a fingerprint of a dataframe without materializing a hash of the whole frame.
+
+    Each column (and the index) is hashed independently, chunk by chunk, directly from its
+    numpy buffer where possible; the per-column digests are then combined in column order.
+    xxhash is used when it is installed, otherwise hashlib's blake2b.
+
+    Args:
+        df: the pandas DataFrame or Series to fingerprint
+        chunk_size: the number of rows hashed at a time
+        object_sample_size: if set, object and extension columns longer than this are fingerprinted
+            from an evenly spaced sample of this many rows rather than from every value
+        max_workers: the number of threads used to hash columns concurrently; 1 hashes serially
+
+    Returns:
+        A hex digest string.
+    """
+    if isinstance(df, pd.Series):
+        df = df.to_frame()
+
+    series_list = [df.index.to_series(index=pd.RangeIndex(len(df.index)))] + [
+        df.iloc[:, i] for i in range(df.shape[1])
+    ]
+
+    def fingerprint_series(series):
+        return _fingerprint_series(series, chunk_size, object_sample_size)
+
+    if max_workers == 1 or len(series_list) < 3:
+        digests = [fingerprint_series(series) for series in series_list]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            digests = list(executor.map(fingerprint_series, series_list))
+
+    hasher = _new_fingerprint_hasher()
+    hasher.update(repr((df.shape, [str(col) for col in df.columns])).encode())
+    for digest in digests:
+        hasher.update(digest)
+    return hasher.hexdigest()
+
+
+def fingerprint_file(path):
+    """Fingerprint a local file by its size and modification time, without reading it.
+
+    Returns None if path is not a local file.
+    """
+    if not os.path.isfile(path):
+        return None
+    stat = os.stat(path)
+    return hashlib.md5(
+        "{}:{}".format(stat.st_size, stat.st_mtime_ns).encode()
+    ).hexdigest()
+
+
+def fingerprint_s3_object(s3_object):
+    """Fingerprint an s3 object from the ETag, ContentLength and LastModified in its response metadata."""
+    fingerprint_values = [
+        s3_object.get(key) for key in ["ETag", "ContentLength", "LastModified"]
+    ]
+    if all(value is None for value in fingerprint_values):
+        return None
+    return hashlib.md5(
+        ":".join([str(value) for value in fingerprint_values]).encode()
+    ).hexdigest()
@@ -1,5 +1,7 @@
 import abc
+import copy
 import logging
+import math
 import time
 import warnings
 from enum import Enum
@@ -8,13 +10,17 @@ from typing import Any
 from dateutil.parser import parse
 
 from great_expectations.core import ExpectationSuite, RunIdentifier
-from great_expectations.exceptions import GreatExpectationsError
+from great_expectations.exceptions import GreatExpectationsError, ProfilerError
 
 from ..data_asset import DataAsset
+from ..data_asset.data_asset import _calc_validation_statistics
 from ..dataset import Dataset
 
 logger = logging.getLogger(__name__)
 
+# Confidence level of the error bounds recorded for expectations profiled from a sample
+SAMPLE_CONFIDENCE_LEVEL = 0.95
+
 
 class ProfilerDataType(Enum):
     """Useful data types for building profilers."""
@@ -150,6 +156,16 @@ class DataAssetProfiler:
 
 
 class DatasetProfiler(DataAssetProfiler):
+    # When profiling a sample, these expectations are still evaluated against the full dataset, since their
+    # results depend on exact counts that are cheap to compute
+    exact_count_expectation_types = {
+        "expect_table_row_count_to_be_between",
+        "expect_table_column_count_to_equal",
+        "expect_table_columns_to_match_ordered_list",
+        "expect_column_to_exist",
+        "expect_column_values_to_not_be_null",
+    }
+
     @classmethod
     def validate(cls, dataset):
         return isinstance(dataset, Dataset)
@@ -221,15 +237,34 @@ class DatasetProfiler(DataAssetProfiler):
         if not cls.validate(data_asset):
             raise GreatExpectationsError("Invalid data_asset for profiler; aborting")
 
-        expectation_suite = cls._profile(
+        sample_dataset = cls._get_sample_dataset(
             data_asset, configuration=profiler_configuration
         )
+        if sample_dataset is None:
+            expectation_suite = cls._profile(
+                data_asset, configuration=profiler_configuration
+            )
+        else:
+            expectation_suite = cls._profile(
+                sample_dataset, configuration=profiler_configuration
+            )
+            expectation_suite = cls._update_exact_count_expectations(
+                data_asset, expectation_suite
+            )
 
         batch_kwargs = data_asset.batch_kwargs
         expectation_suite = cls.add_meta(expectation_suite, batch_kwargs)
-        validation_results = data_asset.validate(
-            expectation_suite, run_id=run_id, result_format="SUMMARY"
-        )
+        if sample_dataset is None:
+            validation_results = data_asset.validate(
+                expectation_suite, run_id=run_id, result_format="SUMMARY"
+            )
+        else:
+            cls._add_sample_meta(
+                expectation_suite, data_asset, sample_dataset, profiler_configuration
+            )
+            validation_results = cls._validate_with_sample(
+                data_asset, sample_dataset, expectation_suite, run_id=run_id
+            )
         expectation_suite.add_citation(
             comment=str(cls.__name__) + " added a citation based on the current batch.",
             batch_kwargs=data_asset.batch_kwargs,
@@ -241,3 +276,95 @@ class DatasetProfiler(DataAssetProfiler):
     @classmethod
     def _profile(cls, dataset, configuration=None):
         raise NotImplementedError
+
+    @classmethod
+    def _get_sample_dataset(cls, dataset, configuration=None):
+        """Returns a random sample of the dataset to profile instead of the full dataset, or None to profile
+        the full dataset.
+
+        Sampling is enabled by the "sample_fraction" key of the profiler configuration; "sample_seed" optionally
+        makes the sample reproducible.
+        """
+        if not isinstance(configuration, dict):
+            return None
+        sample_fraction = configuration.get("sample_fraction")
+        if sample_fraction is None or sample_fraction >= 1:
+            return None
+        if sample_fraction <= 0:
+            raise ProfilerError("sample_fraction must be between 0 and 1.")
+        try:
+            return dataset.get_sample_dataset(
+                sample_fraction, seed=configuration.get("sample_seed")
+            )
+        except NotImplementedError:
+            logger.warning(
+                "%s does not support sampling; profiling the full dataset."
+                % dataset.__class__.__name__
+            )
+            return None
+
+    @classmethod
+    def _update_exact_count_expectations(cls, dataset, expectation_suite):
+        """Updates the kwargs of expectations built from a sample that depend on exact counts of the full dataset.
+        """
+        return expectation_suite
+
+    @classmethod
+    def _add_sample_meta(
+        cls, expectation_suite, dataset, sample_dataset, configuration
+    ):
+        sample_row_count = sample_dataset.get_row_count()
+        sample_meta = {
+            "fraction": configuration["sample_fraction"],
+            "seed": configuration.get("sample_seed"),
+            "sample_row_count": sample_row_count,
+            "row_count": dataset.get_row_count(),
+            "confidence_level": SAMPLE_CONFIDENCE_LEVEL,
+        }
+        if sample_row_count > 0:
+            # Dvoretzky-Kiefer-Wolfowitz bound on the error of quantile ranks estimated from the sample
+            sample_meta["quantile_rank_error"] = math.sqrt(
+                math.log(2 / (1 - SAMPLE_CONFIDENCE_LEVEL)) / (2 * sample_row_count)
+            )
+
+        expectation_suite.meta[str(cls.__name__)]["sample"] = sample_meta
+        for expectation in expectation_suite.expectations:
+            if expectation.expectation_type not in cls.exact_count_expectation_types:
+                expectation.meta[str(cls.__name__)]["sample"] = sample_meta
+        return expectation_suite
+
+    @classmethod
+    def _validate_with_sample(cls, dataset, sample_dataset, expectation_suite, run_id):
+        """Validates count-based expectations against the full dataset and all others against the sample."""
+        exact_suite = copy.deepcopy(expectation_suite)
+        exact_suite.expectations = [
+            expectation
+            for expectation in exact_suite.expectations
+            if expectation.expectation_type in cls.exact_count_expectation_types
+        ]
+        sampled_suite = copy.deepcopy(expectation_suite)
+        sampled_suite.expectations = [
+            expectation
+            for expectation in sampled_suite.expectations
+            if expectation.expectation_type not in cls.exact_count_expectation_types
+        ]
+
+        validation_results = dataset.validate(
+            exact_suite, run_id=run_id, result_format="SUMMARY"
+        )
+        sample_validation_results = sample_dataset.validate(
+            sampled_suite, run_id=run_id, result_format="SUMMARY"
+        )
+        validation_results.results += sample_validation_results.results
+        statistics = _calc_validation_statistics(validation_results.results)
+        validation_results.success = statistics.success
+        validation_results.statistics = {
+            "evaluated_expectations": statistics.evaluated_expectations,
+            "successful_expectations": statistics.successful_expectations,
+            "unsuccessful_expectations": statistics.unsuccessful_expectations,
+            "success_percent": statistics.success_percent,
+        }
+        validation_results.meta[
+            "expectation_suite_name"
+        ] = expectation_suite.expectation_suite_name
+        return validation_results
@@ -66,6 +66,9 @@ class BasicDatasetProfilerBase(DatasetProfiler):
                 type_ = ProfilerDataType.UNKNOWN
         except NotImplementedError:
             type_ = ProfilerDataType.UNKNOWN
+        except ValueError:
+            # no type data is available, e.g. for a SqlAlchemyDataset defined by a subquery
+            type_ = ProfilerDataType.UNKNOWN
 
         df.set_config_value("interactive_evaluation", False)
         return type_
@@ -90,6 +93,12 @@ class BasicDatasetProfilerBase(DatasetProfiler):
                 )
             )
 
+        df.set_config_value("interactive_evaluation", False)
+
+        return cls._get_cardinality(num_unique, pct_unique)
+
+    @classmethod
+    def _get_cardinality(cls, num_unique, pct_unique):
         if num_unique is None or num_unique == 0 or pct_unique is None:
             cardinality = ProfilerCardinality.NONE
         elif pct_unique == 1.0:
@@ -110,10 +119,89 @@ class BasicDatasetProfilerBase(DatasetProfiler):
             else:
                 cardinality = ProfilerCardinality.MANY
 
-        df.set_config_value("interactive_evaluation", False)
-
         return cardinality
 
+    @classmethod
+    def _get_column_types_from_schema(cls, df, columns):
+        """Determine the types of the given columns from the schema of the dataset (reflected SQL types, the Spark
+        schema or pandas dtypes), without evaluating any expectation.
+
+        Returns:
+            dict: the ProfilerDataType of each column whose type can be determined from the schema alone
+        """
+        type_names = [
+            (ProfilerDataType.INT, ProfilerTypeMapping.INT_TYPE_NAMES),
+            (ProfilerDataType.FLOAT, ProfilerTypeMapping.FLOAT_TYPE_NAMES),
+            (ProfilerDataType.STRING, ProfilerTypeMapping.STRING_TYPE_NAMES),
+            (ProfilerDataType.BOOLEAN, ProfilerTypeMapping.BOOLEAN_TYPE_NAMES),
+            (ProfilerDataType.DATETIME, ProfilerTypeMapping.DATETIME_TYPE_NAMES),
+        ]
+        column_types = {}
+        for column in columns:
+            try:
+                for type_, type_list in type_names:
+                    in_type_list = df._column_type_in_type_list(
+                        column, sorted(list(type_list))
+                    )
+                    if in_type_list is None:
+                        break
+                    if in_type_list:
+                        column_types[column] = type_
+                        break
+                else:
+                    column_types[column] = ProfilerDataType.UNKNOWN
+            except ValueError as e:
+                logger.debug(
+                    "Unable to determine the type of column {:s} from the schema - continuing: {}".format(
+                        column, str(e)
+                    )
+                )
+        return column_types
+
+    @classmethod
+    def _get_column_cardinalities(cls, df, columns):
+        """Determine the cardinality of the given columns, computing their nonnull and distinct counts together
+        where the backend supports it."""
+        cls._prefetch_column_metrics(df, columns, ["nonnull_count", "unique_count"])
+        column_cardinalities = {}
+        for column in columns:
+            num_unique = df.get_column_unique_count(column)
+            nonnull_count = df.get_column_nonnull_count(column)
+            if nonnull_count > 0:
+                pct_unique = float(num_unique) / nonnull_count
+            else:
+                pct_unique = None
+            column_cardinalities[column] = cls._get_cardinality(num_unique, pct_unique)
+        return column_cardinalities
+
+    @classmethod
+    def _prefetch_column_quantiles(cls, df, columns, quantiles_list):
+        """Compute the medians and quantiles of many columns at once; on failure, the metric getters compute them
+        individually."""
+        try:
+            df.prefetch_column_quantiles(columns, quantiles_list)
+        except Exception as e:
+            logger.debug(
+                "Unable to compute quantiles in a batch - continuing: {}".format(str(e))
+            )
+
+    @classmethod
+    def _prefetch_column_metrics(cls, df, columns, metrics):
+        """Compute metrics for many columns at once; on failure, the metric getters compute them individually."""
+        try:
+            df.prefetch_column_metrics(columns, metrics)
+        except Exception as e:
+            if len(metrics) > 1:
+                # a single unsupported aggregate (e.g. stddev_samp on sqlite) fails the whole statement
+                for metric in metrics:
+                    cls._prefetch_column_metrics(df, columns, [metric])
+            else:
+                logger.debug(
+                    "Unable to compute metric {} in a batch - continuing: {}".format(
+                        metrics[0], str(e)
+                    )
+                )
+
 
 class BasicDatasetProfiler(BasicDatasetProfilerBase):
     """BasicDatasetProfiler is inspired by the beloved pandas_profiling project.
@@ -125,8 +213,18 @@ class BasicDatasetProfiler(BasicDatasetProfilerBase):
     such as min, max, mean and median, for numeric columns, and distribution of values, when appropriate.
     """
 
+    PROFILED_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
     @classmethod
     def _profile(cls, dataset, configuration=None):
+        """Profile the columns of dataset.
+
+        The metrics of all columns are computed up front where the backend computes them for several columns in a
+        single pass: nonnull and distinct counts, min, max, mean and standard deviation (see
+        Dataset.prefetch_column_metrics), and medians and quantiles (see Dataset.prefetch_column_quantiles). The
+        histograms of the KL divergence partitions, the value counts of distinct value sets and the values checked
+        by map expectations are still computed column by column.
+        """
         df = dataset
 
         df.set_default_expectation_argument("catch_exceptions", True)
@@ -141,6 +239,41 @@ class BasicDatasetProfiler(BasicDatasetProfilerBase):
         for column in columns:
             meta_columns[column] = {"description": ""}
 
+        # Compute the metrics needed to infer cardinality for every column up front so that backends supporting
+        # batched metric computation scan the data once per group of columns rather than once per metric
+        cls._prefetch_column_metrics(df, columns, ["nonnull_count", "unique_count"])
+        column_types = {column: cls._get_column_type(df, column) for column in columns}
+        column_cardinalities = {
+            column: cls._get_column_cardinality(df, column) for column in columns
+        }
+        numeric_columns = [
+            column
+            for column in columns
+            if column_types[column] in [ProfilerDataType.INT, ProfilerDataType.FLOAT]
+            and column_cardinalities[column]
+            in [
+                ProfilerCardinality.MANY,
+                ProfilerCardinality.VERY_MANY,
+                ProfilerCardinality.UNIQUE,
+            ]
+        ]
+        cls._prefetch_column_metrics(
+            df, numeric_columns, ["min", "max", "mean", "stdev"]
+        )
+        # medians, the profiled quantiles and the quantiles bounding the bins of the KL divergence partitions
+        cls._prefetch_column_quantiles(
+            df, numeric_columns, [cls.PROFILED_QUANTILES, (0.0, 0.25, 0.75, 1.0)]
+        )
+        cls._prefetch_column_metrics(
+            df,
+            [
+                column
+                for column in columns
+                if column_types[column] == ProfilerDataType.DATETIME
+            ],
+            ["min", "max"],
+        )
+
         number_of_columns = len(columns)
         for i, column in enumerate(columns):
             logger.info(
@@ -151,8 +284,8 @@ class BasicDatasetProfiler(BasicDatasetProfilerBase):
 
             # df.expect_column_to_exist(column)
 
-            type_ = cls._get_column_type(df, column)
-            cardinality = cls._get_column_cardinality(df, column)
+            type_ = column_types[column]
+            cardinality = column_cardinalities[column]
             df.expect_column_values_to_not_be_null(
                 column, mostly=0.5
             )  # The renderer will show a warning for columns that do not meet this expectation
@@ -193,7 +326,7 @@ class BasicDatasetProfiler(BasicDatasetProfilerBase):
                     df.expect_column_quantile_values_to_be_between(
                         column,
                         quantile_ranges={
-                            "quantiles": [0.05, 0.25, 0.5, 0.75, 0.95],
+                            "quantiles": list(cls.PROFILED_QUANTILES),
                             "value_ranges": [
                                 [None, None],
                                 [None, None],
@@ -245,7 +378,7 @@ class BasicDatasetProfiler(BasicDatasetProfilerBase):
                     df.expect_column_quantile_values_to_be_between(
                         column,
                         quantile_ranges={
-                            "quantiles": [0.05, 0.25, 0.5, 0.75, 0.95],
+                            "quantiles": list(cls.PROFILED_QUANTILES),
                             "value_ranges": [
                                 [None, None],
                                 [None, None],
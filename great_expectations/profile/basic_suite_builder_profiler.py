@@ -109,6 +109,21 @@ class BasicSuiteBuilderProfiler(BasicDatasetProfilerBase):
 
         return column_type
 
+    @classmethod
+    def _build_column_cache(cls, dataset, columns):
+        """Determine the type and cardinality of all columns up front: types are taken from the schema where
+        possible and the counts needed for cardinalities are computed for all columns at once."""
+        column_types = cls._get_column_types_from_schema(dataset, columns)
+        column_cardinalities = cls._get_column_cardinalities(dataset, columns)
+        column_cache = {}
+        for column in columns:
+            column_cache[column] = {"cardinality": column_cardinalities[column]}
+            if column in column_types:
+                column_cache[column]["type"] = column_types[column]
+            else:
+                cls._get_column_type_with_caching(dataset, column, column_cache)
+        return column_cache
+
     @classmethod
     def _get_column_cardinality_with_caching(cls, dataset, column_name, cache):
         column_cache_entry = cache.get(column_name)
@@ -199,12 +214,15 @@ class BasicSuiteBuilderProfiler(BasicDatasetProfilerBase):
             not_null_result = dataset.expect_column_values_to_not_be_null(column)
             if not not_null_result.success:
                 unexpected_percent = float(not_null_result.result["unexpected_percent"])
-                potential_mostly_value = (100.0 - unexpected_percent - 10) / 100.0
-                safe_mostly_value = round(max(0.001, potential_mostly_value), 3)
                 dataset.expect_column_values_to_not_be_null(
-                    column, mostly=safe_mostly_value
+                    column, mostly=cls._get_safe_mostly_value(unexpected_percent)
                 )
 
+    @classmethod
+    def _get_safe_mostly_value(cls, unexpected_percent):
+        potential_mostly_value = (100.0 - unexpected_percent - 10) / 100.0
+        return round(max(0.001, potential_mostly_value), 3)
+
     @classmethod
     def _create_expectations_for_numeric_column(
         cls, dataset, column, excluded_expectations=None, included_expectations=None
@@ -322,7 +340,7 @@ class BasicSuiteBuilderProfiler(BasicDatasetProfilerBase):
                 quantile_result.exception_info["exception_traceback"]
                 or quantile_result.exception_info["exception_message"]
             ):
-                # TODO quantiles are not implemented correctly on sqlite, and likely other sql dialects
+                # quantiles are not supported by every sql dialect (e.g. Redshift without allow_relative_error)
                 logger.debug(quantile_result.exception_info["exception_traceback"])
                 logger.debug(quantile_result.exception_info["exception_message"])
             else:
@@ -579,6 +597,7 @@ class BasicSuiteBuilderProfiler(BasicDatasetProfilerBase):
             return suite
 
         dataset.set_default_expectation_argument("catch_exceptions", False)
+        column_cache = cls._build_column_cache(dataset, selected_columns)
         dataset = cls._build_table_row_count_expectation(
             dataset,
             excluded_expectations=excluded_expectations,
@@ -591,7 +610,6 @@ class BasicSuiteBuilderProfiler(BasicDatasetProfilerBase):
             included_expectations=included_expectations,
         )
 
-        column_cache = {}
         if selected_columns:
             for column in selected_columns:
                 cardinality = cls._get_column_cardinality_with_caching(
@@ -673,13 +691,12 @@ class BasicSuiteBuilderProfiler(BasicDatasetProfilerBase):
     @classmethod
     def _demo_profile(cls, dataset):
         dataset.set_default_expectation_argument("catch_exceptions", False)
+        columns = dataset.get_table_columns()
+        column_cache = cls._build_column_cache(dataset, columns)
         dataset = cls._build_table_row_count_expectation(dataset)
         dataset.set_config_value("interactive_evaluation", True)
         dataset = cls._build_table_column_expectations(dataset)
 
-        columns = dataset.get_table_columns()
-
-        column_cache = {}
         profiled_columns = {"numeric": [], "low_card": [], "string": [], "datetime": []}
 
         column = cls._find_next_low_card_column(
@@ -745,13 +762,48 @@ class BasicSuiteBuilderProfiler(BasicDatasetProfilerBase):
             value = dataset.expect_table_row_count_to_be_between(
                 min_value=0, max_value=None
             ).result["observed_value"]
-            min_value = max(0, int(value * (1 - tolerance)))
-            max_value = int(value * (1 + tolerance))
+            min_value, max_value = cls._get_row_count_range(value, tolerance)
             dataset.expect_table_row_count_to_be_between(
                 min_value=min_value, max_value=max_value
             )
         return dataset
 
+    @classmethod
+    def _get_row_count_range(cls, row_count, tolerance=0.1):
+        return (
+            max(0, int(row_count * (1 - tolerance))),
+            int(row_count * (1 + tolerance)),
+        )
+
+    @classmethod
+    def _update_exact_count_expectations(cls, dataset, expectation_suite):
+        row_count = dataset.get_row_count()
+        not_null_expectations = []
+        for expectation in expectation_suite.expectations:
+            if expectation.expectation_type == "expect_table_row_count_to_be_between":
+                min_value, max_value = cls._get_row_count_range(row_count)
+                expectation.kwargs["min_value"] = min_value
+                expectation.kwargs["max_value"] = max_value
+            elif expectation.expectation_type == "expect_column_values_to_not_be_null":
+                not_null_expectations.append(expectation)
+
+        cls._prefetch_column_metrics(
+            dataset,
+            [expectation.kwargs["column"] for expectation in not_null_expectations],
+            ["nonnull_count"],
+        )
+        for expectation in not_null_expectations:
+            null_count = row_count - dataset.get_column_nonnull_count(
+                expectation.kwargs["column"]
+            )
+            if null_count > 0:
+                expectation.kwargs["mostly"] = cls._get_safe_mostly_value(
+                    100.0 * null_count / row_count
+                )
+            else:
+                expectation.kwargs.pop("mostly", None)
+        return expectation_suite
+
     @classmethod
     def _build_table_column_expectations(
         cls, dataset, excluded_expectations=None, included_expectations=None
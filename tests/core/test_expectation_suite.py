@@ -423,3 +423,45 @@ def test_get_column_expectations(
 ):
     obs = suite_with_table_and_column_expectations.get_column_expectations()
     assert obs == [exp1, exp2, exp3, exp4]
+
+
+def test_get_referenced_columns():
+    def build_suite(*expectations):
+        return ExpectationSuite(
+            expectation_suite_name="warning",
+            expectations=[
+                ExpectationConfiguration(
+                    expectation_type=expectation_type, kwargs=kwargs
+                )
+                for expectation_type, kwargs in expectations
+            ],
+        )
+
+    suite = build_suite(
+        ("expect_table_row_count_to_be_between", {"min_value": 1}),
+        ("expect_column_values_to_not_be_null", {"column": "b"}),
+        ("expect_column_pair_values_to_be_equal", {"column_A": "a", "column_B": "b"}),
+        ("expect_compound_columns_to_be_unique", {"column_list": ["c", "a"]}),
+    )
+    assert suite.get_referenced_columns() == ["b", "a", "c"]
+    assert build_suite().get_referenced_columns() == []
+
+    # suites which may depend on columns they do not name
+    for expectation in [
+        ("expect_table_columns_to_match_set", {"column_set": ["a"]}),
+        (
+            "expect_column_values_to_not_be_null",
+            {"column": "a", "row_condition": "b > 1", "condition_parser": "pandas"},
+        ),
+        ("expect_column_values_to_not_be_null", {"column": {"$PARAMETER": "name"}}),
+        ("expect_custom_rows_to_be_valid", {"threshold": 1}),
+    ]:
+        assert build_suite(expectation).get_referenced_columns() is None
+
+    # unless the batch answers table expectations on the set of columns from the schema of its source
+    suite = build_suite(
+        ("expect_table_columns_to_match_set", {"column_set": ["a", "b"]}),
+        ("expect_column_values_to_not_be_null", {"column": "b"}),
+    )
+    assert suite.get_referenced_columns() is None
+    assert suite.get_referenced_columns(table_columns_from_schema=True) == ["b"]
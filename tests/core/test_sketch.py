@@ -0,0 +1,86 @@
+import json
+from functools import reduce
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.core.sketch import (
+    DistinctCountSketch,
+    FrequentValuesSketch,
+    QuantileSketch,
+    sketch_from_json_dict,
+)
+
+
+def test_quantile_sketch_merges_sketches_of_chunks():
+    values = np.random.RandomState(0).normal(size=100000)
+    sketches = [QuantileSketch().update(chunk) for chunk in np.array_split(values, 20)]
+    sketch = reduce(lambda sketch, other: sketch.merge(other), sketches)
+
+    assert sketch.count == len(values)
+    assert sketch.min == values.min()
+    assert sketch.max == values.max()
+    quantiles = np.linspace(0.01, 0.99, 99)
+    ranks = np.searchsorted(np.sort(values), sketch.get_quantiles(quantiles))
+    assert np.abs(ranks / len(values) - quantiles).max() < 0.01
+    assert np.allclose(
+        sketch.get_hist([-1, 0, 1]) / np.histogram(values, [-1, 0, 1])[0], 1, atol=0.02
+    )
+    # merging does not change the merged sketches
+    assert sketches[0].count == 5000
+    assert (
+        sketch_from_json_dict(json.loads(json.dumps(sketch.to_json_dict()))) == sketch
+    )
+
+
+def test_quantile_sketch_is_exact_for_few_values():
+    sketch = QuantileSketch().update([3, None, 1, 2, np.nan, 4])
+    assert sketch.count == 4
+    assert sketch.get_quantiles([0, 0.5, 1]) == [1.0, 2.0, 4.0]
+    assert sketch.get_hist([1, 2, 4]) == [1, 3]
+    assert list(sketch.get_ranks([2, 5])) == [1, 4]
+    assert QuantileSketch().get_quantiles([0.5]) == [None]
+
+
+def test_distinct_count_sketch():
+    values = np.random.RandomState(0).randint(0, 20000, size=100000)
+    sketch = reduce(
+        lambda sketch, other: sketch.merge(other),
+        [DistinctCountSketch().update(chunk) for chunk in np.array_split(values, 10)],
+    )
+    distinct_count = len(np.unique(values))
+    assert abs(sketch.get_distinct_count() - distinct_count) < 0.05 * distinct_count
+    assert DistinctCountSketch().update(["a", "b", None, "a"]).get_distinct_count() == 2
+    assert (
+        sketch_from_json_dict(json.loads(json.dumps(sketch.to_json_dict()))) == sketch
+    )
+
+    with pytest.raises(ValueError):
+        sketch.merge(DistinctCountSketch(p=10))
+
+
+def test_frequent_values_sketch():
+    values = pd.Series(np.random.RandomState(0).zipf(1.5, size=50000))
+    sketches = [
+        FrequentValuesSketch(capacity=20).update(chunk)
+        for chunk in np.array_split(values, 5)
+    ]
+    sketch = reduce(lambda sketch, other: sketch.merge(other), sketches)
+
+    counts = values.value_counts()
+    frequencies = sketch.get_frequencies()
+    assert len(frequencies) <= 20
+    assert sketch.count == len(values)
+    # counts are lower bounds at most error below the true counts
+    assert sketch.error <= len(values) / 21 * 5
+    assert (frequencies <= counts[frequencies.index]).all()
+    assert (frequencies >= counts[frequencies.index] - sketch.error).all()
+    assert list(frequencies.index[:3]) == list(counts.index[:3])
+    assert (
+        sketch_from_json_dict(json.loads(json.dumps(sketch.to_json_dict()))) == sketch
+    )
+
+    sketch = FrequentValuesSketch().update(["b", None, "a", "b"])
+    assert sketch.get_frequencies(sort="value").to_dict() == {"a": 1, "b": 2}
+    assert sketch.error == 0
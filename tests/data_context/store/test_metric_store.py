@@ -1,5 +1,17 @@
+import datetime
+import decimal
+
+import numpy as np
+import pandas as pd
 import pytest
 
+from great_expectations.core import ExpectationValidationResult
+from great_expectations.core.metric import (
+    BatchMetricIdentifier,
+    PartitionMetricIdentifier,
+)
+from great_expectations.core.sketch import FrequentValuesSketch, QuantileSketch
+from great_expectations.data_context.store import PartitionMetricStore
 from great_expectations.data_context.util import instantiate_class_from_config
 
 
@@ -41,3 +53,72 @@ def param_store(request, test_backends):
         config_defaults={"module_name": "great_expectations.data_context.store",},
         runtime_environment={},
     )
+
+
+def test_metric_cache_store_round_trips_metric_values(tmp_path_factory):
+    base_directory = str(tmp_path_factory.mktemp("metric_cache"))
+    store = instantiate_class_from_config(
+        config={
+            "class_name": "MetricCacheStore",
+            "store_backend": {
+                "class_name": "TupleFilesystemStoreBackend",
+                "base_directory": base_directory,
+            },
+        },
+        config_defaults={"module_name": "great_expectations.data_context.store"},
+        runtime_environment={},
+    )
+    values = [
+        3,
+        np.float64(0.5),
+        None,
+        (0.25, 0.5),
+        ["a", np.int64(1)],
+        decimal.Decimal("1.10"),
+        pd.Timestamp("2020-01-01T12:00:00"),
+        datetime.date(2020, 1, 1),
+        QuantileSketch().update([1.0, 2.0, 3.0]),
+        FrequentValuesSketch().update(["a", "b", "a"]),
+        {"observed_value": 2, "details": {"values": ["a"]}},
+        ExpectationValidationResult(
+            success=False, result={"observed_value": 2, "element_count": 3}
+        ),
+    ]
+    for i, value in enumerate(values):
+        key = BatchMetricIdentifier("fingerprint", "metric_%d" % i, "abc")
+        store.set(key, value)
+        assert store.has_key(key)
+        cached_value = store.get(key)
+        assert type(cached_value) == type(value) or isinstance(value, np.generic)
+        assert cached_value == value
+
+    value_counts = pd.Series([2, 1], index=["a", "b"], name="count")
+    key = BatchMetricIdentifier("fingerprint", "value_counts", None)
+    store.set(key, value_counts)
+    assert store.get(key).equals(value_counts)
+    assert key in store.list_keys()
+    assert key.to_tuple() == ("fingerprint", "value_counts", "__")
+
+    with pytest.raises(TypeError):
+        store.set(key, object())
+
+
+def test_partition_metric_store_lists_partitions_of_metric():
+    store = PartitionMetricStore()
+    for partition_key in ["p1", "p2"]:
+        key = PartitionMetricIdentifier(
+            "events", "column_moments", "abc", partition_key
+        )
+        store.set(key, {"partition_fingerprint": "3:1", "value": [3, 2.0, 2.0]})
+    store.set(
+        PartitionMetricIdentifier("events", "get_row_count", "abc", "p1"),
+        {"partition_fingerprint": "3:1", "value": 3},
+    )
+
+    keys = store.list_partition_keys("events", "column_moments", "abc")
+    assert sorted(key.partition_key for key in keys) == ["p1", "p2"]
+    assert store.get(keys[0]) == {
+        "partition_fingerprint": "3:1",
+        "value": [3, 2.0, 2.0],
+    }
+    assert PartitionMetricIdentifier.from_tuple(keys[0].to_tuple()) == keys[0]
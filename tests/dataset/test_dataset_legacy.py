@@ -29,6 +29,68 @@ def test_caching(test_backend):
         dataset.get_column_max.cache_info()
 
 
+def test_prefetch_column_metrics(test_backend):
+    dataset = get_dataset(
+        test_backend, data, schemas=schemas.get(test_backend), caching=True
+    )
+    column_metrics = dataset.prefetch_column_metrics(
+        ["a", "c", "d"], ["nonnull_count", "min", "max", "unique_count"]
+    )
+    if test_backend == "PandasDataset":
+        # pandas computes metrics directly from memory and does not batch them
+        assert column_metrics == {}
+    else:
+        assert column_metrics["a"] == {
+            "nonnull_count": 2,
+            "min": 2.0,
+            "max": 5.0,
+            "unique_count": 2,
+        }
+        assert column_metrics["d"]["nonnull_count"] == 1
+        assert column_metrics["d"]["unique_count"] == 1
+
+    # getters return the same values whether or not they were prefetched
+    assert dataset.get_row_count() == 2
+    assert dataset.get_column_nonnull_count("d") == 1
+    assert dataset.get_column_min("c") == 0
+    assert dataset.get_column_max("c") == 10
+    assert dataset.get_column_unique_count("a") == 2
+
+    with pytest.raises(ValueError):
+        dataset.prefetch_column_metrics(["a"], ["median"])
+
+
+def test_prefetch_column_metrics_without_caching(test_backend):
+    dataset = get_dataset(
+        test_backend, data, schemas=schemas.get(test_backend), caching=False
+    )
+    assert dataset.prefetch_column_metrics(["a"], ["min"]) == {}
+    assert dataset.get_column_min("a") == 2.0
+
+
+def test_prefetch_column_quantiles(test_backend):
+    dataset = get_dataset(
+        test_backend, data, schemas=schemas.get(test_backend), caching=True
+    )
+    uncached_dataset = get_dataset(
+        test_backend, data, schemas=schemas.get(test_backend), caching=False
+    )
+    dataset.prefetch_column_quantiles(["a", "c"], [(0.0, 1.0), (0.0, 0.5)])
+    assert ("get_column_median", "a") in dataset._prefetched_metrics
+
+    # getters return the same values whether or not they were prefetched
+    for column in ["a", "c"]:
+        assert dataset.get_column_median(column) == uncached_dataset.get_column_median(
+            column
+        )
+        for quantiles in [(0.0, 1.0), (0.0, 0.5)]:
+            assert dataset.get_column_quantiles(
+                column, quantiles, allow_relative_error=False
+            ) == uncached_dataset.get_column_quantiles(
+                column, quantiles, allow_relative_error=False
+            )
+
+
 def test_head(test_backend):
     dataset = get_dataset(
         test_backend, data, schemas=schemas.get(test_backend), caching=True
@@ -1,6 +1,9 @@
 import datetime
 import json
+from collections import Counter
+from types import SimpleNamespace
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -901,3 +904,392 @@ def test_expect_values_quantiles_to_be_between():
             "A", {"quantiles": quantiles, "value_ranges": value_ranges,}
         )
         assert validation.success is success
+
+
+def test_pandas_dataset_uses_metric_cache_store():
+    from great_expectations.data_context.store import MetricCacheStore
+
+    metric_cache = MetricCacheStore()
+    df = pd.DataFrame({"a": [1, 2, 3, None], "b": ["x", "y", "x", None]})
+    dataset = ge.dataset.PandasDataset(df, metric_cache=metric_cache)
+    result = dataset.expect_column_values_to_be_in_set(
+        "b", ["x"], result_format="COMPLETE"
+    )
+    assert result.result["unexpected_list"] == ["y"]
+    assert dataset.get_column_value_counts("b").to_dict() == {"x": 2, "y": 1}
+    assert dataset.get_data_fingerprint() is not None
+
+    # the same data is fingerprinted the same way, so results come from the cache
+    dataset = ge.dataset.PandasDataset(df.copy(), metric_cache=metric_cache)
+    number_of_keys = len(metric_cache.list_keys())
+    assert (
+        dataset.expect_column_values_to_be_in_set("b", ["x"], result_format="COMPLETE")
+        == result
+    )
+    assert dataset.get_column_value_counts("b").to_dict() == {"x": 2, "y": 1}
+    assert len(metric_cache.list_keys()) == number_of_keys
+
+    # any data with the same fingerprint is assumed to be the same
+    dataset = ge.dataset.PandasDataset(
+        pd.DataFrame({"a": [1], "b": ["z"]}),
+        metric_cache=metric_cache,
+        data_fingerprint=dataset.get_data_fingerprint(),
+    )
+    assert dataset.get_column_value_counts("b").to_dict() == {"x": 2, "y": 1}
+    assert dataset.expect_column_values_to_be_in_set("b", ["x"]).success is False
+
+    # the store can be named, e.g. in the dataset_options of batch_kwargs
+    dataset = ge.dataset.PandasDataset(
+        df,
+        metric_cache="metric_cache_store",
+        data_context=SimpleNamespace(stores={"metric_cache_store": metric_cache}),
+    )
+    assert dataset._metric_cache is metric_cache
+
+    # no metrics are cached without caching
+    number_of_keys = len(metric_cache.list_keys())
+    dataset = ge.dataset.PandasDataset(df, metric_cache=metric_cache, caching=False)
+    dataset.expect_column_values_to_be_in_set("b", ["y"])
+    assert len(metric_cache.list_keys()) == number_of_keys
+
+
+@pytest.mark.parametrize(
+    "values,min_value,max_value",
+    [
+        ([1, 2, 3, 4, 5.5], 2, 4),
+        ([1, 2, 3, 4, 5.5], 2.5, None),
+        ([1, 2, 3, 4, 5.5], "a", "z"),
+        ([True, False, True], 0, 1),
+        (["a", "b", "c", "zz"], "b", "c"),
+        (["a", "b", "c", "zz"], 1, 3),
+        (
+            [datetime.datetime(2020, 1, 1), datetime.datetime(2021, 1, 1)],
+            datetime.datetime(2020, 1, 1),
+            datetime.datetime(2020, 12, 31),
+        ),
+        (
+            [datetime.datetime(2020, 1, 1), datetime.datetime(2021, 1, 1)],
+            datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc),
+            None,
+        ),
+        ([1, "a", 2.0], 0, 3),
+    ],
+)
+def test_expect_column_values_to_be_between_vectorized_matches_elementwise(
+    values, min_value, max_value, monkeypatch
+):
+    dataset = ge.dataset.PandasDataset({"x": values})
+
+    def get_results():
+        results = []
+        for strict_min in [False, True]:
+            for strict_max in [False, True]:
+                for allow_cross_type_comparisons in [None, True]:
+                    try:
+                        result = dataset.expect_column_values_to_be_between(
+                            "x",
+                            min_value,
+                            max_value,
+                            strict_min=strict_min,
+                            strict_max=strict_max,
+                            allow_cross_type_comparisons=allow_cross_type_comparisons,
+                            result_format="COMPLETE",
+                            catch_exceptions=False,
+                        )
+                        results.append(result.result["unexpected_list"])
+                    except TypeError as e:
+                        results.append(str(e))
+        return results
+
+    vectorized_results = get_results()
+    monkeypatch.setattr(
+        ge.dataset.PandasDataset,
+        "_get_values_between_vectorized",
+        staticmethod(lambda *args: None),
+    )
+    assert vectorized_results == get_results()
+
+
+def test_expect_column_values_to_be_between_parses_strings_as_datetimes_in_bulk():
+    dataset = ge.dataset.PandasDataset(
+        {
+            "x": ["2020-01-05", "2020-02-01", "2021-03-04T10:00:00"],
+            "y": [
+                "2020-01-05",
+                "2020-02-01T00:00:00+01:00",
+                "2021-03-04T10:00:00-05:00",
+            ],
+        }
+    )
+    result = dataset.expect_column_values_to_be_between(
+        "x",
+        "2020-01-01",
+        "2020-12-31",
+        parse_strings_as_datetimes=True,
+        result_format="COMPLETE",
+    )
+    assert result.result["unexpected_list"] == ["2021-03-04T10:00:00"]
+
+    # values pandas cannot parse into a single dtype are parsed one by one, as before
+    result = dataset.expect_column_values_to_be_between(
+        "y",
+        "2020-01-01",
+        "2020-12-31",
+        parse_strings_as_datetimes=True,
+        allow_cross_type_comparisons=True,
+        result_format="COMPLETE",
+    )
+    assert result.result["unexpected_list"] == [
+        "2020-02-01T00:00:00+01:00",
+        "2021-03-04T10:00:00-05:00",
+    ]
+
+
+@pytest.mark.parametrize(
+    "values,min_value,max_value",
+    [
+        (["2020", "2021"], "2020", "2021"),
+        (["Jan 2020", "Feb 2020"], "Jan 2020", "Feb 2020"),
+    ],
+)
+def test_expect_column_values_to_be_between_parses_partial_dates_like_bounds(
+    values, min_value, max_value
+):
+    # dateutil completes partial dates from today's date, in the column as in the bounds
+    dataset = ge.dataset.PandasDataset({"d": values})
+    result = dataset.expect_column_values_to_be_between(
+        "d", min_value, max_value, parse_strings_as_datetimes=True
+    )
+    assert result.success
+
+
+@pytest.mark.parametrize("value", ["today", "2020Q1"])
+def test_expect_column_values_to_be_between_raises_for_strings_dateutil_cannot_parse(
+    value,
+):
+    dataset = ge.dataset.PandasDataset({"d": [value]})
+    with pytest.raises(ValueError):
+        dataset.expect_column_values_to_be_between(
+            "d", "2020-01-01", "2021-01-01", parse_strings_as_datetimes=True
+        )
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"a": [1, 2, 3, 1, 2], "b": [1, 3, 2, 1, 3], "c": [4, 2, 2, 4, 5]},
+        {"a": [1, 2, np.nan, np.nan], "b": [1.0, 2.5, np.nan, 3.0], "c": [0, 1, 2, 3]},
+        {
+            "a": [None, 1, "x", np.nan, "1"],
+            "b": [np.nan, 1.0, "x", np.nan, 1],
+            "c": ["y", "z", "y", "z", "1"],
+        },
+        {
+            "a": pd.to_datetime(["2020-01-01", None, "2020-01-02", "2020-01-01"]),
+            "b": pd.to_datetime(["2020-01-01", None, "2020-01-03", "2020-01-01"]),
+            "c": [1.5, 1.5, 1.5, 1.5],
+        },
+        {"a": pd.array([1, None, 2], dtype="Int64"), "b": [1, 1, 3], "c": [2, 2, 2]},
+    ],
+)
+@pytest.mark.parametrize(
+    "ignore_row_if", ["all_values_are_missing", "any_value_is_missing", "never"]
+)
+def test_multicolumn_uniqueness_matches_nunique_and_duplicated(data, ignore_row_if):
+    dataset = ge.dataset.PandasDataset(
+        data, index=[10, 11, 12, 13, 14][: len(data["a"])]
+    )
+    column_list = ["a", "b", "c"]
+    test_df = dataset[column_list]
+    if ignore_row_if == "all_values_are_missing":
+        test_df = test_df[~test_df.isnull().all(axis=1)]
+    elif ignore_row_if == "any_value_is_missing":
+        test_df = test_df[~test_df.isnull().any(axis=1)]
+
+    result = dataset.expect_select_column_values_to_be_unique_within_record(
+        column_list, ignore_row_if=ignore_row_if, result_format="COMPLETE"
+    )
+    expected = test_df.nunique(dropna=False, axis=1) >= len(column_list)
+    assert result.result["unexpected_index_list"] == list(
+        test_df.index[~expected.values]
+    )
+
+    result = dataset.expect_compound_columns_to_be_unique(
+        column_list, ignore_row_if=ignore_row_if, result_format="COMPLETE"
+    )
+    expected = ~test_df.duplicated(keep=False)
+    assert result.result["unexpected_index_list"] == list(
+        test_df.index[~expected.values]
+    )
+
+
+def test_map_expectation_summary_counts_match_counter():
+    values = np.random.RandomState(0).randint(0, 30, size=1000)
+    dataset = ge.dataset.PandasDataset(
+        {"x": values, "y": values % 7, "z": values.astype(str)},
+        index=np.arange(1000) % 10,
+    )
+    expectations = [
+        ("expect_column_values_to_be_in_set", ["x"], {"value_set": [1, 2, 3]}),
+        ("expect_column_values_to_be_in_set", ["z"], {"value_set": ["1"]}),
+        ("expect_column_pair_values_to_be_equal", ["x", "y"], {}),
+        ("expect_compound_columns_to_be_unique", [["x", "y"]], {}),
+    ]
+    for expectation_type, args, kwargs in expectations:
+        expectation = getattr(dataset, expectation_type)
+        complete = expectation(*args, result_format="COMPLETE", **kwargs).result
+        for partial_unexpected_count in [1, 5, 20, 100]:
+            result_format = {
+                "result_format": "SUMMARY",
+                "partial_unexpected_count": partial_unexpected_count,
+            }
+            summary = expectation(*args, result_format=result_format, **kwargs).result
+            assert summary["unexpected_count"] == complete["unexpected_count"]
+            assert (
+                summary["partial_unexpected_list"]
+                == complete["unexpected_list"][:partial_unexpected_count]
+            )
+            assert (
+                summary["partial_unexpected_index_list"]
+                == complete["unexpected_index_list"][:partial_unexpected_count]
+            )
+            if expectation_type == "expect_compound_columns_to_be_unique":
+                continue
+            assert summary["partial_unexpected_counts"] == [
+                {"value": value, "count": count}
+                for value, count in sorted(
+                    Counter(complete["unexpected_list"]).most_common(
+                        partial_unexpected_count
+                    ),
+                    key=lambda x: (-x[1], str(x[0])),
+                )
+            ]
+
+
+def test_pandas_dataset_merges_metrics_of_partitions():
+    from great_expectations.data_context.store import PartitionMetricStore
+
+    partition_metric_store = PartitionMetricStore()
+    df = pd.DataFrame(
+        {
+            "day": ["2020-01-01"] * 3 + ["2020-01-02"] * 2 + [None],
+            "x": [1.0, 2.0, 3.0, 4.0, None, 6.0],
+            "y": ["a", "b", "a", "c", "c", "b"],
+        }
+    )
+    batch_kwargs = {"data_asset_name": "events"}
+    dataset = ge.dataset.PandasDataset(
+        df,
+        partition_metric_store=partition_metric_store,
+        partition_column="day",
+        batch_kwargs=batch_kwargs,
+    )
+    full_dataset = ge.dataset.PandasDataset(df)
+    metric_calls = [
+        ("get_row_count", ()),
+        ("get_column_nonnull_count", ("x",)),
+        ("get_column_sum", ("x",)),
+        ("get_column_min", ("x",)),
+        ("get_column_max", ("y",)),
+        ("get_column_unique_count", ("y",)),
+        ("get_column_modes", ("y",)),
+        ("get_column_hist", ("x", [0, 2, 7])),
+        ("get_column_count_in_range", ("x", 2, 5)),
+    ]
+    for getter_name, args in metric_calls:
+        assert getattr(dataset, getter_name)(*args) == getattr(
+            full_dataset, getter_name
+        )(*args)
+    assert dataset.get_column_mean("x") == pytest.approx(
+        full_dataset.get_column_mean("x")
+    )
+    assert dataset.get_column_stdev("x") == pytest.approx(
+        full_dataset.get_column_stdev("x")
+    )
+    assert dataset.get_column_value_counts("y").equals(
+        full_dataset.get_column_value_counts("y")
+    )
+    assert len(dataset._partition_datasets) == 3
+
+    # appending a partition only computes the partial metrics of the new partition
+    df = df.append(
+        pd.DataFrame({"day": ["2020-01-03"], "x": [10.0], "y": ["d"]}),
+        ignore_index=True,
+    )
+    dataset = ge.dataset.PandasDataset(
+        df,
+        partition_metric_store=partition_metric_store,
+        partition_column="day",
+        batch_kwargs=batch_kwargs,
+    )
+    assert dataset.expect_column_mean_to_be_between("x", 0, 10).result[
+        "observed_value"
+    ] == pytest.approx(26.0 / 6)
+    assert dataset.expect_table_row_count_to_equal(7).success
+    assert list(dataset._partition_datasets) == ["2020-01-03"]
+
+    # changed partitions are computed again
+    df.loc[0, "x"] = 0.0
+    dataset = ge.dataset.PandasDataset(
+        df,
+        partition_metric_store=partition_metric_store,
+        partition_column="day",
+        batch_kwargs=batch_kwargs,
+    )
+    assert dataset.get_column_mean("x") == pytest.approx(25.0 / 6)
+    assert list(dataset._partition_datasets) == ["2020-01-01"]
+
+    with pytest.raises(ValueError):
+        ge.dataset.PandasDataset(df, partition_metric_store=partition_metric_store)
+
+
+def test_pandas_dataset_kl_divergence_from_sketches():
+    values = np.random.RandomState(0).normal(size=5000)
+    dataset = ge.dataset.PandasDataset(
+        {"x": values, "c": np.where(values > 0, "a", "b")}
+    )
+    partition_object = {
+        "bins": [-5, -1, 0, 1, 5],
+        "weights": [0.16, 0.34, 0.34, 0.16],
+    }
+
+    result = dataset.expect_column_kl_divergence_to_be_less_than(
+        "x", partition_object, threshold=0.1
+    )
+    sketch_result = dataset.expect_column_kl_divergence_to_be_less_than(
+        "x", partition_object, threshold=0.1, use_sketches=True
+    )
+    assert sketch_result.success
+    assert sketch_result.result["observed_value"] == pytest.approx(
+        result.result["observed_value"], abs=0.01
+    )
+    assert sketch_result.expectation_config.kwargs["use_sketches"] is True
+
+    # the frequent values sketch counts every value of columns with few distinct values
+    categorical_partition = {"values": ["a", "b"], "weights": [0.5, 0.5]}
+    assert dataset.expect_column_kl_divergence_to_be_less_than(
+        "c", categorical_partition, threshold=0.1, use_sketches=True
+    ).result == (
+        dataset.expect_column_kl_divergence_to_be_less_than(
+            "c", categorical_partition, threshold=0.1
+        ).result
+    )
+
+
+def test_pandas_dataset_merges_sketches_of_partitions():
+    from great_expectations.data_context.store import PartitionMetricStore
+
+    df = pd.DataFrame({"day": np.repeat([1, 2, 3], 1000), "x": np.arange(3000.0)})
+    dataset = ge.dataset.PandasDataset(
+        df,
+        partition_metric_store=PartitionMetricStore(),
+        partition_column="day",
+        batch_kwargs={"data_asset_name": "events"},
+    )
+    sketch = dataset.get_column_quantile_sketch("x")
+    assert sketch.count == 3000
+    assert sketch.get_quantiles([0, 0.5, 1]) == pytest.approx([0, 1500, 2999], abs=30)
+    assert dataset.get_column_distinct_count_sketch("x").get_distinct_count() == (
+        pytest.approx(3000, rel=0.05)
+    )
+    assert len(dataset._partition_datasets) == 3
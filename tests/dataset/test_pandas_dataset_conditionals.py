@@ -487,3 +487,56 @@ def test_condition_parser_in_expectation_config():
             row_condition="group=='a'",
             condition_parser="SQL",
         )
+
+
+def test_row_condition_mask_is_reused_across_expectations():
+    df = ge.dataset.PandasDataset(
+        {"x": [1, 2, 3, 4, 5, 6], "y": [1, 1, 2, 2, 3, 3], "group": list("aabbab")}
+    )
+
+    out = df.expect_column_values_to_be_between(
+        "x", 1, 5, condition_parser="pandas", row_condition="group=='a'"
+    )
+    assert out.success
+    assert out.result["element_count"] == 3
+    out = df.expect_column_max_to_be_between(
+        "y", 3, 3, condition_parser="pandas", row_condition="group=='a'"
+    )
+    assert out.success
+    assert list(df._row_condition_masks.keys()) == [("group=='a'", "pandas")]
+
+    subset = df._apply_row_condition("group=='b'", "pandas", columns=["x"])
+    assert list(subset.columns) == ["x"]
+    assert list(subset.index) == [0, 1, 2]
+    assert list(subset["x"]) == [3, 4, 6]
+    assert len(df._row_condition_masks) == 2
+
+    df_no_caching = ge.dataset.PandasDataset({"x": [1, 2, 3]}, caching=False)
+    df_no_caching.expect_column_values_to_be_between(
+        "x", 1, 2, condition_parser="pandas", row_condition="x < 3"
+    )
+    assert df_no_caching._row_condition_masks == {}
+
+
+def test_great_expectations_condition_parser():
+    df = ge.dataset.PandasDataset(
+        {"x": [1, 2, 3, 4, 5, 6], "y": ["p", None, "q", "r", None, "t"]}
+    )
+
+    out = df.expect_column_values_to_not_be_null(
+        "y",
+        row_condition='col("x") > 2 & not col("x") == 5',
+        condition_parser="great_expectations__experimental__",
+    )
+    assert out.success
+    assert out.result["element_count"] == 3
+
+    out = df.expect_column_values_to_be_between(
+        "x",
+        1,
+        1,
+        row_condition='col("y").isNull()',
+        condition_parser="great_expectations__experimental__",
+        result_format="COMPLETE",
+    )
+    assert out.result["unexpected_list"] == [2, 5]
@@ -2,10 +2,12 @@ import importlib.util
 import json
 from unittest import mock
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from great_expectations.dataset.sparkdf_dataset import SparkDFDataset
+from great_expectations.dataset.util import build_continuous_partition_object
 
 
 def test_sparkdfdataset_persist(spark_session):
@@ -26,6 +28,57 @@ def test_sparkdfdataset_persist(spark_session):
     sdf.persist.assert_called_once()
 
 
+def test_sparkdfdataset_persist_strategies(spark_session):
+    from pyspark import StorageLevel
+
+    from great_expectations.core import ExpectationConfiguration, ExpectationSuite
+
+    sdf = spark_session.createDataFrame(
+        pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6], "c": ["x", "y", "z"]})
+    )
+    suite = ExpectationSuite("test")
+    suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "b"},
+        )
+    )
+
+    with SparkDFDataset(
+        sdf, persist="projected", storage_level="MEMORY_ONLY", expectation_suite=suite
+    ) as dataset:
+        assert dataset.spark_df.columns == ["b"]
+        assert dataset.spark_df.storageLevel == StorageLevel.MEMORY_ONLY
+        assert dataset.get_table_columns() == ["a", "b", "c"]
+        assert dataset.validate().success
+        persisted_df = dataset.spark_df
+    assert not persisted_df.is_cached
+
+    # columns missing from the source fail their expectations rather than the batch
+    suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_column_to_exist", kwargs={"column": "missing"},
+        )
+    )
+    with SparkDFDataset(sdf, persist="projected", expectation_suite=suite) as dataset:
+        assert dataset.spark_df.columns == ["b"]
+        assert not dataset.expect_column_to_exist("missing").success
+
+    dataset = SparkDFDataset(sdf, persist="full")
+    assert dataset.spark_df.is_cached
+    assert dataset.expect_column_pair_values_to_be_equal("a", "a").success
+    assert dataset.expect_compound_columns_to_be_unique(["a", "c"]).success
+    dataset.close()
+    assert not sdf.is_cached
+
+    dataset = SparkDFDataset(sdf, persist="none")
+    assert not dataset.spark_df.is_cached
+    assert dataset.expect_column_pair_values_to_be_equal("a", "a").success
+
+    with pytest.raises(ValueError):
+        SparkDFDataset(sdf, persist="partial")
+
+
 @pytest.mark.skipif(
     importlib.util.find_spec("pyspark") is None, reason="requires the Spark library"
 )
@@ -424,3 +477,71 @@ def test_expect_column_values_to_be_json_parseable(spark_session):
         out = D.expect_column_values_to_be_json_parseable(**t["in"])
         assert t["out"]["success"] == out.success
         assert t["out"]["unexpected_list"] == out.result["unexpected_list"]
+
+
+def test_sparkdfdataset_row_condition(spark_session):
+    pandas_df = pd.DataFrame(
+        {"x": [1, 2, 3, 4, 5, 6], "group": ["a", "a", "b", "b", "a", "b"]}
+    )
+    df = SparkDFDataset(spark_session.createDataFrame(pandas_df))
+
+    result = df.expect_column_values_to_be_between(
+        "x",
+        1,
+        4,
+        row_condition='col("group") == "a"',
+        condition_parser="great_expectations__experimental__",
+        result_format="COMPLETE",
+    )
+    assert result.result["element_count"] == 3
+    assert result.result["unexpected_list"] == [5]
+
+    result = df.expect_column_max_to_be_between(
+        "x", 6, 6, row_condition="group = 'b'", condition_parser="spark"
+    )
+    assert result.success
+
+    result = df.expect_column_pair_values_A_to_be_greater_than_B(
+        "x",
+        "x",
+        or_equal=True,
+        row_condition='col("x") > 3',
+        condition_parser="great_expectations__experimental__",
+    )
+    assert result.result["element_count"] == 3
+    assert len(df._row_condition_datasets) == 3
+    filtered_df = df._row_condition_datasets[
+        ('col("x") > 3', "great_expectations__experimental__")
+    ].spark_df
+    df.close()
+    assert not filtered_df.is_cached
+
+    # without caching, filtered datasets are not tracked, so they are not persisted
+    df = SparkDFDataset(
+        spark_session.createDataFrame(pandas_df), persist=True, caching=False
+    )
+    dataset = df._apply_row_condition(
+        'col("x") > 3', "great_expectations__experimental__"
+    )
+    assert not dataset.spark_df.is_cached
+    assert df._row_condition_datasets == {}
+
+
+def test_sparkdfdataset_merges_sketches_of_partitions(spark_session):
+    pandas_df = pd.DataFrame({"x": np.arange(1000.0), "y": ["a", "b"] * 500})
+    df = SparkDFDataset(spark_session.createDataFrame(pandas_df).repartition(4))
+
+    sketch = df.get_column_quantile_sketch("x")
+    assert sketch.count == 1000
+    assert sketch.min == 0 and sketch.max == 999
+    assert sketch.get_quantiles([0.5]) == pytest.approx([500], abs=20)
+    assert df.get_column_distinct_count_sketch("y").get_distinct_count() == 2
+    assert df.get_column_frequent_values_sketch("y").get_frequencies(
+        sort="value"
+    ).to_dict() == {"a": 500, "b": 500}
+
+    # the distribution expectations can use the merged sketches
+    partition_object = build_continuous_partition_object(
+        df, "x", bins="uniform", n_bins=4, use_sketches=True
+    )
+    assert np.allclose(partition_object["weights"], 0.25, atol=0.02)
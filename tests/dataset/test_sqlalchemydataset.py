@@ -1,11 +1,20 @@
+import datetime
+import json
+import threading
+
 try:
     from unittest import mock
 except ImportError:
     from unittest import mock
+import numpy as np
 import pandas as pd
 import pytest
 
-from great_expectations.dataset import MetaSqlAlchemyDataset, SqlAlchemyDataset
+from great_expectations.dataset import (
+    MetaSqlAlchemyDataset,
+    PandasDataset,
+    SqlAlchemyDataset,
+)
 from great_expectations.util import is_library_loadable
 from tests.test_utils import get_dataset
 
@@ -152,6 +161,117 @@ def test_sqlalchemydataset_with_custom_sql(sa):
     assert result.success is False
 
 
+def test_sqlalchemydataset_with_custom_sql_as_subquery(sa):
+    engine = sa.create_engine("sqlite://")
+
+    data = pd.DataFrame(
+        {
+            "name": ["Frank", "Steve", "Jane", "Frank", "Michael"],
+            "age": [16, 21, 38, 22, 10],
+            "pet": ["fish", "python", "cat", "python", "frog"],
+        }
+    )
+
+    data.to_sql(name="test_sql_data", con=engine, index=False)
+
+    def count_temp_tables(dataset):
+        return dataset.engine.execute(
+            "SELECT count(*) FROM sqlite_temp_master WHERE type = 'table'"
+        ).scalar()
+
+    # a simple filter is expanded as a subquery instead of being materialized
+    custom_sql = "SELECT name, pet FROM test_sql_data WHERE age > 12;"
+    custom_sql_dataset = SqlAlchemyDataset(engine=engine, custom_sql=custom_sql)
+    assert not isinstance(custom_sql_dataset._table, sa.Table)
+    assert custom_sql_dataset._table.name.startswith("ge_tmp_")
+    assert count_temp_tables(custom_sql_dataset) == 0
+    assert custom_sql_dataset.get_table_columns() == ["name", "pet"]
+    assert custom_sql_dataset.get_row_count() == 4
+    assert custom_sql_dataset.head(2)["name"].tolist() == ["Frank", "Steve"]
+    result = custom_sql_dataset.expect_column_values_to_be_in_set(
+        "pet", ["fish", "cat", "python"]
+    )
+    assert result.success is True
+
+    # types of columns selected unchanged are reflected from the source table
+    assert custom_sql_dataset.expect_column_values_to_be_of_type("name", "TEXT").success
+    expression_dataset = SqlAlchemyDataset(
+        engine=engine, custom_sql="SELECT *, age + 1 AS next_age FROM test_sql_data"
+    )
+    assert not isinstance(expression_dataset._table, sa.Table)
+    assert [
+        column["name"] for column in expression_dataset.columns if "type" in column
+    ] == ["name", "age", "pet"]
+
+    # the same query is materialized on request
+    custom_sql_dataset = SqlAlchemyDataset(
+        engine=engine, custom_sql=custom_sql, create_temp_table=True
+    )
+    assert isinstance(custom_sql_dataset._table, sa.Table)
+    assert count_temp_tables(custom_sql_dataset) == 1
+    assert custom_sql_dataset.get_row_count() == 4
+
+    # queries returning different rows when they are re-run are materialized by default
+    custom_sql_dataset = SqlAlchemyDataset(
+        engine=engine, custom_sql="SELECT * FROM test_sql_data LIMIT 2"
+    )
+    assert isinstance(custom_sql_dataset._table, sa.Table)
+
+    # and are expanded as a subquery on request
+    custom_sql_dataset = SqlAlchemyDataset(
+        engine=engine,
+        custom_sql="SELECT * FROM test_sql_data ORDER BY age LIMIT 2",
+        create_temp_table=False,
+    )
+    assert not isinstance(custom_sql_dataset._table, sa.Table)
+    assert custom_sql_dataset.expect_column_max_to_be_between("age", 16, 16).success
+
+
+def test_sqlalchemydataset_with_colon_in_custom_sql_string_literal(sa):
+    engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [1, 2, 3], "b": ["x :y", "x :y", "z"]}).to_sql(
+        name="t", con=engine, index=False
+    )
+    custom_sql = "select * from t where b = 'x :y'"
+
+    for create_temp_table in [False, True]:
+        dataset = SqlAlchemyDataset(
+            engine=engine, custom_sql=custom_sql, create_temp_table=create_temp_table
+        )
+        assert dataset.get_row_count() == 2
+
+        dataset = SqlAlchemyDataset(
+            engine=engine,
+            custom_sql=custom_sql,
+            create_temp_table=create_temp_table,
+            projected_columns=["a"],
+        )
+        assert [column["name"] for column in dataset.columns] == ["a"]
+        assert dataset.get_row_count() == 2
+        assert dataset.get_column_max("a") == 2
+
+
+@pytest.mark.parametrize(
+    "query,is_cheap",
+    [
+        ("select * from t", True),
+        ("SELECT a, b FROM s.t WHERE c = 'group by' AND d > 1;", True),
+        ('select "order" from t', True),
+        ("select * from t join u on t.id = u.id", False),
+        ("select a, count(*) from t group by a", False),
+        ("select distinct a from t", False),
+        ("select * from t limit 10", False),
+        ("select * from t where random() < 0.1", False),
+        ("select * from (select * from t) s", False),
+        ("with s as (select * from t) select * from s", False),
+        ("select * from t; drop table t", False),
+        ("update t set a = 1", False),
+    ],
+)
+def test_sqlalchemydataset_is_query_cheap_to_inline(query, is_cheap):
+    assert SqlAlchemyDataset._is_query_cheap_to_inline(query) is is_cheap
+
+
 def test_column(sa):
     engine = sa.create_engine("sqlite://")
 
@@ -341,3 +461,451 @@ def test_expect_compound_columns_to_be_unique(sa):
     assert dataset.expect_compound_columns_to_be_unique(
         ["col1", "col2", "col4"]
     ).success
+
+
+def test_sqlalchemydataset_fingerprints_data_for_metric_cache(sa):
+    from great_expectations.data_context.store import MetricCacheStore
+
+    engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b", None]}).to_sql(
+        "test_sql_data", con=engine, index=False
+    )
+    metric_cache = MetricCacheStore()
+
+    # without a fingerprint column the data cannot be fingerprinted, so nothing is cached
+    dataset = SqlAlchemyDataset(
+        "test_sql_data", engine=engine, metric_cache=metric_cache
+    )
+    assert dataset.get_data_fingerprint() is None
+    assert dataset.expect_column_values_to_not_be_null("name").success is False
+    assert metric_cache.list_keys() == []
+
+    dataset = SqlAlchemyDataset(
+        "test_sql_data",
+        engine=engine,
+        metric_cache=metric_cache,
+        data_fingerprint_column="id",
+    )
+    fingerprint = dataset.get_data_fingerprint()
+    assert dataset.expect_column_values_to_not_be_null("name").success is False
+    assert dataset.get_column_max("id") == 3
+    number_of_keys = len(metric_cache.list_keys())
+    assert number_of_keys == 2
+
+    dataset = SqlAlchemyDataset(
+        "test_sql_data",
+        engine=engine,
+        metric_cache=metric_cache,
+        data_fingerprint_column="id",
+    )
+    assert dataset.get_data_fingerprint() == fingerprint
+    assert dataset.get_column_max("id") == 3
+    assert len(metric_cache.list_keys()) == number_of_keys
+
+    # new rows change the fingerprint
+    engine.execute("INSERT INTO test_sql_data VALUES (4, 'd')")
+    dataset = SqlAlchemyDataset(
+        "test_sql_data",
+        engine=engine,
+        metric_cache=metric_cache,
+        data_fingerprint_column="id",
+    )
+    assert dataset.get_data_fingerprint() != fingerprint
+    assert dataset.get_column_max("id") == 4
+
+
+def test_sqlalchemydataset_pushes_down_row_condition(sa):
+    engine = sa.create_engine("sqlite://")
+    data = pd.DataFrame(
+        {
+            "x": [1, 2, 3, 4, 5, 6],
+            "group": ["a", "a", "b", "b", "a", "b"],
+            "y": ["p", None, "q :r", "r", None, "t"],
+        }
+    )
+    data.to_sql(name="test_sql_data", con=engine, index=False)
+    dataset = SqlAlchemyDataset("test_sql_data", engine=engine)
+
+    result = dataset.expect_column_values_to_be_between(
+        "x",
+        1,
+        4,
+        row_condition='col("group") == "a"',
+        condition_parser="great_expectations__experimental__",
+        result_format="COMPLETE",
+    )
+    assert result.result["element_count"] == 3
+    assert result.result["unexpected_list"] == [5]
+    assert result.expectation_config.kwargs["row_condition"] == 'col("group") == "a"'
+
+    # the same condition reuses the filtered dataset
+    result = dataset.expect_column_max_to_be_between(
+        "x",
+        5,
+        5,
+        row_condition='col("group") == "a"',
+        condition_parser="great_expectations__experimental__",
+    )
+    assert result.success
+    assert len(dataset._row_condition_datasets) == 1
+    subset = dataset._row_condition_datasets[
+        ('col("group") == "a"', "great_expectations__experimental__")
+    ]
+    assert not isinstance(subset._table, sa.Table)
+    assert subset.columns[0]["type"].__class__ == dataset.columns[0]["type"].__class__
+
+    result = dataset.expect_column_values_to_not_be_null(
+        "y",
+        row_condition='col("group") == "b" | not col("x") >= 2',
+        condition_parser="great_expectations__experimental__",
+    )
+    assert result.success
+    assert result.result["element_count"] == 4
+
+    result = dataset.expect_column_values_to_not_be_null(
+        "y", row_condition="x IN (2, 5)", condition_parser="sql"
+    )
+    assert result.result["unexpected_count"] == 2
+
+    # colons in string literals are not taken for bind parameters
+    for row_condition, condition_parser in [
+        ('col("y") == "q :r"', "great_expectations__experimental__"),
+        ("y = 'q :r'", "sql"),
+    ]:
+        result = dataset.expect_column_values_to_be_between(
+            "x", 3, 3, row_condition=row_condition, condition_parser=condition_parser
+        )
+        assert result.success
+        assert result.result["element_count"] == 1
+
+    result = dataset.expect_column_values_to_not_be_null(
+        "y", row_condition="x > 2", condition_parser="pandas", catch_exceptions=True
+    )
+    assert "must be 'great_expectations__experimental__' or 'sql'" in (
+        result.exception_info["exception_message"]
+    )
+
+
+def test_sqlalchemydataset_caps_and_spills_complete_unexpected_values(sa, tmp_path):
+    engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"x": list(range(100))}).to_sql(
+        name="test_sql_data", con=engine, index=False
+    )
+
+    dataset = SqlAlchemyDataset(
+        "test_sql_data", engine=engine, max_unexpected_values_in_memory=10
+    )
+    dataset.UNEXPECTED_VALUES_FETCH_SIZE = 7
+    result = dataset.expect_column_values_to_be_between(
+        "x", 0, 50, result_format="COMPLETE"
+    )
+    assert result.result["unexpected_count"] == 49
+    assert result.result["unexpected_list"] == list(range(51, 61))
+    assert result.result["details"] == {"unexpected_list_truncated": True}
+
+    result = dataset.expect_column_values_to_be_between(
+        "x", 0, 95, result_format="COMPLETE"
+    )
+    assert result.result["unexpected_list"] == [96, 97, 98, 99]
+    assert "details" not in result.result
+
+    dataset = SqlAlchemyDataset(
+        "test_sql_data",
+        engine=engine,
+        max_unexpected_values_in_memory=10,
+        unexpected_values_spill_dir=str(tmp_path),
+    )
+    dataset.UNEXPECTED_VALUES_FETCH_SIZE = 7
+    result = dataset.expect_column_values_to_be_between(
+        "x", 0, 50, result_format="COMPLETE"
+    )
+    assert result.result["unexpected_list"] == list(range(51, 61))
+    spill_file = result.result["details"]["unexpected_list_file"]
+    assert spill_file.startswith(str(tmp_path))
+    with open(spill_file) as f:
+        assert [json.loads(line) for line in f] == list(range(51, 100))
+
+
+def test_sqlalchemydataset_samples_subqueries_without_tablesample(
+    sa, monkeypatch, caplog
+):
+    engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"x": list(range(100))}).to_sql(
+        name="test_sql_data", con=engine, index=False
+    )
+    dataset = SqlAlchemyDataset(
+        engine=engine, custom_sql="select * from test_sql_data where x >= 0"
+    )
+    assert not isinstance(dataset._table, sa.Table)
+    statements = []
+
+    @sa.event.listens_for(engine, "before_cursor_execute")
+    def record_statement(conn, cursor, statement, parameters, context, many):
+        statements.append(statement)
+
+    # TABLESAMPLE cannot follow the alias of a subquery, so rows are filtered on a random number
+    monkeypatch.setattr(engine.dialect, "name", "postgresql")
+    dataset.get_sample_dataset(0.5, seed=42)
+    create_statement = [
+        statement for statement in statements if "CREATE" in statement.upper()
+    ][0]
+    assert "TABLESAMPLE" not in create_statement.upper()
+    assert "random()" in create_statement
+    assert "Ignoring the seed of the sample" in caplog.text
+
+
+@pytest.mark.parametrize(
+    "bins",
+    [
+        [-3.0, -1.5, 0.0, 1.5, 3.0],
+        [-float("inf"), -1.0, 0.0, 0.5, 2.0, float("inf")],
+        [-2, -1, 0, 1, 2, 3],
+        [0.0, 5.0, 10.0, 15.0],
+        [-1.0, 0.0, float("inf")],
+    ],
+)
+def test_sqlalchemydataset_column_hist_matches_case_conditions(sa, bins):
+    engine = sa.create_engine("sqlite://")
+    values = [-3, -2.5, -1.5, -1, -0.25, 0, 0.5, 1, 1.5, 2, 2.999, 3, 3.5, None]
+    pd.DataFrame({"x": values}).to_sql(name="test_sql_data", con=engine, index=False)
+    dataset = SqlAlchemyDataset("test_sql_data", engine=engine)
+
+    hist = dataset.get_column_hist("x", tuple(bins))
+    assert len(hist) == len(bins) - 1
+    assert hist == dataset._get_column_hist_with_case_conditions("x", bins)
+
+
+def test_sqlalchemydataset_computes_quantiles_and_medians_in_one_query(sa):
+    engine = sa.create_engine("sqlite://")
+    df = pd.DataFrame(
+        {
+            "x": [7, None, 3, 1, 9, 5, None, 2, 8, 4],
+            "y": [1.5, 0.5, 2.5, 4.0, None, 3.0, 1.0, 2.0, 3.5, 0.0],
+        }
+    )
+    df.to_sql(name="test_sql_data", con=engine, index=False)
+    dataset = SqlAlchemyDataset("test_sql_data", engine=engine, caching=False)
+    quantiles = (0.0, 0.1, 0.25, 0.3, 0.5, 0.75, 1.0)
+
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sa.event.listen(engine, "before_cursor_execute", record_statement)
+    columns_quantiles = dataset.get_columns_quantiles({"x": quantiles, "y": quantiles})
+    columns_medians = dataset.get_columns_medians(["x", "y"])
+    sa.event.remove(engine, "before_cursor_execute", record_statement)
+
+    assert len(statements) == 2
+    # percentile_disc semantics: the smallest value whose cumulative distribution is at least the quantile
+    assert columns_quantiles == {
+        "x": [1.0, 1.0, 2.0, 3.0, 4.0, 7.0, 9.0],
+        "y": [0.0, 0.0, 1.0, 1.0, 2.0, 3.0, 4.0],
+    }
+    assert columns_medians == {"x": 4.5, "y": 2.0}
+    assert dataset.get_column_quantiles("x", quantiles) == columns_quantiles["x"]
+    assert dataset.get_column_median("x") == df["x"].median()
+    assert dataset.get_column_median("y") == df["y"].median()
+
+
+def test_sqlalchemydataset_bootstrapped_ks_test_samples_column_into_memory(sa):
+    engine = sa.create_engine("sqlite://")
+    values = np.random.RandomState(0).normal(size=200)
+    df = pd.DataFrame({"x": np.append(values, [np.nan] * 10)})
+    df.to_sql(name="test_sql_data", con=engine, index=False)
+    dataset = SqlAlchemyDataset("test_sql_data", engine=engine)
+    pandas_dataset = PandasDataset(df)
+
+    sample_values = dataset.get_column_sample_values("x", 50)
+    assert len(sample_values) == 50
+    assert set(sample_values) <= set(values)
+    assert sorted(dataset.get_column_sample_values("x", 1000)) == sorted(values)
+
+    # the whole column fits into the in-memory sample, so the bootstrap matches the pandas one for the same seed
+    partition_object = {"bins": [-1, 0, 1], "weights": [0.5, 0.5]}
+    result = dataset.expect_column_bootstrapped_ks_test_p_value_to_be_greater_than(
+        "x", partition_object, bootstrap_samples=100, seed=1, result_format="SUMMARY",
+    )
+    pandas_result = pandas_dataset.expect_column_bootstrapped_ks_test_p_value_to_be_greater_than(
+        "x", partition_object, bootstrap_samples=100, seed=1, result_format="SUMMARY",
+    )
+    assert result.success == pandas_result.success
+    assert result.result["observed_value"] == pandas_result.result["observed_value"]
+    observed_partition = result.result["details"]["observed_partition"]
+    assert observed_partition["bins"] == pytest.approx(
+        [values.min(), -1, 0, 1, values.max()]
+    )
+    assert observed_partition["weights"] == pytest.approx(
+        pandas_result.result["details"]["observed_partition"]["weights"]
+    )
+
+
+def test_sqlalchemydataset_prefetches_expectation_metrics_concurrently(sa, tmp_path):
+    from great_expectations.dataset.sqlalchemy_dataset import SqlAlchemyQueryExecutor
+
+    engine = sa.create_engine("sqlite:///" + str(tmp_path / "test.db"))
+    df = pd.DataFrame({"x": range(100), "y": [float(i % 7) for i in range(100)]})
+    df.to_sql(name="test_sql_data", con=engine, index=False)
+
+    suite_dataset = SqlAlchemyDataset("test_sql_data", engine=engine)
+    suite_dataset.expect_column_mean_to_be_between("x", 0, 100)
+    suite_dataset.expect_column_median_to_be_between("y", 0, 6)
+    suite_dataset.expect_column_max_to_be_between("x", 0, 99)
+    suite_dataset.expect_column_quantile_values_to_be_between(
+        "x", {"quantiles": [0.1, 0.9], "value_ranges": [[9, 10], [89, 90]]}
+    )
+    suite_dataset.expect_column_values_to_not_be_null("y")
+    expectation_suite = suite_dataset.get_expectation_suite()
+
+    query_threads = set()
+
+    def record_thread(conn, cursor, statement, parameters, context, executemany):
+        query_threads.add(threading.current_thread().name)
+
+    executor = SqlAlchemyQueryExecutor(max_concurrent_queries=4)
+    dataset = SqlAlchemyDataset("test_sql_data", engine=engine, query_executor=executor)
+    sa.event.listen(engine, "before_cursor_execute", record_thread)
+    results = dataset.validate(expectation_suite=expectation_suite)
+    sa.event.remove(engine, "before_cursor_execute", record_thread)
+    executor.shutdown()
+
+    assert results.success
+    assert [result.result for result in results.results] == [
+        result.result
+        for result in suite_dataset.validate(
+            expectation_suite=expectation_suite
+        ).results
+    ]
+    assert any(name.startswith("ge_sqlalchemy_query") for name in query_threads)
+    # the prefetched metrics are served from the cache when the expectations are evaluated
+    assert dataset.get_column_median.cache_info().hits == 1
+    assert dataset.get_column_median.cache_info().misses == 1
+    assert (
+        dataset.compute_metrics(
+            [("get_column_min", ("x",), {}), ("get_column_sum", ("missing",), {})]
+        )[0]
+        == 0
+    )
+
+    # an in-memory sqlite database is not shared between connections
+    memory_engine = sa.create_engine("sqlite://")
+    df.to_sql(name="test_sql_data", con=memory_engine, index=False)
+    memory_dataset = SqlAlchemyDataset(
+        "test_sql_data", engine=memory_engine, query_executor=executor
+    )
+    assert not memory_dataset._can_compute_metrics_concurrently()
+    assert memory_dataset.validate(expectation_suite=expectation_suite).success
+
+
+def test_sqlalchemydataset_merges_metrics_of_partitions(sa):
+    from great_expectations.data_context.store import PartitionMetricStore
+
+    engine = sa.create_engine("sqlite://")
+    pd.DataFrame(
+        {
+            "id": [1, 2, 3, 4, 5],
+            "day": ["2020-01-01", "2020-01-01", "2020-01-02", "2020-01-02", None],
+            "x": [1.0, 2.0, 3.0, None, 5.0],
+        }
+    ).to_sql("test_sql_data", con=engine, index=False)
+    partition_metric_store = PartitionMetricStore()
+
+    def get_partitioned_dataset():
+        return SqlAlchemyDataset(
+            "test_sql_data",
+            engine=engine,
+            data_fingerprint_column="id",
+            partition_metric_store=partition_metric_store,
+            partition_column="day",
+            batch_kwargs={"data_asset_name": "test_sql_data"},
+        )
+
+    dataset = get_partitioned_dataset()
+    assert dataset.get_row_count() == 5
+    assert dataset.get_column_nonnull_count("x") == 4
+    assert dataset.get_column_mean("x") == pytest.approx(2.75)
+    assert dataset.get_column_max("x") == 5.0
+    assert dataset.expect_column_unique_value_count_to_be_between("day", 2, 2).success
+    assert len(dataset._partition_datasets) == 3
+
+    # only the partition receiving new rows is computed again
+    engine.execute("INSERT INTO test_sql_data VALUES (6, '2020-01-02', 9.0)")
+    dataset = get_partitioned_dataset()
+    assert dataset.get_row_count() == 6
+    assert dataset.get_column_max("x") == 9.0
+    assert dataset.get_column_mean("x") == pytest.approx(4.0)
+    # sqlite has no standard deviation function, which merged moments do not need
+    assert dataset.get_column_stdev("x") == pytest.approx(
+        np.std([1.0, 2.0, 3.0, 5.0, 9.0], ddof=1)
+    )
+    assert list(dataset._partition_datasets) == ["2020-01-02"]
+
+
+def test_sqlalchemydataset_filters_date_partitions_with_bound_parameters(sa, caplog):
+    from sqlalchemy.dialects import postgresql
+
+    from great_expectations.data_context.store import PartitionMetricStore
+
+    engine = sa.create_engine("sqlite://")
+    table = sa.Table(
+        "test_sql_data",
+        sa.MetaData(),
+        sa.Column("day", sa.Date),
+        sa.Column("x", sa.Float),
+    )
+    table.create(engine)
+    engine.execute(
+        table.insert(),
+        [
+            {"day": datetime.date(2020, 1, 1), "x": 1.0},
+            {"day": datetime.date(2020, 1, 1), "x": 2.0},
+            {"day": datetime.date(2020, 1, 2), "x": 6.0},
+        ],
+    )
+    dataset = SqlAlchemyDataset(
+        "test_sql_data",
+        engine=engine,
+        partition_metric_store=PartitionMetricStore(),
+        partition_column="day",
+        batch_kwargs={"data_asset_name": "test_sql_data"},
+    )
+    assert dataset.get_column_mean("x") == pytest.approx(3.0)
+    # without a data_fingerprint_column, updates in place go unnoticed
+    assert "set a data_fingerprint_column" in caplog.text
+    assert set(dataset._partition_datasets) == {
+        datetime.date(2020, 1, 1),
+        datetime.date(2020, 1, 2),
+    }
+
+    # dates are bound rather than rendered as literals, which not every dialect supports
+    partition_query = dataset._partition_datasets[
+        datetime.date(2020, 1, 2)
+    ]._table.element.compile(dialect=postgresql.dialect())
+    assert list(partition_query.params.values()) == [datetime.date(2020, 1, 2)]
+
+
+def test_sqlalchemydataset_builds_sketches_from_fetched_chunks(sa, monkeypatch):
+    engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"x": [1.0, 2.0, None, 4.0, 2.0], "y": list("abcab")}).to_sql(
+        "test_sql_data", con=engine, index=False
+    )
+    dataset = SqlAlchemyDataset("test_sql_data", engine=engine)
+    monkeypatch.setattr(
+        "great_expectations.dataset.sqlalchemy_dataset.SKETCH_CHUNK_SIZE", 2
+    )
+    stream_results = []
+
+    @sa.event.listens_for(engine, "before_cursor_execute")
+    def record_stream_results(conn, cursor, statement, parameters, context, many):
+        stream_results.append(context.execution_options.get("stream_results"))
+
+    sketch = dataset.get_column_quantile_sketch("x")
+    # the values are streamed rather than buffered by the driver, where it supports it
+    assert stream_results == [True]
+    assert sketch.count == 4
+    assert sketch.get_quantiles([0, 0.5, 1]) == [1.0, 2.0, 4.0]
+    assert dataset.get_column_distinct_count_sketch("y").get_distinct_count() == 3
+    assert dataset.get_column_frequent_values_sketch("y").get_frequencies(
+        sort="value"
+    ).to_dict() == {"a": 2, "b": 2, "c": 1}
@@ -1,10 +1,16 @@
 import numpy as np
 import pytest
+from scipy import stats
 
-from great_expectations.dataset import SqlAlchemyDataset
+from great_expectations.dataset import PandasDataset, SqlAlchemyDataset
 from great_expectations.dataset.util import (
+    bootstrapped_ks_test_p_values,
     build_continuous_partition_object,
+    combine_regex_list,
+    compile_regex_list,
     is_valid_continuous_partition_object,
+    kde_partition_data,
+    parse_row_condition,
 )
 
 
@@ -50,3 +56,103 @@ def test_build_continuous_partition_object(
     assert np.allclose(partition["weights"], weights / n)
     assert np.allclose(partition["bins"], bin_edges)
     assert is_valid_continuous_partition_object(partition)
+
+
+def test_build_continuous_partition_object_from_sketch(
+    numeric_high_card_dataset, numeric_high_card_dict
+):
+    n = len(numeric_high_card_dict["norm_0_1"])
+    weights, bin_edges = np.histogram(numeric_high_card_dict["norm_0_1"], bins=5)
+
+    partition = build_continuous_partition_object(
+        dataset=numeric_high_card_dataset,
+        column="norm_0_1",
+        bins="uniform",
+        n_bins=5,
+        use_sketches=True,
+    )
+    # the minimum and maximum are exact, the weights are estimated from ranks
+    assert np.allclose(partition["bins"], bin_edges)
+    assert np.allclose(partition["weights"], weights / n, atol=0.02)
+    assert is_valid_continuous_partition_object(partition)
+
+    partition = build_continuous_partition_object(
+        dataset=numeric_high_card_dataset,
+        column="norm_0_1",
+        bins="ntile",
+        n_bins=4,
+        use_sketches=True,
+    )
+    assert np.allclose(partition["weights"], 0.25, atol=0.02)
+
+    sketch = numeric_high_card_dataset.get_column_quantile_sketch("norm_0_1")
+    assert is_valid_continuous_partition_object(kde_partition_data(sketch))
+
+
+def test_parse_row_condition():
+    assert parse_row_condition('col("a") == "x"') == ("compare", "a", "==", "x")
+    assert parse_row_condition(
+        "col('a') >= 1.5 & (col(\"b\").isNull() | not col('c') != 3) and col('d').notNull()"
+    ) == (
+        "and",
+        [
+            ("compare", "a", ">=", 1.5),
+            ("or", [("isNull", "b"), ("not", ("compare", "c", "!=", 3))]),
+            ("notNull", "d"),
+        ],
+    )
+    with pytest.raises(ValueError):
+        parse_row_condition("a == 1")
+    with pytest.raises(ValueError):
+        parse_row_condition('col("a") == 1 garbage')
+
+
+def test_combine_regex_list():
+    assert combine_regex_list(("^a",)) == "^a"
+    assert combine_regex_list(("^a", "b|c$")) == "(?:^a)|(?:b|c$)"
+    # backreferences, conditional groups, named groups and global inline flags change meaning within an alternation
+    assert combine_regex_list(("^a", r"(x)\1")) is None
+    assert combine_regex_list(("(z)", "^(a)?(?(1)a|b)$")) is None
+    assert combine_regex_list(("^a", "(?P<name>x)")) is None
+    assert combine_regex_list(("^a", "(?i)x")) is None
+    assert combine_regex_list(("^a", "(?i:x)", "(?<=y)x")) is not None
+
+    compiled_regexes = compile_regex_list(("^a", "b$"), combine=True)
+    assert len(compiled_regexes) == 1
+    assert compile_regex_list(("^a", "b$"), combine=True) is compiled_regexes
+    assert [
+        bool(compiled_regexes[0].search(value)) for value in ["ax", "xb", "xa"]
+    ] == [True, True, False]
+    assert len(compile_regex_list(("^a", "b$"))) == 2
+
+    dataset = PandasDataset({"x": ["aa", "b", "zz", "a", "q"]})
+    result = dataset.expect_column_values_to_match_regex_list(
+        "x", ["(z)", "^(a)?(?(1)a|b)$"], result_format="COMPLETE"
+    )
+    assert result.result["unexpected_index_list"] == [3, 4]
+
+
+def test_bootstrapped_ks_test_p_values_match_kstest(monkeypatch):
+    values = np.random.RandomState(0).normal(size=500)
+    partition_object = {
+        "bins": [-4, -2, -1, 0, 1, 2, 4],
+        "weights": [0.025, 0.135, 0.34, 0.34, 0.135, 0.025],
+    }
+    cdf_values = np.append([0], np.cumsum(partition_object["weights"]))
+
+    # draw the bootstrap samples in several chunks
+    monkeypatch.setattr("great_expectations.dataset.util.BOOTSTRAP_CHUNK_SIZE", 100)
+    p_values = bootstrapped_ks_test_p_values(values, partition_object, 50, 12, seed=42)
+
+    samples = np.random.RandomState(42).choice(values, size=(50, 12))
+    expected_p_values = [
+        stats.kstest(
+            sample, lambda x: np.interp(x, partition_object["bins"], cdf_values)
+        )[1]
+        for sample in samples
+    ]
+    assert np.allclose(p_values, expected_p_values)
+    assert np.array_equal(
+        p_values,
+        bootstrapped_ks_test_p_values(values, partition_object, 50, 12, seed=42),
+    )
@@ -8,17 +8,20 @@ import pytest
 from moto import mock_s3
 from ruamel.yaml import YAML
 
-from great_expectations.core import ExpectationSuite
+from great_expectations.core import ExpectationConfiguration, ExpectationSuite
 from great_expectations.core.batch import Batch
 from great_expectations.core.util import nested_update
 from great_expectations.data_context.types.base import DataContextConfigSchema
 from great_expectations.data_context.util import file_relative_path
+from great_expectations.dataset import PandasDataset
 from great_expectations.datasource import PandasDatasource
 from great_expectations.datasource.types.batch_kwargs import (
     BatchMarkers,
+    PandasDatasourceInMemoryBatchKwargs,
     PathBatchKwargs,
 )
 from great_expectations.exceptions import BatchKwargsError
+from great_expectations.util import is_library_loadable
 from great_expectations.validator.validator import Validator
 
 yaml = YAML()
@@ -424,3 +427,121 @@ def test_pandas_datasource_processes_dataset_options(test_folder_connection_path
     validator = Validator(batch, ExpectationSuite(expectation_suite_name="foo"))
     dataset = validator.get_dataset()
     assert dataset.caching is False
+
+
+def test_pandas_datasource_reads_only_batch_kwargs_columns(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("test_pandas_datasource_columns"))
+    pd.DataFrame({"a": [1, 2], "b": ["x", "y"], "c": [1.5, 2.5]}).to_csv(
+        os.path.join(path, "test.csv"), index=False
+    )
+    datasource = PandasDatasource("PandasCSV")
+
+    batch = datasource.get_batch(
+        PathBatchKwargs(
+            path=os.path.join(path, "test.csv"), columns=["c", "a", "missing"]
+        )
+    )
+    assert list(batch.data.columns) == ["a", "c"]
+
+    with pytest.raises(BatchKwargsError):
+        datasource.get_batch(
+            PathBatchKwargs(path=os.path.join(path, "test.csv"), reader_engine="spark")
+        )
+
+
+def test_pandas_datasource_samples_fingerprints_of_large_frames(monkeypatch):
+    import great_expectations.datasource.pandas_datasource as pandas_datasource
+
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "x"]})
+    datasource = PandasDatasource("PandasDF")
+    batch = datasource.get_batch(PandasDatasourceInMemoryBatchKwargs(dataset=df))
+    assert "pandas_data_fingerprint_sampled" not in batch.batch_markers
+    assert (
+        PandasDataset(df, batch_markers=batch.batch_markers).get_data_fingerprint()
+        == batch.batch_markers["pandas_data_fingerprint"]
+    )
+
+    # a sampled fingerprint can miss changes, so it never keys the metric cache
+    monkeypatch.setattr(pandas_datasource, "HASH_THRESHOLD", 0)
+    batch = datasource.get_batch(PandasDatasourceInMemoryBatchKwargs(dataset=df))
+    assert "pandas_data_fingerprint" not in batch.batch_markers
+    assert batch.batch_markers["pandas_data_fingerprint_sampled"] is not None
+    dataset = PandasDataset(df, batch_markers=batch.batch_markers)
+    assert dataset.get_data_fingerprint() is None
+
+
+def test_data_context_prunes_batch_columns_for_suite(
+    data_context_parameterized_expectation_suite, test_folder_connection_path
+):
+    context = data_context_parameterized_expectation_suite
+    context.add_datasource(
+        "pruned_source",
+        class_name="PandasDatasource",
+        prune_columns=True,
+        batch_kwargs_generators={
+            "subdir_reader": {
+                "class_name": "SubdirReaderBatchKwargsGenerator",
+                "base_directory": test_folder_connection_path,
+            }
+        },
+    )
+    suite = context.create_expectation_suite(expectation_suite_name="pruned")
+    suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "col_2"},
+        )
+    )
+    batch_kwargs = context.build_batch_kwargs("pruned_source", "subdir_reader", "test")
+
+    batch = context.get_batch(batch_kwargs, suite)
+    assert list(batch.columns) == ["col_2"]
+    assert batch.batch_kwargs["columns"] == ["col_2"]
+    assert batch.validate().success
+
+    # suites which may depend on other columns read all of them
+    suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_table_column_count_to_equal", kwargs={"value": 3},
+        )
+    )
+    batch = context.get_batch(batch_kwargs, suite)
+    assert len(batch.columns) == 3
+    assert "columns" not in batch.batch_kwargs
+
+
+@pytest.mark.skipif(
+    not is_library_loadable(library_name="pyarrow"), reason="pyarrow is not installed"
+)
+def test_pandas_datasource_reads_with_pyarrow(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("test_pandas_datasource_pyarrow"))
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "x"], "c": [1.5, 2.5, None]})
+    df.to_csv(os.path.join(path, "test.csv"), index=False)
+    df.to_parquet(os.path.join(path, "test.parquet"))
+    datasource = PandasDatasource("PandasArrow", reader_engine="pyarrow")
+
+    for file_name in ["test.csv", "test.parquet"]:
+        batch_kwargs = PathBatchKwargs(path=os.path.join(path, file_name))
+        nested_update(batch_kwargs, datasource.process_batch_parameters())
+        assert batch_kwargs["reader_engine"] == "pyarrow"
+
+        batch = datasource.get_batch(batch_kwargs)
+        assert list(batch.data.columns) == ["a", "b", "c"]
+        assert batch.data["b"].dtype == "object"
+        assert batch.data["b"].tolist() == ["x", "y", "x"]
+        # expectations see the same types as with the pandas reader
+        dataset = PandasDataset(batch.data)
+        assert dataset.expect_column_values_to_be_in_type_list("b", ["str"]).success
+        assert dataset.expect_column_max_to_be_between("b", "y", "y").success
+
+        categorical_batch_kwargs = dict(
+            batch_kwargs,
+            reader_options={"to_pandas_options": {"strings_to_categorical": True}},
+        )
+        batch = datasource.get_batch(categorical_batch_kwargs)
+        assert batch.data["b"].dtype == "category"
+        assert batch.data["b"].tolist() == ["x", "y", "x"]
+
+        batch_kwargs["columns"] = ["b", "missing"]
+        batch = datasource.get_batch(batch_kwargs)
+        assert list(batch.data.columns) == ["b"]
@@ -211,6 +211,26 @@ def test_standalone_spark_parquet_datasource(
     assert batch.data.count() == 2
 
 
+def test_spark_datasource_reads_only_batch_kwargs_columns(
+    test_parquet_folder_connection_path, spark_session
+):
+    datasource = SparkDFDatasource("SparkParquet")
+    batch = datasource.get_batch(
+        batch_kwargs={
+            "path": os.path.join(test_parquet_folder_connection_path, "test.parquet"),
+            "columns": ["col_2"],
+        }
+    )
+    dataset = Validator(
+        batch, ExpectationSuite("test"), expectation_engine=SparkDFDataset
+    ).get_dataset()
+    assert dataset.spark_df.columns == ["col_2"]
+    # table expectations still see all columns of the source
+    assert dataset.get_table_columns() == ["col_1", "col_2"]
+    assert dataset.expect_table_column_count_to_equal(2).success
+    assert dataset.expect_column_values_to_not_be_null("col_2").success
+
+
 def test_standalone_spark_csv_datasource(test_folder_connection_path, test_backends):
     if "SparkDFDataset" not in test_backends:
         pytest.skip("Spark has not been enabled, so this test must be skipped.")
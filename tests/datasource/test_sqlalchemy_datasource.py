@@ -1,4 +1,5 @@
 import os
+import time
 from unittest import mock
 
 import pandas as pd
@@ -6,9 +7,10 @@ import pytest
 from ruamel.yaml import YAML
 
 import great_expectations.dataset.sqlalchemy_dataset
-from great_expectations.core import ExpectationSuite
+from great_expectations.core import ExpectationConfiguration, ExpectationSuite
 from great_expectations.core.batch import Batch
 from great_expectations.dataset import SqlAlchemyDataset
+from great_expectations.dataset.sqlalchemy_dataset import SqlAlchemyReflectionCache
 from great_expectations.datasource import SqlAlchemyDatasource
 from great_expectations.validator.validator import Validator
 
@@ -220,7 +222,14 @@ def test_sqlalchemy_datasource_query_and_table_handling(sqlitedb_engine):
     ) as mock_batch:
         datasource.get_batch({"query": "select * from foo;"})
     mock_batch.assert_called_once_with(
-        engine=sqlitedb_engine, schema=None, query="select * from foo;", table_name=None
+        engine=sqlitedb_engine,
+        schema=None,
+        query="select * from foo;",
+        table_name=None,
+        create_temp_table=None,
+        reflection_cache=datasource.reflection_cache,
+        query_executor=datasource.query_executor,
+        projected_columns=None,
     )
 
     # Normally, we do not allow both query and table_name
@@ -230,7 +239,14 @@ def test_sqlalchemy_datasource_query_and_table_handling(sqlitedb_engine):
     ) as mock_batch:
         datasource.get_batch({"query": "select * from foo;", "table_name": "bar"})
     mock_batch.assert_called_once_with(
-        engine=sqlitedb_engine, schema=None, query="select * from foo;", table_name=None
+        engine=sqlitedb_engine,
+        schema=None,
+        query="select * from foo;",
+        table_name=None,
+        create_temp_table=None,
+        reflection_cache=datasource.reflection_cache,
+        query_executor=datasource.query_executor,
+        projected_columns=None,
     )
 
     # Snowflake should require query *and* snowflake_transient_table
@@ -247,6 +263,10 @@ def test_sqlalchemy_datasource_query_and_table_handling(sqlitedb_engine):
         schema=None,
         query="select * from foo;",
         table_name="bar",
+        create_temp_table=None,
+        reflection_cache=datasource.reflection_cache,
+        query_executor=datasource.query_executor,
+        projected_columns=None,
     )
 
 
@@ -280,3 +300,257 @@ def test_sqlalchemy_datasource_processes_dataset_options(test_db_connection_stri
     validator = Validator(batch, ExpectationSuite(expectation_suite_name="foo"))
     dataset = validator.get_dataset()
     assert dataset.caching is False
+
+
+def test_sqlalchemy_datasource_passes_pool_options_to_engine(
+    test_db_connection_string,
+):
+    datasource = SqlAlchemyDatasource(
+        "SqlAlchemy", connection_string=test_db_connection_string, pool_pre_ping=True
+    )
+    assert datasource.engine.pool._pre_ping is True
+    assert datasource.config["pool_pre_ping"] is True
+
+    datasource = SqlAlchemyDatasource(
+        "SqlAlchemy",
+        credentials={"url": test_db_connection_string},
+        pool_pre_ping=True,
+    )
+    assert datasource.engine.pool._pre_ping is True
+
+
+def test_sqlalchemy_dataset_holds_single_connection_until_closed(
+    test_db_connection_string, sa
+):
+    engine = sa.create_engine(test_db_connection_string)
+    dataset = SqlAlchemyDataset(
+        custom_sql="select * from table_1", engine=engine, create_temp_table=True
+    )
+    assert isinstance(dataset.engine, sa.engine.Connection)
+    assert dataset.engine.closed is False
+    assert dataset.get_row_count() == 5
+    dataset.close()
+    assert dataset.engine.closed is True
+    # closing twice is harmless
+    dataset.close()
+
+    with SqlAlchemyDataset(
+        custom_sql="select * from table_1", engine=engine, create_temp_table=True
+    ) as dataset:
+        assert dataset.expect_column_values_to_not_be_null("col_1").success is True
+    assert dataset.engine.closed is True
+
+    # a connection supplied by the caller is left open
+    connection = engine.connect()
+    dataset = SqlAlchemyDataset("table_1", engine=connection)
+    dataset.close()
+    assert connection.closed is False
+    connection.close()
+
+
+def test_sqlalchemy_datasource_shares_reflection_cache_between_batches(
+    test_db_connection_string, sa
+):
+    datasource = SqlAlchemyDatasource(
+        "SqlAlchemy",
+        connection_string=test_db_connection_string,
+        batch_kwargs_generators={
+            "default": {"class_name": "TableBatchKwargsGenerator"}
+        },
+    )
+    assert set(datasource.get_available_data_asset_names()["default"]["names"]) == {
+        ("main.table_1", "table"),
+        ("main.table_2", "table"),
+    }
+
+    def get_dataset(table):
+        batch = datasource.get_batch({"table": table, "schema": "main"})
+        return Validator(batch, ExpectationSuite("foo")).get_dataset()
+
+    with mock.patch(
+        "sqlalchemy.engine.reflection.Inspector.get_columns",
+        wraps=sa.engine.reflection.Inspector.get_columns,
+        autospec=True,
+    ) as mock_get_columns:
+        for _ in range(3):
+            dataset = get_dataset("table_1")
+            assert dataset.get_table_columns() == ["index", "col_1", "col_2"]
+        assert mock_get_columns.call_count == 1
+
+        # new tables are not listed until the cache is invalidated
+        sa.create_engine(test_db_connection_string).execute(
+            "CREATE TABLE table_3 (col_1 INTEGER)"
+        )
+        assert (
+            "main.table_3",
+            "table",
+        ) not in datasource.get_available_data_asset_names()["default"]["names"]
+        datasource.reflection_cache.invalidate(schema="main")
+        assert ("main.table_3", "table") in datasource.get_available_data_asset_names()[
+            "default"
+        ]["names"]
+        get_dataset("table_1")
+        assert mock_get_columns.call_count == 2
+
+
+def test_sqlalchemy_datasource_shares_query_executor_between_batches(
+    test_db_connection_string,
+):
+    datasource = SqlAlchemyDatasource(
+        "SqlAlchemy",
+        connection_string=test_db_connection_string,
+        max_concurrent_queries=3,
+    )
+    assert datasource.query_executor.max_concurrent_queries == 3
+
+    datasets = [
+        Validator(
+            datasource.get_batch({"table": table, "schema": "main"}),
+            ExpectationSuite("foo"),
+        ).get_dataset()
+        for table in ["table_1", "table_2"]
+    ]
+    for dataset in datasets:
+        assert dataset._query_executor is datasource.query_executor
+        assert dataset.compute_metrics(
+            [("get_column_min", ("col_1",), {}), ("get_column_max", ("col_1",), {})]
+        ) == [dataset.get_column_min("col_1"), dataset.get_column_max("col_1")]
+
+    assert (
+        SqlAlchemyDatasource(
+            "SqlAlchemy", connection_string=test_db_connection_string
+        ).query_executor
+        is None
+    )
+
+
+def test_data_context_prunes_sqlalchemy_batch_columns_for_suite(
+    data_context_parameterized_expectation_suite, test_db_connection_string
+):
+    context = data_context_parameterized_expectation_suite
+    context.add_datasource(
+        "pruned_source",
+        class_name="SqlAlchemyDatasource",
+        credentials={"url": test_db_connection_string},
+        prune_columns=True,
+    )
+    suite = context.create_expectation_suite(expectation_suite_name="pruned")
+    suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "col_2"},
+        )
+    )
+    suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_table_columns_to_match_ordered_list",
+            kwargs={"column_list": ["index", "col_1", "col_2"]},
+        )
+    )
+
+    for create_temp_table in [True, False]:
+        batch = context.get_batch(
+            {
+                "datasource": "pruned_source",
+                "query": "select * from table_1 where col_1 > 1",
+                "create_temp_table": create_temp_table,
+            },
+            suite,
+        )
+        assert batch.batch_kwargs["columns"] == ["col_2", "index", "col_1"]
+        assert batch.get_table_columns() == ["index", "col_1", "col_2"]
+        assert batch.get_column_count() == 3
+        assert batch.validate().success
+
+    # table expectations are answered from the columns of the query, not of the batch
+    batch = context.get_batch(
+        {
+            "datasource": "pruned_source",
+            "query": "select * from table_1",
+            "columns": ["col_2"],
+        },
+        suite,
+    )
+    assert [column["name"] for column in batch.columns] == ["col_2"]
+    assert batch.get_table_columns() == ["index", "col_1", "col_2"]
+    assert batch.get_column_unique_count("col_2") == 5
+    assert batch.validate().success
+
+
+def test_data_context_prunes_sqlalchemy_batch_columns_missing_from_query(
+    data_context_parameterized_expectation_suite, test_db_connection_string
+):
+    context = data_context_parameterized_expectation_suite
+    context.add_datasource(
+        "pruned_source",
+        class_name="SqlAlchemyDatasource",
+        credentials={"url": test_db_connection_string},
+        prune_columns=True,
+    )
+    suite = context.create_expectation_suite(expectation_suite_name="pruned")
+    for column in ["col_1", "missing"]:
+        suite.add_expectation(
+            ExpectationConfiguration(
+                expectation_type="expect_column_to_exist", kwargs={"column": column},
+            )
+        )
+
+    # the expectation on the missing column fails, not the batch
+    for create_temp_table in [True, False]:
+        batch = context.get_batch(
+            {
+                "datasource": "pruned_source",
+                "query": "select * from table_1",
+                "create_temp_table": create_temp_table,
+            },
+            suite,
+        )
+        assert [column["name"] for column in batch.columns] == ["col_1"]
+        results = batch.validate().results
+        assert [result.success for result in results] == [True, False]
+
+
+def test_sqlalchemy_reflection_cache_ttl(test_db_connection_string, sa):
+    engine = sa.create_engine(test_db_connection_string)
+    reflection_cache = SqlAlchemyReflectionCache(ttl=60)
+    inspector = reflection_cache.get_inspector(engine)
+    assert inspector.get_table_names(schema="main") == ["table_1", "table_2"]
+
+    engine.execute("CREATE TABLE table_3 (col_1 INTEGER)")
+    assert inspector.get_table_names(schema="main") == ["table_1", "table_2"]
+    with mock.patch("time.monotonic", return_value=time.monotonic() + 61):
+        assert inspector.get_table_names(schema="main") == [
+            "table_1",
+            "table_2",
+            "table_3",
+        ]
+
+    # invalidating a table keeps the entries of other tables
+    columns = inspector.get_columns("table_1", schema="main")
+    columns[0]["name"] = "changed"
+    assert inspector.get_columns("table_1", schema="main")[0]["name"] == "index"
+    inspector.get_columns("table_2", schema="main")
+    reflection_cache.invalidate(table_name="table_1", schema="main")
+    assert set(key[3] for key in reflection_cache._entries) == {"table_2"}
+
+
+def test_sqlalchemy_datasets_without_temporary_table_hold_no_connection(
+    test_db_connection_string, sa
+):
+    engine = sa.create_engine(
+        test_db_connection_string,
+        poolclass=sa.pool.QueuePool,
+        pool_size=2,
+        max_overflow=0,
+        pool_timeout=1,
+    )
+    datasets = []
+    for _ in range(3):
+        datasets.append(SqlAlchemyDataset("table_1", engine=engine))
+        datasets.append(
+            SqlAlchemyDataset(custom_sql="select * from table_1", engine=engine)
+        )
+    for dataset in datasets:
+        assert dataset.engine is engine
+        assert dataset.expect_column_values_to_not_be_null("col_1").success is True
+    assert engine.pool.checkedout() == 0
@@ -1,6 +1,11 @@
 import pandas as pd
 
-from great_expectations.datasource.util import hash_pandas_dataframe
+from great_expectations.datasource.util import (
+    fingerprint_file,
+    fingerprint_pandas_dataframe,
+    fingerprint_s3_object,
+    hash_pandas_dataframe,
+)
 
 
 def test_hash_pandas_dataframe_hashable_df():
@@ -15,3 +20,56 @@ def test_hash_pandas_dataframe_unhashable_df():
     df1 = pd.DataFrame(data)
     df2 = pd.DataFrame(data)
     assert hash_pandas_dataframe(df1) == hash_pandas_dataframe(df2)
+
+
+def test_fingerprint_pandas_dataframe_is_order_sensitive():
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    assert fingerprint_pandas_dataframe(df) == fingerprint_pandas_dataframe(df.copy())
+    assert fingerprint_pandas_dataframe(df) == fingerprint_pandas_dataframe(
+        df, chunk_size=2, max_workers=1
+    )
+    assert fingerprint_pandas_dataframe(df) != fingerprint_pandas_dataframe(
+        df[["b", "a"]]
+    )
+    assert fingerprint_pandas_dataframe(df) != fingerprint_pandas_dataframe(
+        df.iloc[::-1]
+    )
+    assert fingerprint_pandas_dataframe(df) != fingerprint_pandas_dataframe(
+        df.assign(a=[1, 2, 4])
+    )
+    assert fingerprint_pandas_dataframe(df) != fingerprint_pandas_dataframe(
+        df.assign(a=[1.0, 2.0, 3.0])
+    )
+
+
+def test_fingerprint_pandas_dataframe_unhashable_and_sampled_columns():
+    df = pd.DataFrame({"a": [{"val": i} for i in range(10)], "b": list("abcdefghij")})
+    assert fingerprint_pandas_dataframe(df) == fingerprint_pandas_dataframe(df.copy())
+
+    modified = df.copy()
+    modified.loc[1, "b"] = "z"
+    assert fingerprint_pandas_dataframe(df) != fingerprint_pandas_dataframe(modified)
+    # the sample of 2 rows only covers the first and last values
+    assert fingerprint_pandas_dataframe(
+        df, object_sample_size=2
+    ) == fingerprint_pandas_dataframe(modified, object_sample_size=2)
+
+
+def test_fingerprint_file(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,2\n")
+    fingerprint = fingerprint_file(str(path))
+    assert fingerprint == fingerprint_file(str(path))
+
+    path.write_text("a,b\n1,2\n3,4\n")
+    assert fingerprint_file(str(path)) != fingerprint
+    assert fingerprint_file(str(tmp_path / "missing.csv")) is None
+
+
+def test_fingerprint_s3_object():
+    s3_object = {"ETag": '"abc"', "ContentLength": 10, "Body": None}
+    assert fingerprint_s3_object(s3_object) == fingerprint_s3_object(dict(s3_object))
+    assert fingerprint_s3_object(s3_object) != fingerprint_s3_object(
+        {"ETag": '"abd"', "ContentLength": 10}
+    )
+    assert fingerprint_s3_object({}) is None
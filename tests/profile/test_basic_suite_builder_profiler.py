@@ -11,6 +11,7 @@ from great_expectations.core import ExpectationSuite
 from great_expectations.data_context.util import file_relative_path
 from great_expectations.datasource import PandasDatasource
 from great_expectations.exceptions import ProfilerError
+from great_expectations.profile.base import ProfilerCardinality, ProfilerDataType
 from great_expectations.profile.basic_suite_builder_profiler import (
     BasicSuiteBuilderProfiler,
 )
@@ -19,6 +20,44 @@ from tests.test_utils import expectationSuiteValidationResultSchema
 FALSEY_VALUES = [None, [], False]
 
 
+def test__build_column_cache(non_numeric_low_card_dataset, numeric_high_card_dataset):
+    datasets = [non_numeric_low_card_dataset, numeric_high_card_dataset]
+    expectations = [
+        dataset.get_expectation_suite(
+            discard_failed_expectations=False, suppress_warnings=True
+        ).expectations
+        for dataset in datasets
+    ]
+
+    column_cache = BasicSuiteBuilderProfiler._build_column_cache(
+        numeric_high_card_dataset, ["norm_0_1"]
+    )
+    assert column_cache == {
+        "norm_0_1": {
+            "type": ProfilerDataType.FLOAT,
+            "cardinality": ProfilerCardinality.UNIQUE,
+        }
+    }
+
+    column_cache = BasicSuiteBuilderProfiler._build_column_cache(
+        non_numeric_low_card_dataset, ["lowcardnonnum"]
+    )
+    assert column_cache == {
+        "lowcardnonnum": {
+            "type": ProfilerDataType.STRING,
+            "cardinality": ProfilerCardinality.TWO,
+        }
+    }
+
+    # introspection does not leave expectations behind
+    assert [
+        dataset.get_expectation_suite(
+            discard_failed_expectations=False, suppress_warnings=True
+        ).expectations
+        for dataset in datasets
+    ] == expectations
+
+
 def test__find_next_low_card_column(
     non_numeric_low_card_dataset, non_numeric_high_card_dataset
 ):
@@ -122,39 +161,19 @@ def test__create_expectations_for_numeric_column(
     expectation_suite = numeric_high_card_dataset.get_expectation_suite(
         suppress_warnings=True
     )
-    if test_backend in [
-        "PandasDataset",
-        "SparkDFDataset",
-        "postgresql",
-        "mysql",
-        "mssql",
-    ]:
-        assert {
-            expectation.expectation_type
-            for expectation in expectation_suite.expectations
-            if expectation.kwargs.get("column") == column
-        } == {
-            "expect_column_to_exist",
-            "expect_column_min_to_be_between",
-            "expect_column_max_to_be_between",
-            "expect_column_mean_to_be_between",
-            "expect_column_median_to_be_between",
-            "expect_column_quantile_values_to_be_between",
-            "expect_column_values_to_not_be_null",
-        }
-    else:
-        assert {
-            expectation.expectation_type
-            for expectation in expectation_suite.expectations
-            if expectation.kwargs.get("column") == column
-        } == {
-            "expect_column_to_exist",
-            "expect_column_min_to_be_between",
-            "expect_column_max_to_be_between",
-            "expect_column_mean_to_be_between",
-            "expect_column_median_to_be_between",
-            "expect_column_values_to_not_be_null",
-        }
+    assert {
+        expectation.expectation_type
+        for expectation in expectation_suite.expectations
+        if expectation.kwargs.get("column") == column
+    } == {
+        "expect_column_to_exist",
+        "expect_column_min_to_be_between",
+        "expect_column_max_to_be_between",
+        "expect_column_mean_to_be_between",
+        "expect_column_median_to_be_between",
+        "expect_column_quantile_values_to_be_between",
+        "expect_column_values_to_not_be_null",
+    }
 
 
 def test__find_next_string_column(
@@ -1327,3 +1346,48 @@ def test_snapshot_BasicSuiteBuilderProfiler_on_titanic_with_builder_configuratio
     del evrs.meta["validation_time"]
 
     assert evrs == expected_evrs
+
+
+def test_BasicSuiteBuilderProfiler_with_sample_fraction_uses_exact_counts_on_pandas():
+    df = ge.dataset.PandasDataset(
+        {
+            "naturals": list(range(1000)),
+            "nulls": [None if i % 5 == 0 else i for i in range(1000)],
+        }
+    )
+    observed_suite, evrs = BasicSuiteBuilderProfiler().profile(
+        df, profiler_configuration={"sample_fraction": 0.1, "sample_seed": 7}
+    )
+
+    assert (
+        observed_suite.meta["BasicSuiteBuilderProfiler"]["sample"]["sample_row_count"]
+        == 100
+    )
+    expectations = {
+        (expectation.expectation_type, expectation.kwargs.get("column"),): expectation
+        for expectation in observed_suite.expectations
+    }
+    assert expectations[("expect_table_row_count_to_be_between", None)].kwargs == {
+        "min_value": 900,
+        "max_value": 1100,
+    }
+    assert expectations[("expect_column_values_to_not_be_null", "naturals")].kwargs == {
+        "column": "naturals"
+    }
+    assert expectations[("expect_column_values_to_not_be_null", "nulls")].kwargs == {
+        "column": "nulls",
+        "mostly": 0.7,
+    }
+    assert (
+        "sample"
+        not in expectations[("expect_table_row_count_to_be_between", None)].meta[
+            "BasicSuiteBuilderProfiler"
+        ]
+    )
+    assert (
+        "sample"
+        in expectations[("expect_column_mean_to_be_between", "naturals")].meta[
+            "BasicSuiteBuilderProfiler"
+        ]
+    )
+    assert evrs.success
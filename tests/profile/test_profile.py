@@ -1,4 +1,6 @@
+import concurrent.futures
 import os
+import threading
 
 import pytest
 
@@ -232,6 +234,47 @@ def test_BasicDatasetProfiler_numeric_high_cardinality(numeric_high_card_dataset
     }
 
 
+def test_BasicDatasetProfiler_with_sample_fraction(numeric_high_card_dataset):
+    """
+    Unit test to check that BasicDatasetProfiler profiles a sample of the dataset when a
+    sample_fraction is configured, while table counts are still validated on the full dataset.
+    The test is executed against all the backends (Pandas, Spark, etc.), because it uses
+    the fixture.
+    """
+    row_count = numeric_high_card_dataset.get_row_count()
+    expectations_config, evr_config = BasicDatasetProfiler.profile(
+        numeric_high_card_dataset,
+        profiler_configuration={"sample_fraction": 0.5, "sample_seed": 42},
+    )
+
+    sample_meta = expectations_config.meta["BasicDatasetProfiler"]["sample"]
+    assert sample_meta["fraction"] == 0.5
+    assert sample_meta["row_count"] == row_count
+    assert 0 < sample_meta["sample_row_count"] < row_count
+    assert sample_meta["confidence_level"] == 0.95
+    assert 0 < sample_meta["quantile_rank_error"] < 1
+
+    for expectation in expectations_config.expectations:
+        if (
+            expectation.expectation_type
+            in DatasetProfiler.exact_count_expectation_types
+        ):
+            assert "sample" not in expectation.meta["BasicDatasetProfiler"]
+        else:
+            assert expectation.meta["BasicDatasetProfiler"]["sample"] == sample_meta
+
+    assert evr_config.statistics["evaluated_expectations"] == len(
+        expectations_config.expectations
+    )
+    row_count_results = [
+        result
+        for result in evr_config.results
+        if result.expectation_config.expectation_type
+        == "expect_table_row_count_to_be_between"
+    ]
+    assert row_count_results[0].result["observed_value"] == row_count
+
+
 def test_BasicDatasetProfiler_with_context(filesystem_csv_data_context):
     context = filesystem_csv_data_context
 
@@ -297,6 +340,108 @@ def test_context_profiler(filesystem_csv_data_context):
     assert len(profiled_expectations.expectations) == 8
 
 
+def test_context_profiler_with_max_workers(empty_data_context, tmp_path_factory):
+    """
+    Profiling a pandas datasource with max_workers profiles data assets in subprocesses
+    and returns the results in the same order as serial profiling
+    """
+    base_dir = str(tmp_path_factory.mktemp("parallel_profiling"))
+    for idx in range(5):
+        PandasDataset({"x": list(range(idx + 1))}).to_csv(
+            os.path.join(base_dir, "f%d.csv" % idx), index=None
+        )
+    context = empty_data_context
+    context.add_datasource(
+        "rad_datasource",
+        module_name="great_expectations.datasource",
+        class_name="PandasDatasource",
+        batch_kwargs_generators={
+            "subdir_reader": {
+                "class_name": "SubdirReaderBatchKwargsGenerator",
+                "base_directory": base_dir,
+            }
+        },
+    )
+
+    profiling_result = context.profile_datasource(
+        "rad_datasource", profiler=BasicDatasetProfiler, max_workers=2
+    )
+
+    assert profiling_result["success"] == True
+    assert [
+        suite.expectation_suite_name for suite, _ in profiling_result["results"]
+    ] == [
+        "rad_datasource.subdir_reader.f%d.BasicDatasetProfiler" % idx
+        for idx in range(5)
+    ]
+    assert [
+        validation_result.results[0].result["observed_value"]
+        for _, validation_result in profiling_result["results"]
+        if validation_result.results[0].expectation_config.expectation_type
+        == "expect_table_row_count_to_be_between"
+    ] == [1, 2, 3, 4, 5]
+    assert len(context.list_expectation_suites()) == 5
+    assert len(context.validations_store.list_keys()) == 5
+
+
+def test_context_profiler_with_max_workers_and_data_asset_timeout(
+    filesystem_csv_data_context, monkeypatch, caplog
+):
+    """
+    Data assets that time out are skipped, but keep their worker until they finish
+    and are then reported as completed late
+    """
+    context = filesystem_csv_data_context
+    release = threading.Event()
+    f3_started = threading.Event()
+    lock = threading.Lock()
+    running = set()
+    running_at_start = {}
+
+    def profile(data_asset_name, **kwargs):
+        with lock:
+            running_at_start[data_asset_name] = set(running)
+            running.add(data_asset_name)
+        if data_asset_name == "f3":
+            f3_started.set()
+        else:
+            release.wait()
+        with lock:
+            running.remove(data_asset_name)
+        return data_asset_name
+
+    monkeypatch.setattr(context, "_get_data_asset_profiling_result", profile)
+    profiling = context._profile_data_assets(
+        ["f1", "f2", "f3"],
+        max_workers=2,
+        data_asset_timeout=0,
+        executor_kind="thread",
+        datasource_name="rad_datasource",
+    )
+
+    # f1 and f2 cannot finish before they are released, so both time out
+    for expected_name in ["f1", "f2"]:
+        name, get_profiling_result = next(profiling)
+        assert name == expected_name
+        with pytest.raises(concurrent.futures.TimeoutError):
+            get_profiling_result()
+
+    # both workers are still busy with the data assets that timed out, so f3 waits for one of them to finish
+    next_result = []
+    waiting = threading.Thread(target=lambda: next_result.append(next(profiling)))
+    waiting.start()
+    assert "f3" not in running_at_start
+    release.set()
+    waiting.join()
+    assert next_result[0][0] == "f3"
+    f3_started.wait()
+    assert len(running_at_start["f3"]) < 2
+
+    list(profiling)
+    assert "Profiling 'f1' completed after timing out" in caplog.text
+    assert "Profiling 'f2' completed after timing out" in caplog.text
+
+
 def test_context_profiler_with_data_asset_name(filesystem_csv_data_context):
     """
     If a valid data asset name is passed to the profiling method